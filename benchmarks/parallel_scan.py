@@ -0,0 +1,67 @@
+"""
+SYSMIND Parallel /proc Scan Benchmark
+
+Compares sequential and threaded ProcessTable refreshes in PIDs per
+second. Each configuration uses a fresh table for a cold load and
+then refreshes it repeatedly (steady state).
+
+Usage:
+    python benchmarks/parallel_scan.py [--runs 10] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sysmind.modules.process.manager import ProcessTable  # noqa: E402
+
+
+def _median_refresh(table: ProcessTable, runs: int) -> float:
+    """Median seconds per refresh of an already loaded table."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        table.refresh()
+        timings.append(time.perf_counter() - start)
+    
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark parallel /proc scanning')
+    parser.add_argument('--runs', type=int, default=10, help='Refreshes per configuration')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Worker counts to compare')
+    args = parser.parse_args()
+    
+    auto = ProcessTable()
+    auto.refresh()
+    count = len(auto)
+    
+    print(f"processes:   {count}")
+    print(f"cpus:        {os.cpu_count()}")
+    print(f"auto-tuned:  {auto.scan_workers(count)} worker(s)")
+    print()
+    print(f"{'workers':>8}  {'refresh':>10}  {'PIDs/s':>10}  {'speedup':>8}")
+    
+    baseline = None
+    for workers in args.workers:
+        table = ProcessTable(workers=workers)
+        table.refresh()
+        median = _median_refresh(table, args.runs)
+        table.close()
+        
+        if baseline is None:
+            baseline = median
+        print(f"{workers:>8}  {median * 1000:>8.2f}ms  {count / median:>10.0f}  {baseline / median:>7.2f}x")
+    
+    auto.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
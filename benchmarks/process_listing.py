@@ -0,0 +1,56 @@
+"""
+SYSMIND Process Listing Benchmark
+
+Measures the cost of ProcessManager.list_processes() per PID, both
+cold (a new manager each time) and in steady state (one manager
+refreshing its process table).
+
+Usage:
+    python benchmarks/process_listing.py [--runs 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sysmind.modules.process.manager import ProcessManager  # noqa: E402
+
+
+def _median_listing(runs: int, make_manager) -> tuple:
+    """Return (median seconds, process count) over runs listings."""
+    timings = []
+    count = 0
+    for _ in range(runs):
+        manager = make_manager()
+        start = time.perf_counter()
+        count = len(manager.list_processes())
+        timings.append(time.perf_counter() - start)
+    
+    timings.sort()
+    return timings[len(timings) // 2], count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark process listing')
+    parser.add_argument('--runs', type=int, default=20, help='Number of listings')
+    args = parser.parse_args()
+    
+    shared = ProcessManager()
+    shared.list_processes()  # warm caches (pwd, host constants) and the table
+    
+    results = [
+        ('cold', _median_listing(args.runs, ProcessManager)),
+        ('steady', _median_listing(args.runs, lambda: shared)),
+    ]
+    
+    print(f"processes:        {results[0][1][1]}")
+    for label, (median, count) in results:
+        print(f"{label + ' (median):':<18}{median * 1000:.2f} ms  ({median / max(count, 1) * 1e6:.1f} us/PID)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+SYSMIND Startup Budget Check
+
+Measures CLI cold-start import cost with `python -X importtime` and
+fails if it exceeds the budget, or if importing the CLI pulls in any
+command or feature module (those must load only on dispatch).
+
+Usage:
+    python benchmarks/startup_time.py [--budget-ms 150] [--runs 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import List
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be imported just to build the parser
+LAZY_PREFIXES = ('sysmind.modules.', 'sysmind.commands.monitor_commands',
+                 'sysmind.commands.disk_commands', 'sysmind.commands.process_commands',
+                 'sysmind.commands.network_commands', 'sysmind.commands.intel_commands',
+                 'sysmind.commands.config_commands')
+
+
+def measure_import_us(module: str = 'sysmind.cli') -> int:
+    """Cumulative import time of a module in a fresh interpreter (microseconds)."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    for line in result.stderr.splitlines():
+        parts = [p.strip() for p in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError(f"{module} not found in importtime output")
+
+
+def eagerly_imported(module: str = 'sysmind.cli') -> List[str]:
+    """Modules matching LAZY_PREFIXES that importing the CLI loads anyway."""
+    code = (f'import sys, {module}; '
+            'print("\\n".join(m for m in sys.modules if m.startswith("sysmind")))')
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    return [m for m in result.stdout.split() if m.startswith(LAZY_PREFIXES)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Check SYSMIND CLI startup budget')
+    parser.add_argument('--budget-ms', type=float, default=150.0,
+                        help='Maximum median import time of sysmind.cli')
+    parser.add_argument('--runs', type=int, default=5, help='Number of measurements')
+    args = parser.parse_args()
+    
+    samples = sorted(measure_import_us() for _ in range(args.runs))
+    median_ms = samples[len(samples) // 2] / 1000
+    print(f"sysmind.cli import: median {median_ms:.1f} ms "
+          f"(min {samples[0] / 1000:.1f}, max {samples[-1] / 1000:.1f}, budget {args.budget_ms:.0f})")
+    
+    failed = False
+    
+    eager = eagerly_imported()
+    if eager:
+        print("Imported eagerly (should load on dispatch only):")
+        for name in eager:
+            print(f"  {name}")
+        failed = True
+    
+    if median_ms > args.budget_ms:
+        print("Startup budget exceeded")
+        failed = True
+    
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,24 +9,22 @@ disk analytics, network diagnostics, and intelligent recommendations.
 import argparse
 import sys
 import os
-from typing import Optional
+from typing import List, Optional, TYPE_CHECKING
 
 # Add package to path if running directly
 if __name__ == '__main__':
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sysmind.core.config import Config
-from sysmind.core.database import Database
-from sysmind.core.errors import SysmindError, ConfigurationError, DatabaseError
+from sysmind.core.errors import SysmindError, ConfigurationError, DatabaseError, DaemonError
 from sysmind.utils.logger import setup_logging, get_logger
 from sysmind.utils.formatters import Colors
 
-from sysmind.commands.monitor_commands import register_monitor_commands, handle_monitor_command
-from sysmind.commands.disk_commands import register_disk_commands, handle_disk_command
-from sysmind.commands.process_commands import register_process_commands, handle_process_command
-from sysmind.commands.network_commands import register_network_commands, handle_network_command
-from sysmind.commands.intel_commands import register_intel_commands, handle_intel_command
-from sysmind.commands.config_commands import register_config_commands, handle_config_command
+# Command modules are imported on dispatch, see commands/registry.py
+from sysmind.commands.registry import get_command, find_command_name, register_commands
+
+if TYPE_CHECKING:
+    from sysmind.core.database import Database
 
 
 __version__ = '1.0.0'
@@ -47,8 +45,13 @@ BANNER = f"""
 """
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the main argument parser."""
+def create_parser(argv: Optional[list] = None) -> argparse.ArgumentParser:
+    """
+    Create the main argument parser.
+    
+    Only the command named in argv gets its full subparser tree (which
+    imports its module); the rest are help-only stubs.
+    """
     
     parser = argparse.ArgumentParser(
         prog='sysmind',
@@ -82,6 +85,12 @@ def create_parser() -> argparse.ArgumentParser:
         help='Disable colored output'
     )
     
+    parser.add_argument(
+        '--no-daemon',
+        action='store_true',
+        help='Collect data directly even if the daemon is running'
+    )
+    
     parser.add_argument(
         '--config', '-c',
         type=str,
@@ -96,13 +105,10 @@ def create_parser() -> argparse.ArgumentParser:
         metavar='<command>'
     )
     
-    # Register all command modules
-    register_monitor_commands(subparsers)
-    register_disk_commands(subparsers)
-    register_process_commands(subparsers)
-    register_network_commands(subparsers)
-    register_intel_commands(subparsers)
-    register_config_commands(subparsers)
+    # Register command modules
+    if argv is None:
+        argv = sys.argv[1:]
+    register_commands(subparsers, active=find_command_name(argv))
     
     # Quick commands
     quick = subparsers.add_parser('quick', help='Quick system overview')
@@ -110,11 +116,15 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def show_quick_overview(database: Database) -> int:
-    """Show quick system overview."""
+def _print_quick_overview(
+    cpu_percent: float,
+    memory_percent: float,
+    score: int,
+    status: str,
+    issues: List[str]
+) -> None:
+    """Print the quick overview."""
     
-    from sysmind.modules.intelligence.health import HealthScorer
-    from sysmind.modules.monitor.realtime import RealtimeMonitor
     from sysmind.utils.formatters import Formatter
     
     formatter = Formatter()
@@ -123,26 +133,15 @@ def show_quick_overview(database: Database) -> int:
     print(f"  {Colors.CYAN}Quick System Overview{Colors.RESET}")
     print()
     
-    # Get snapshot
-    realtime = RealtimeMonitor()
-    snapshot = realtime.get_snapshot()
-    
-    cpu = snapshot.cpu_metrics
-    mem = snapshot.memory_metrics
-    
     # CPU
-    cpu_color = Colors.GREEN if cpu.usage_percent < 70 else Colors.YELLOW if cpu.usage_percent < 90 else Colors.RED
-    print(f"  CPU:    {formatter.progress_bar(cpu.usage_percent / 100, width=30)} {cpu_color}{cpu.usage_percent:5.1f}%{Colors.RESET}")
+    cpu_color = Colors.GREEN if cpu_percent < 70 else Colors.YELLOW if cpu_percent < 90 else Colors.RED
+    print(f"  CPU:    {formatter.progress_bar(cpu_percent / 100, width=30)} {cpu_color}{cpu_percent:5.1f}%{Colors.RESET}")
     
     # Memory
-    mem_color = Colors.GREEN if mem.usage_percent < 70 else Colors.YELLOW if mem.usage_percent < 90 else Colors.RED
-    print(f"  Memory: {formatter.progress_bar(mem.usage_percent / 100, width=30)} {mem_color}{mem.usage_percent:5.1f}%{Colors.RESET}")
+    mem_color = Colors.GREEN if memory_percent < 70 else Colors.YELLOW if memory_percent < 90 else Colors.RED
+    print(f"  Memory: {formatter.progress_bar(memory_percent / 100, width=30)} {mem_color}{memory_percent:5.1f}%{Colors.RESET}")
     
     # Health score
-    scorer = HealthScorer(database)
-    health = scorer.calculate_health()
-    
-    score = health.overall_score
     if score >= 70:
         health_color = Colors.GREEN
     elif score >= 50:
@@ -151,13 +150,9 @@ def show_quick_overview(database: Database) -> int:
         health_color = Colors.RED
     
     print()
-    print(f"  Health Score: {health_color}{score}/100{Colors.RESET} ({health.overall_status})")
+    print(f"  Health Score: {health_color}{score}/100{Colors.RESET} ({status})")
     
     # Quick issues
-    issues = []
-    for comp in health.components.values():
-        issues.extend(comp.issues)
-    
     if issues:
         print()
         print(f"  {Colors.YELLOW}Issues:{Colors.RESET}")
@@ -167,6 +162,48 @@ def show_quick_overview(database: Database) -> int:
     print()
     print(f"  Run '{Colors.CYAN}sysmind intel health{Colors.RESET}' for detailed analysis")
     print()
+
+
+def show_quick_overview(database: 'Database') -> int:
+    """Show quick system overview."""
+    
+    # A running daemon already has everything: one socket round trip
+    from sysmind.modules.daemon.client import DaemonClient
+    
+    client = DaemonClient.connect_if_running()
+    if client is not None:
+        try:
+            with client:
+                overview = client.call('overview')
+            _print_quick_overview(
+                overview['cpu_percent'], overview['memory_percent'],
+                overview['health_score'], overview['health_status'], overview['issues']
+            )
+            return 0
+        except DaemonError:
+            pass
+    
+    from sysmind.modules.monitor.cpu import get_cpu_sampler
+    
+    # Prime CPU sampling in the background while the analyzers load
+    get_cpu_sampler().warm_up()
+    
+    from sysmind.modules.intelligence.context import SystemContext
+    from sysmind.modules.intelligence.health import HealthScorer
+    
+    # System state is collected once and shared with the health scorer
+    context = SystemContext()
+    snapshot = context.snapshot()
+    health = HealthScorer(database, context=context).calculate_health()
+    
+    issues = []
+    for comp in health.components.values():
+        issues.extend(comp.issues)
+    
+    _print_quick_overview(
+        snapshot.cpu_metrics.usage_percent, snapshot.memory_metrics.usage_percent,
+        health.overall_score, health.overall_status, issues
+    )
     
     return 0
 
@@ -174,13 +211,20 @@ def show_quick_overview(database: Database) -> int:
 def main(argv: Optional[list] = None) -> int:
     """Main entry point."""
     
-    parser = create_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    parser = create_parser(argv)
     args = parser.parse_args(argv)
     
     # Handle no color
     if args.no_color or os.environ.get('NO_COLOR'):
         Colors.disable()
     
+    # Commands check this before asking a running daemon for data
+    if args.no_daemon:
+        os.environ['SYSMIND_NO_DAEMON'] = '1'
+    
     # Setup logging
     log_level = 'WARNING'
     if args.verbose == 1:
@@ -201,33 +245,28 @@ def main(argv: Optional[list] = None) -> int:
         print(f"{Colors.RED}Configuration error: {e}{Colors.RESET}", file=sys.stderr)
         return 1
     
-    # Initialize database
-    try:
-        database = Database(config.data_dir)
-    except DatabaseError as e:
-        print(f"{Colors.RED}Database error: {e}{Colors.RESET}", file=sys.stderr)
-        return 1
-    
     # No command - show help or banner
     if not args.command:
         print(BANNER)
         parser.print_help()
         return 0
     
+    # Initialize database, only for commands that use it. Opening is lazy
+    # as well: the file and schema are touched on the first query.
+    spec = get_command(args.command)
+    database = None
+    if spec is None or spec.needs_database:
+        from sysmind.core.database import Database
+        try:
+            database = Database(config.data_dir)
+        except DatabaseError as e:
+            print(f"{Colors.RED}Database error: {e}{Colors.RESET}", file=sys.stderr)
+            return 1
+    
     # Route to command handlers
     try:
-        if args.command == 'monitor':
-            return handle_monitor_command(args, database)
-        elif args.command == 'disk':
-            return handle_disk_command(args, database)
-        elif args.command == 'process':
-            return handle_process_command(args, database)
-        elif args.command == 'network':
-            return handle_network_command(args, database)
-        elif args.command == 'intel':
-            return handle_intel_command(args, database)
-        elif args.command == 'config':
-            return handle_config_command(args, database)
+        if spec is not None:
+            return spec.get_handler()(args, database)
         elif args.command == 'quick':
             return show_quick_overview(database)
         else:
@@ -250,6 +289,10 @@ def main(argv: Optional[list] = None) -> int:
             import traceback
             traceback.print_exc()
         return 1
+    
+    finally:
+        if database is not None:
+            database.close()
 
 
 def cli():
@@ -6,12 +6,14 @@ Command handlers for configuration management.
 
 import argparse
 import json
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from ..core.config import Config
 from ..utils.formatters import Formatter, Colors
 from ..utils.validators import validate_config_key
-from ..core.database import Database
+
+if TYPE_CHECKING:
+    from ..core.database import Database
 
 
 def register_config_commands(subparsers: argparse._SubParsersAction) -> None:
@@ -57,7 +59,7 @@ def register_config_commands(subparsers: argparse._SubParsersAction) -> None:
     import_cmd.add_argument('--merge', action='store_true', help='Merge with existing')
 
 
-def handle_config_command(args: argparse.Namespace, database: Database) -> int:
+def handle_config_command(args: argparse.Namespace, database: Optional['Database'] = None) -> int:
     """Handle config commands."""
     
     formatter = Formatter()
@@ -0,0 +1,175 @@
+"""
+SYSMIND Daemon CLI Commands
+
+Command handlers for the background collector daemon.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from ..core.config import Config
+from ..core.database import Database
+from ..core.errors import DaemonError
+from ..modules.daemon.client import DaemonClient, default_socket_path
+from ..utils.formatters import Formatter, Colors
+
+
+# Seconds to wait for a detached daemon to come up, or a stopped one to go away
+STARTUP_TIMEOUT = 10.0
+
+
+def register_daemon_commands(subparsers: argparse._SubParsersAction) -> None:
+    """Register daemon subcommands."""
+    
+    daemon = subparsers.add_parser(
+        'daemon',
+        help='Background collector daemon',
+        description='Run the collectors, watchdog and anomaly detection continuously '
+                    'and serve their results to other sysmind commands over a local socket'
+    )
+    daemon.add_argument('--socket', help='Socket path (default: daemon.sock in the data directory)')
+    
+    daemon_sub = daemon.add_subparsers(dest='daemon_command', help='Daemon commands')
+    
+    start = daemon_sub.add_parser('start', help='Start the daemon')
+    start.add_argument('--interval', type=float, default=2.0, help='Sampling interval in seconds')
+    start.add_argument('--detach', '-d', action='store_true', help='Run in the background')
+    
+    daemon_sub.add_parser('stop', help='Stop the daemon')
+    daemon_sub.add_parser('status', help='Show daemon status')
+
+
+def handle_daemon_command(args: argparse.Namespace, database: Database) -> int:
+    """Handle daemon commands."""
+    
+    formatter = Formatter()
+    cmd = getattr(args, 'daemon_command', None) or 'status'
+    
+    if cmd == 'start':
+        return _handle_start(args, formatter, database)
+    elif cmd == 'stop':
+        return _handle_stop(args, formatter)
+    elif cmd == 'status':
+        return _handle_status(args, formatter)
+    else:
+        print(f"{Colors.RED}Unknown daemon command: {cmd}{Colors.RESET}")
+        return 1
+
+
+def _ping(socket_path: Optional[str]) -> Optional[dict]:
+    """Daemon status, or None if no daemon answers."""
+    try:
+        with DaemonClient(socket_path, timeout=2.0) as client:
+            return client.call('ping')
+    except DaemonError:
+        return None
+
+
+def _handle_start(args: argparse.Namespace, formatter: Formatter, database: Database) -> int:
+    """Start the daemon in the foreground, or detached."""
+    
+    status = _ping(args.socket)
+    if status:
+        print(f"{Colors.YELLOW}Daemon already running (pid {status['pid']}).{Colors.RESET}")
+        return 0
+    
+    config = Config()
+    
+    if args.detach:
+        command = [sys.executable, '-m', 'sysmind.cli', 'daemon']
+        if args.socket:
+            command += ['--socket', args.socket]
+        command += ['start', '--interval', str(args.interval)]
+        
+        log_path = config.log_dir / 'daemon.log'
+        with open(log_path, 'ab') as log:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=True
+            )
+        
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                print(f"{Colors.RED}Daemon exited during startup; see {log_path}{Colors.RESET}")
+                return 1
+            status = _ping(args.socket)
+            if status:
+                print(f"{Colors.GREEN}Daemon started{Colors.RESET} (pid {status['pid']})")
+                print(f"  Socket: {status['socket']}")
+                print(f"  Log:    {log_path}")
+                return 0
+            time.sleep(0.1)
+        
+        print(f"{Colors.RED}Daemon did not answer within {STARTUP_TIMEOUT:.0f}s; see {log_path}{Colors.RESET}")
+        return 1
+    
+    from ..modules.daemon.service import SysmindDaemon
+    
+    daemon = SysmindDaemon(
+        database,
+        socket_path=args.socket,
+        interval=args.interval,
+        process_interval=config.process.refresh_interval_seconds,
+        snapshot_interval=config.monitor.snapshot_interval_seconds,
+        watchdog_interval=config.process.watchdog_check_interval_seconds,
+        retention_days=config.monitor.history_retention_days
+    )
+    
+    print(f"{Colors.CYAN}SYSMIND daemon listening on {daemon.socket_path}{Colors.RESET}")
+    print("Press Ctrl+C to stop.")
+    daemon.run()
+    print(f"{Colors.GREEN}Daemon stopped.{Colors.RESET}")
+    
+    return 0
+
+
+def _handle_stop(args: argparse.Namespace, formatter: Formatter) -> int:
+    """Ask the running daemon to shut down."""
+    
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+    try:
+        with DaemonClient(socket_path) as client:
+            client.call('stop')
+    except DaemonError:
+        print(f"{Colors.YELLOW}Daemon is not running.{Colors.RESET}")
+        return 0
+    
+    # The daemon removes its socket once it has shut down
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if not socket_path.exists():
+            break
+        time.sleep(0.1)
+    
+    print(f"{Colors.GREEN}Daemon stopped.{Colors.RESET}")
+    return 0
+
+
+def _handle_status(args: argparse.Namespace, formatter: Formatter) -> int:
+    """Show whether the daemon is running and what it has collected."""
+    
+    status = _ping(args.socket)
+    if not status:
+        print(f"{Colors.YELLOW}Daemon is not running.{Colors.RESET} Start it with 'sysmind daemon start --detach'.")
+        return 1
+    
+    print()
+    print(formatter.box("SYSMIND Daemon", width=60))
+    print()
+    print(f"  Status:    {Colors.GREEN}running{Colors.RESET} (pid {status['pid']})")
+    print(f"  Uptime:    {formatter.duration(status['uptime'])}")
+    print(f"  Socket:    {status['socket']}")
+    print(f"  Interval:  {status['interval']:g}s ({status['samples']} samples in memory)")
+    print(f"  Processes: {status['processes']}")
+    print(f"  Watchdog:  {status['watchdog_rules']} rules ({status['watchdog_mode'] or 'stopped'})")
+    print()
+    
+    return 0
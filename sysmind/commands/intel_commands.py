@@ -5,14 +5,24 @@ Command handlers for system intelligence features.
 """
 
 import argparse
-from typing import Optional
+import time
+from datetime import datetime
+from typing import Dict, Optional
 
 from ..modules.intelligence.correlator import MetricCorrelator
-from ..modules.intelligence.anomaly import AnomalyDetector
+from ..modules.intelligence.anomaly import Anomaly, AnomalyDetector, AnomalyStats
 from ..modules.intelligence.recommender import SystemRecommender
-from ..modules.intelligence.health import HealthScorer
+from ..modules.intelligence.health import HealthComponent, HealthScorer, SystemHealth
+from ..modules.intelligence.context import SystemContext
+from ..modules.monitor.cpu import get_cpu_sampler
+from ..modules.daemon.client import DaemonClient
 from ..utils.formatters import Formatter, Colors
 from ..core.database import Database
+from ..core.errors import DaemonError
+
+
+# Anomalies fetched per poll while following the daemon's detector
+DAEMON_ANOMALY_LIMIT = 50
 
 
 def register_intel_commands(subparsers: argparse._SubParsersAction) -> None:
@@ -59,6 +69,9 @@ def register_intel_commands(subparsers: argparse._SubParsersAction) -> None:
 def handle_intel_command(args: argparse.Namespace, database: Database) -> int:
     """Handle intelligence commands."""
     
+    # Prime CPU sampling in the background while the analyzers load
+    get_cpu_sampler().warm_up()
+    
     formatter = Formatter()
     
     if not hasattr(args, 'intel_command') or not args.intel_command:
@@ -83,20 +96,37 @@ def handle_intel_command(args: argparse.Namespace, database: Database) -> int:
         return 1
 
 
+def _daemon_health() -> Optional[SystemHealth]:
+    """Latest health score from the daemon, or None if no daemon is running."""
+    client = DaemonClient.connect_if_running()
+    if client is None:
+        return None
+    try:
+        with client:
+            data = client.call('health')
+    except DaemonError:
+        return None
+    
+    data['timestamp'] = datetime.fromisoformat(data['timestamp'])
+    data['components'] = {name: HealthComponent(**component)
+                          for name, component in data['components'].items()}
+    return SystemHealth(**data)
+
+
 def _handle_health(args: argparse.Namespace, formatter: Formatter, database: Database) -> int:
     """Show system health."""
     
-    scorer = HealthScorer(database)
-    
     detailed = getattr(args, 'detailed', False)
     report = getattr(args, 'report', False)
     
     if report:
-        report_text = scorer.export_health_report()
+        report_text = HealthScorer(database).export_health_report()
         print(report_text)
         return 0
     
-    health = scorer.calculate_health()
+    health = _daemon_health()
+    if health is None:
+        health = HealthScorer(database).calculate_health()
     
     print()
     
@@ -162,8 +192,9 @@ def _handle_analyze(args: argparse.Namespace, formatter: Formatter, database: Da
     
     duration = getattr(args, 'duration', 30)
     
-    correlator = MetricCorrelator(database)
-    anomaly = AnomalyDetector(database)
+    context = SystemContext()
+    correlator = MetricCorrelator(database, context=context)
+    anomaly = AnomalyDetector(database, context=context)
     
     print()
     print(formatter.box("System Analysis", width=60))
@@ -265,14 +296,59 @@ def _handle_recommend(args: argparse.Namespace, formatter: Formatter, database:
     return 0
 
 
-def _handle_anomaly(args: argparse.Namespace, formatter: Formatter, database: Database) -> int:
-    """Detect anomalies."""
+def _print_anomaly(anomaly: Anomaly) -> None:
+    """Print one detected anomaly."""
+    severity_color = Colors.RED if anomaly.severity == 'critical' else Colors.YELLOW
+    print(f"  {severity_color}ANOMALY{Colors.RESET} [{anomaly.timestamp.strftime('%H:%M:%S')}] {anomaly.description}")
+
+
+def _print_anomaly_summary(summary: Dict, stats: Dict[str, AnomalyStats]) -> None:
+    """Print the detection summary and per-metric statistics."""
+    print(f"  {Colors.CYAN}Detection Summary:{Colors.RESET}")
+    print(f"    Anomalies detected: {summary['total_anomalies_1h']}")
+    print(f"    By severity: Critical={summary['by_severity']['critical']}, "
+          f"Warning={summary['by_severity']['warning']}, "
+          f"Info={summary['by_severity']['info']}")
+    print(f"    Samples collected: {summary['samples_collected']}")
+    print()
     
-    duration = getattr(args, 'duration', 60)
-    sensitivity = getattr(args, 'sensitivity', 2.0)
+    if stats:
+        print(f"  {Colors.CYAN}Current Statistics:{Colors.RESET}")
+        for metric, stat in stats.items():
+            print(f"    {metric}: mean={stat.mean:.1f}, std={stat.std:.1f}, "
+                  f"range=[{stat.threshold_low:.1f}, {stat.threshold_high:.1f}]")
+        print()
+
+
+def _follow_daemon_anomalies(client: DaemonClient, duration: int) -> None:
+    """
+    Print the daemon's anomalies as they are detected, for duration seconds.
+    
+    The daemon has been sampling all along, so its baseline is already
+    learned when this starts.
+    """
+    last_seen = datetime.now()
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        rows = client.call('anomalies', limit=DAEMON_ANOMALY_LIMIT)
+        for row in reversed(rows):
+            row['timestamp'] = datetime.fromisoformat(row['timestamp'])
+            row['expected_range'] = tuple(row['expected_range'])
+            if row['timestamp'] > last_seen:
+                _print_anomaly(Anomaly(**row))
+                last_seen = row['timestamp']
+        time.sleep(min(1.0, max(0.0, deadline - time.monotonic())))
     
-    detector = AnomalyDetector(database, sensitivity=sensitivity)
+    print()
     
+    status = client.call('anomaly_summary')
+    _print_anomaly_summary(status['summary'], {
+        metric: AnomalyStats(**stat) for metric, stat in status['stats'].items()
+    })
+
+
+def _print_anomaly_header(formatter: Formatter, sensitivity: float, duration: int) -> None:
+    """Print the anomaly monitoring banner."""
     print()
     print(formatter.box("Anomaly Detection", width=60))
     print()
@@ -281,39 +357,43 @@ def _handle_anomaly(args: argparse.Namespace, formatter: Formatter, database: Da
     print()
     print(f"  {Colors.YELLOW}Monitoring...{Colors.RESET}")
     print()
+
+
+def _handle_anomaly(args: argparse.Namespace, formatter: Formatter, database: Database) -> int:
+    """Detect anomalies."""
+    
+    duration = getattr(args, 'duration', 60)
+    sensitivity = getattr(args, 'sensitivity', 2.0)
+    
+    # A running daemon's detector answers if it uses the same sensitivity
+    client = DaemonClient.connect_if_running()
+    if client is not None:
+        try:
+            with client:
+                if client.call('anomaly_summary')['sensitivity'] == sensitivity:
+                    _print_anomaly_header(formatter, sensitivity, duration)
+                    try:
+                        _follow_daemon_anomalies(client, duration)
+                    except KeyboardInterrupt:
+                        print(f"\n  {Colors.YELLOW}Monitoring stopped.{Colors.RESET}")
+                    return 0
+        except DaemonError:
+            pass
     
-    def on_anomaly(a):
-        severity_color = Colors.RED if a.severity == 'critical' else Colors.YELLOW
-        print(f"  {severity_color}ANOMALY{Colors.RESET} [{a.timestamp.strftime('%H:%M:%S')}] {a.description}")
+    detector = AnomalyDetector(database, sensitivity=sensitivity)
+    
+    _print_anomaly_header(formatter, sensitivity, duration)
     
     try:
-        anomalies = detector.continuous_monitoring(
+        detector.continuous_monitoring(
             duration=duration,
             interval=1.0,
-            callback=on_anomaly
+            callback=_print_anomaly
         )
         
         print()
         
-        # Summary
-        summary = detector.get_anomaly_summary()
-        
-        print(f"  {Colors.CYAN}Detection Summary:{Colors.RESET}")
-        print(f"    Anomalies detected: {summary['total_anomalies_1h']}")
-        print(f"    By severity: Critical={summary['by_severity']['critical']}, "
-              f"Warning={summary['by_severity']['warning']}, "
-              f"Info={summary['by_severity']['info']}")
-        print(f"    Samples collected: {summary['samples_collected']}")
-        print()
-        
-        # Statistics
-        stats = detector.get_stats()
-        if stats:
-            print(f"  {Colors.CYAN}Current Statistics:{Colors.RESET}")
-            for metric, stat in stats.items():
-                print(f"    {metric}: mean={stat.mean:.1f}, std={stat.std:.1f}, "
-                      f"range=[{stat.threshold_low:.1f}, {stat.threshold_high:.1f}]")
-            print()
+        _print_anomaly_summary(detector.get_anomaly_summary(), detector.get_stats())
     
     except KeyboardInterrupt:
         print(f"\n  {Colors.YELLOW}Monitoring stopped.{Colors.RESET}")
@@ -390,10 +470,13 @@ def _handle_correlate(args: argparse.Namespace, formatter: Formatter, database:
 def _handle_summary(args: argparse.Namespace, formatter: Formatter, database: Database) -> int:
     """Quick system summary."""
     
-    scorer = HealthScorer(database)
-    recommender = SystemRecommender(database)
+    context = SystemContext()
+    scorer = HealthScorer(database, context=context)
+    recommender = SystemRecommender(database, context=context)
     
-    health = scorer.calculate_health()
+    health = _daemon_health()
+    if health is None:
+        health = scorer.calculate_health()
     
     print()
     
@@ -10,10 +10,12 @@ from typing import Optional
 
 from ..modules.monitor.cpu import CPUMonitor
 from ..modules.monitor.memory import MemoryMonitor
-from ..modules.monitor.realtime import RealtimeMonitor
+from ..modules.monitor.realtime import RealtimeMonitor, SystemSnapshot
+from ..modules.daemon.client import DaemonClient
 from ..modules.monitor.baseline import BaselineManager
 from ..utils.formatters import Formatter, Colors
 from ..core.database import Database
+from ..core.errors import DaemonError
 
 
 def register_monitor_commands(subparsers: argparse._SubParsersAction) -> None:
@@ -93,11 +95,22 @@ def handle_monitor_command(args: argparse.Namespace, database: Database) -> int:
     return 0
 
 
+def _daemon_snapshot() -> Optional[SystemSnapshot]:
+    """Latest snapshot from a running daemon, or None."""
+    client = DaemonClient.connect_if_running()
+    if client is None:
+        return None
+    try:
+        with client:
+            return SystemSnapshot.from_dict(client.call('snapshot'))
+    except DaemonError:
+        return None
+
+
 def _handle_status(args: argparse.Namespace, formatter: Formatter, database: Database) -> int:
     """Show current system status."""
     
-    realtime = RealtimeMonitor()
-    snapshot = realtime.get_snapshot()
+    snapshot = _daemon_snapshot() or RealtimeMonitor().get_snapshot()
     
     cpu = snapshot.cpu_metrics
     mem = snapshot.memory_metrics
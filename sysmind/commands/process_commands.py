@@ -5,15 +5,19 @@ Command handlers for process management.
 """
 
 import argparse
-import signal
-from typing import Optional
+import json
+from datetime import datetime
+from typing import List, Optional
 
-from ..modules.process.manager import ProcessManager
+from ..modules.process.manager import ProcessManager, ProcessInfo, DEFAULT_CPU_WINDOW
 from ..modules.process.profiler import ProcessProfiler
-from ..modules.process.watchdog import ProcessWatchdog
+from ..modules.process.watchdog import ProcessWatchdog, WatchdogAlert
 from ..modules.process.startup import StartupManager
+from ..modules.daemon.client import DaemonClient
 from ..utils.formatters import Formatter, Colors
+from ..utils.platform_utils import is_linux, get_username
 from ..core.database import Database
+from ..core.errors import DaemonError
 
 
 def register_process_commands(subparsers: argparse._SubParsersAction) -> None:
@@ -34,6 +38,8 @@ def register_process_commands(subparsers: argparse._SubParsersAction) -> None:
     list_cmd.add_argument('--limit', type=int, default=20, help='Maximum processes to show')
     list_cmd.add_argument('--filter', type=str, help='Filter by process name')
     list_cmd.add_argument('--json', action='store_true', help='Output as JSON')
+    list_cmd.add_argument('--sample', type=float, default=DEFAULT_CPU_WINDOW,
+                         help='CPU sampling window in seconds')
     
     # Top command
     top = process_sub.add_parser('top', help='Show top processes')
@@ -41,11 +47,14 @@ def register_process_commands(subparsers: argparse._SubParsersAction) -> None:
     top.add_argument('-n', type=int, default=10, help='Number of processes')
     top.add_argument('--watch', action='store_true', help='Continuously update')
     top.add_argument('--interval', type=float, default=2.0, help='Update interval')
+    top.add_argument('--sample', type=float, default=DEFAULT_CPU_WINDOW,
+                     help='CPU sampling window in seconds')
     
     # Profile command
     profile = process_sub.add_parser('profile', help='Profile a process')
     profile.add_argument('pid', type=int, help='Process ID to profile')
     profile.add_argument('--duration', type=int, default=10, help='Profile duration in seconds')
+    profile.add_argument('--interval', type=float, default=0.05, help='Sampling interval in seconds')
     profile.add_argument('--detailed', action='store_true', help='Include detailed metrics')
     
     # Kill command
@@ -57,6 +66,8 @@ def register_process_commands(subparsers: argparse._SubParsersAction) -> None:
     # Tree command
     tree = process_sub.add_parser('tree', help='Show process tree')
     tree.add_argument('--pid', type=int, help='Root PID (default: show all)')
+    tree.add_argument('--depth', type=int, help='Maximum depth to show')
+    tree.add_argument('--json', action='store_true', help='Output as JSON')
     
     # Watchdog commands
     watchdog = process_sub.add_parser('watchdog', help='Process monitoring watchdog')
@@ -124,16 +135,39 @@ def handle_process_command(args: argparse.Namespace, database: Database) -> int:
         return 1
 
 
+def _daemon_processes(sort_by: str, limit: int) -> Optional[List[ProcessInfo]]:
+    """Processes from the daemon's last refresh, or None if no daemon is running."""
+    client = DaemonClient.connect_if_running()
+    if client is None:
+        return None
+    try:
+        with client:
+            rows = client.call('processes', sort=sort_by, limit=limit)
+    except DaemonError:
+        return None
+    
+    processes = []
+    for row in rows:
+        row['create_time'] = datetime.fromisoformat(row['create_time'])
+        proc = ProcessInfo(**row)
+        # The daemon skips username lookups
+        if not proc.username and proc.uid is not None:
+            proc.username = get_username(proc.uid)
+        processes.append(proc)
+    return processes
+
+
 def _handle_list(args: argparse.Namespace, formatter: Formatter, database: Database) -> int:
     """List running processes."""
     
-    manager = ProcessManager()
-    
     sort_by = getattr(args, 'sort', 'memory')
     limit = getattr(args, 'limit', 20)
     filter_name = getattr(args, 'filter', None)
     
-    processes = manager.list_processes(sort_by=sort_by, limit=limit)
+    processes = _daemon_processes(sort_by, limit)
+    if processes is None:
+        manager = ProcessManager(cpu_window=getattr(args, 'sample', DEFAULT_CPU_WINDOW))
+        processes = manager.list_processes(sort_by=sort_by, limit=limit)
     
     if filter_name:
         filter_lower = filter_name.lower()
@@ -169,15 +203,21 @@ def _handle_top(args: argparse.Namespace, formatter: Formatter, database: Databa
     
     import time
     
-    manager = ProcessManager()
-    
     by = getattr(args, 'by', 'cpu')
     n = getattr(args, 'n', 10)
     watch = getattr(args, 'watch', False)
     interval = getattr(args, 'interval', 2.0)
     
+    # Without a daemon, watch refreshes reuse the manager, so only the first frame waits
+    manager: Optional[ProcessManager] = None
+    
     def show_top():
-        processes = manager.get_top_processes(by=by, n=n)
+        nonlocal manager
+        processes = _daemon_processes(by, n)
+        if processes is None:
+            if manager is None:
+                manager = ProcessManager(cpu_window=getattr(args, 'sample', DEFAULT_CPU_WINDOW))
+            processes = manager.get_top_processes(by=by, n=n)
         
         # Clear screen
         print('\033[2J\033[H', end='')
@@ -191,16 +231,16 @@ def _handle_top(args: argparse.Namespace, formatter: Formatter, database: Databa
         rows = []
         
         for proc in processes:
-            cpu_color = ''
+            cpu_cell = f"{proc.cpu_percent:.1f}"
             if proc.cpu_percent > 80:
-                cpu_color = Colors.RED
+                cpu_cell = f"{Colors.RED}{cpu_cell}{Colors.RESET}"
             elif proc.cpu_percent > 50:
-                cpu_color = Colors.YELLOW
+                cpu_cell = f"{Colors.YELLOW}{cpu_cell}{Colors.RESET}"
             
             rows.append([
                 str(proc.pid),
                 proc.name[:25],
-                f"{cpu_color}{proc.cpu_percent:.1f}{Colors.RESET}",
+                cpu_cell,
                 formatter.file_size(proc.memory_rss),
                 proc.status
             ])
@@ -227,6 +267,7 @@ def _handle_profile(args: argparse.Namespace, formatter: Formatter, database: Da
     
     pid = args.pid
     duration = getattr(args, 'duration', 10)
+    interval = getattr(args, 'interval', 0.05)
     detailed = getattr(args, 'detailed', False)
     
     profiler = ProcessProfiler()
@@ -238,25 +279,36 @@ def _handle_profile(args: argparse.Namespace, formatter: Formatter, database: Da
     print(f"  {Colors.YELLOW}Profiling for {duration} seconds...{Colors.RESET}")
     
     try:
-        profile = profiler.profile_process(pid, duration=duration)
-        
-        if not profile:
+        info = profiler.manager.get_process(pid)
+        if not info:
             print(f"\n  {Colors.RED}Could not profile process {pid} - may not exist{Colors.RESET}")
             return 1
         
+        # Take the first thread sample now so hot threads cover the whole run
+        profiler.get_thread_usage(pid)
+        
+        if is_linux():
+            summary = profiler.sample_process(pid, duration=duration, interval=interval).summary()
+        else:
+            samples = profiler.monitor_process(pid, duration=duration, interval=max(interval, 1.0))
+            cpu_values = [sample['cpu_percent'] for sample in samples] or [0.0]
+            summary = {'cpu_average': sum(cpu_values) / len(cpu_values), 'cpu_max': max(cpu_values)}
+        
+        profile = profiler.profile_process(pid)
+        
         print(f"\r{Colors.GREEN}Profile complete!{Colors.RESET}                    ")
         print()
         
         print(f"  {Colors.CYAN}Process Info{Colors.RESET}")
         print(f"    Name: {profile.name}")
         print(f"    PID: {profile.pid}")
-        print(f"    Status: {profile.status}")
-        print(f"    User: {profile.username or 'unknown'}")
+        print(f"    Status: {info.status}")
+        print(f"    User: {info.username or 'unknown'}")
         print()
         
         print(f"  {Colors.CYAN}Resource Usage{Colors.RESET}")
-        print(f"    CPU Average: {profile.cpu_average:.1f}%")
-        print(f"    CPU Max: {profile.cpu_max:.1f}%")
+        print(f"    CPU Average: {summary['cpu_average']:.1f}%")
+        print(f"    CPU Max: {summary['cpu_max']:.1f}%")
         print(f"    Memory RSS: {formatter.file_size(profile.memory_rss)}")
         print(f"    Memory VMS: {formatter.file_size(profile.memory_vms)}")
         print()
@@ -270,7 +322,9 @@ def _handle_profile(args: argparse.Namespace, formatter: Formatter, database: Da
             print()
             
             print(f"  {Colors.CYAN}Thread Info{Colors.RESET}")
-            print(f"    Thread Count: {profile.thread_count}")
+            print(f"    Thread Count: {profile.threads}")
+            for thread in profile.hot_threads:
+                print(f"    {thread.tid:>8}  {thread.name[:20]:<20} {thread.cpu_percent:5.1f}%  {thread.status}")
             print()
             
             if profile.open_files:
@@ -318,17 +372,19 @@ def _handle_kill(args: argparse.Namespace, formatter: Formatter, database: Datab
     
     print(f"Killing process: {proc.name} (PID: {pid})")
     
+    children = []
     if tree:
-        # Get child processes
-        children = manager.get_process_tree(pid)
+        # Collect descendants now; once the parent dies they get reparented
+        roots = manager.build_process_tree(root_pid=pid)
+        if roots:
+            children = [node.process for node in roots[0].walk()][1:]
         if children:
             print(f"  Will also kill {len(children)} child processes")
     
-    sig = signal.SIGKILL if force else signal.SIGTERM
     sig_name = 'SIGKILL' if force else 'SIGTERM'
     
     try:
-        success = manager.kill_process(pid, sig)
+        success = manager.kill_process(pid, force)
         
         if success:
             print(f"{Colors.GREEN}Sent {sig_name} to process {pid}{Colors.RESET}")
@@ -336,11 +392,9 @@ def _handle_kill(args: argparse.Namespace, formatter: Formatter, database: Datab
             print(f"{Colors.RED}Failed to kill process {pid}{Colors.RESET}")
             return 1
         
-        if tree:
-            children = manager.get_process_tree(pid)
-            for child in children:
-                manager.kill_process(child.pid, sig)
-                print(f"  Killed child: {child.name} ({child.pid})")
+        for child in children:
+            manager.kill_process(child.pid, force)
+            print(f"  Killed child: {child.name} ({child.pid})")
     
     except PermissionError:
         print(f"{Colors.RED}Permission denied - try running as administrator{Colors.RESET}")
@@ -355,40 +409,40 @@ def _handle_kill(args: argparse.Namespace, formatter: Formatter, database: Datab
 def _handle_tree(args: argparse.Namespace, formatter: Formatter, database: Database) -> int:
     """Show process tree."""
     
-    manager = ProcessManager()
+    manager = ProcessManager(cpu_window=DEFAULT_CPU_WINDOW)
     root_pid = getattr(args, 'pid', None)
+    max_depth = getattr(args, 'depth', None)
+    
+    # One listing for the whole tree
+    trees = manager.build_process_tree(root_pid=root_pid, max_depth=max_depth)
+    
+    if root_pid is not None and not trees:
+        print(f"{Colors.RED}Process {root_pid} not found{Colors.RESET}")
+        return 1
+    
+    if getattr(args, 'json', False):
+        print(json.dumps([tree.to_dict() for tree in trees], indent=2))
+        return 0
     
     print()
     print(formatter.box("Process Tree", width=70))
     print()
     
-    def print_tree(pid: int, indent: int = 0):
-        processes = manager.list_processes()
-        proc = next((p for p in processes if p.pid == pid), None)
-        
-        if not proc:
-            return
-        
-        prefix = "  " * indent + ("├── " if indent > 0 else "")
-        print(f"{prefix}{proc.name} ({proc.pid})")
-        
-        # Find children
-        children = [p for p in processes if p.parent_pid == pid]
-        for child in children:
-            print_tree(child.pid, indent + 1)
-    
-    if root_pid:
-        print_tree(root_pid)
-    else:
-        # Show tree starting from init/system processes
-        processes = manager.list_processes()
-        
-        # Find root processes (parent_pid = 0 or 1)
-        roots = [p for p in processes if p.parent_pid in (0, 1) or p.pid == 1]
-        
-        for root in roots[:10]:  # Limit to avoid huge output
-            print_tree(root.pid)
-            print()
+    for tree in trees:
+        for node in tree.walk():
+            proc = node.process
+            prefix = "  " * node.depth + ("├── " if node.depth > 0 else "")
+            line = f"{prefix}{proc.name} ({proc.pid})"
+            
+            if node.descendant_count:
+                line += (
+                    f"  {Colors.DIM}[{node.descendant_count + 1} procs, "
+                    f"{formatter.file_size(node.total_rss)}, "
+                    f"{node.total_threads} threads, "
+                    f"{node.total_cpu:.1f}% CPU]{Colors.RESET}"
+                )
+            print(line)
+        print()
     
     return 0
 
@@ -470,10 +524,13 @@ def _handle_watchdog(args: argparse.Namespace, formatter: Formatter, database: D
         print()
         
         def on_alert(alert):
-            print(f"  {Colors.YELLOW}ALERT{Colors.RESET} [{alert.timestamp.strftime('%H:%M:%S')}]: {alert.message}")
+            label = f"{Colors.GREEN}RESOLVED{Colors.RESET}" if alert.state == 'resolved' else f"{Colors.YELLOW}ALERT{Colors.RESET}"
+            print(f"  {label} [{alert.timestamp.strftime('%H:%M:%S')}]: {alert.message}")
         
         try:
             watchdog.start(interval=interval, callback=on_alert)
+            if watchdog.event_mode:
+                print(f"{Colors.DIM}Tracking process starts and exits ({watchdog.event_mode}){Colors.RESET}")
             
             # Keep running until interrupted
             import time
@@ -485,7 +542,9 @@ def _handle_watchdog(args: argparse.Namespace, formatter: Formatter, database: D
     
     elif wcmd == 'alerts':
         limit = getattr(args, 'limit', 20)
-        alerts = watchdog.get_alerts(limit=limit)
+        alerts = _daemon_alerts(limit)
+        if alerts is None:
+            alerts = watchdog.get_alerts(limit=limit)
         
         if not alerts:
             print(f"{Colors.GREEN}No recent alerts.{Colors.RESET}")
@@ -504,6 +563,26 @@ def _handle_watchdog(args: argparse.Namespace, formatter: Formatter, database: D
     return 0
 
 
+def _daemon_alerts(limit: int) -> Optional[List[WatchdogAlert]]:
+    """Recent alerts from the daemon's watchdog, or None if no daemon is running."""
+    client = DaemonClient.connect_if_running()
+    if client is None:
+        return None
+    try:
+        with client:
+            rows = client.call('alerts', limit=limit)
+    except DaemonError:
+        return None
+    
+    alerts = []
+    for row in rows:
+        row.pop('pid', None)
+        row.pop('process_name', None)
+        row['timestamp'] = datetime.fromisoformat(row['timestamp'])
+        alerts.append(WatchdogAlert(process=None, **row))
+    return alerts
+
+
 def _handle_startup(args: argparse.Namespace, formatter: Formatter, database: Database) -> int:
     """Handle startup commands."""
     
@@ -0,0 +1,116 @@
+"""
+SYSMIND Command Registry
+
+Lightweight metadata for the top-level CLI commands.
+The parser is built from this table so that only the module of the
+command actually being run is imported; every other command is
+registered as a stub carrying just its help text.
+"""
+
+import argparse
+import importlib
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Callable, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """A top-level command and where its implementation lives."""
+    name: str
+    help: str
+    module: str  # dotted path of the command module
+    register: str  # function adding the full subparser tree
+    handler: str  # function handling parsed arguments
+    needs_database: bool = True  # False: handler is called with database=None
+    
+    def load(self) -> ModuleType:
+        """Import the command module."""
+        return importlib.import_module(self.module)
+    
+    def get_register(self) -> Callable:
+        """Get the register function (imports the module)."""
+        return getattr(self.load(), self.register)
+    
+    def get_handler(self) -> Callable:
+        """Get the handler function (imports the module)."""
+        return getattr(self.load(), self.handler)
+
+
+COMMANDS: Sequence[CommandSpec] = (
+    CommandSpec('monitor', 'System resource monitoring',
+                'sysmind.commands.monitor_commands',
+                'register_monitor_commands', 'handle_monitor_command'),
+    CommandSpec('disk', 'Disk space analysis and management',
+                'sysmind.commands.disk_commands',
+                'register_disk_commands', 'handle_disk_command'),
+    CommandSpec('process', 'Process management and monitoring',
+                'sysmind.commands.process_commands',
+                'register_process_commands', 'handle_process_command'),
+    CommandSpec('network', 'Network diagnostics and monitoring',
+                'sysmind.commands.network_commands',
+                'register_network_commands', 'handle_network_command'),
+    CommandSpec('intel', 'System intelligence and analysis',
+                'sysmind.commands.intel_commands',
+                'register_intel_commands', 'handle_intel_command'),
+    CommandSpec('daemon', 'Background collector daemon',
+                'sysmind.commands.daemon_commands',
+                'register_daemon_commands', 'handle_daemon_command'),
+    CommandSpec('config', 'Configuration management',
+                'sysmind.commands.config_commands',
+                'register_config_commands', 'handle_config_command',
+                needs_database=False),
+)
+
+
+def get_command(name: Optional[str]) -> Optional[CommandSpec]:
+    """Look up a command by name."""
+    for spec in COMMANDS:
+        if spec.name == name:
+            return spec
+    return None
+
+
+def find_command_name(
+    argv: Sequence[str],
+    options_with_values: Sequence[str] = ('--config', '-c')
+) -> Optional[str]:
+    """
+    Find the command name in raw arguments without parsing them.
+    
+    Args:
+        argv: Command line arguments (without the program name)
+        options_with_values: Global options that consume the next argument
+    
+    Returns:
+        First positional argument, or None if there is none
+    """
+    skip = False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg == '--':
+            continue
+        elif arg.startswith('-'):
+            skip = arg in options_with_values
+        else:
+            return arg
+    return None
+
+
+def register_commands(
+    subparsers: argparse._SubParsersAction,
+    active: Optional[str] = None
+) -> None:
+    """
+    Add all commands to a subparsers action.
+    
+    Args:
+        subparsers: Top-level subparsers action
+        active: Command to register in full; the others get a help-only stub
+    """
+    for spec in COMMANDS:
+        if spec.name == active:
+            spec.get_register()(subparsers)
+        else:
+            subparsers.add_parser(spec.name, help=spec.help)
@@ -112,6 +112,11 @@ class Config:
         """Get the expanded data directory path."""
         return Path(os.path.expanduser(self.general.data_dir))
     
+    @property
+    def config_path(self) -> Path:
+        """Get the config file path (loaded or default)."""
+        return self._config_path or (self.data_dir / self.DEFAULT_CONFIG_FILENAME)
+    
     @property
     def database_path(self) -> Path:
         """Get the database file path."""
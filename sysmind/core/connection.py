@@ -0,0 +1,186 @@
+"""
+SYSMIND Connection Module
+
+Long-lived, thread-aware SQLite connection management.
+Each thread gets its own persistent connection, tuned once with
+pragmas and reused for every statement that thread executes.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Sequence, Tuple, Any
+from contextlib import contextmanager
+
+
+# Pragmas applied to every new connection.
+# WAL lets readers proceed while the collector writes, and
+# synchronous=NORMAL only fsyncs at checkpoints instead of per commit.
+DEFAULT_PRAGMAS: Tuple[Tuple[str, Any], ...] = (
+    ("auto_vacuum", "INCREMENTAL"),  # only takes effect on new files or after VACUUM
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("cache_size", -8192),          # negative = KiB, i.e. 8 MiB page cache
+    ("mmap_size", 64 * 1024 * 1024),
+    ("temp_store", "MEMORY"),
+    ("busy_timeout", 5000),         # milliseconds
+)
+
+
+class ConnectionManager:
+    """
+    Pool of persistent SQLite connections, one per thread.
+    
+    Connections are opened lazily on first use in a thread and kept
+    open until close() or close_all() is called. Transactions are
+    explicit: connections run in autocommit mode and transaction()
+    issues BEGIN/COMMIT itself, using savepoints when nested.
+    """
+    
+    def __init__(
+        self,
+        db_path: Path,
+        pragmas: Optional[Sequence[Tuple[str, Any]]] = None,
+        timeout: float = 5.0,
+        on_open: Optional[Callable[[sqlite3.Connection], None]] = None
+    ):
+        """
+        Initialize connection manager.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            pragmas: Pragmas to apply to each connection (defaults to DEFAULT_PRAGMAS)
+            timeout: Seconds to wait on a locked database
+            on_open: Called with each new connection once it is ready for
+                use (e.g. to check the schema); may use transaction()
+        """
+        self.db_path = Path(db_path)
+        self.pragmas = tuple(pragmas) if pragmas is not None else DEFAULT_PRAGMAS
+        self.timeout = timeout
+        self.on_open = on_open
+        
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: Dict[int, Tuple[threading.Thread, sqlite3.Connection]] = {}
+        self._generation = 0  # bumped by close_all() to invalidate thread-local handles
+    
+    def _open(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.timeout,
+            isolation_level=None,       # explicit transactions only
+            check_same_thread=False     # close_all() may run on another thread
+        )
+        conn.row_factory = sqlite3.Row
+        
+        for name, value in self.pragmas:
+            conn.execute(f"PRAGMA {name} = {value}")
+        
+        return conn
+    
+    def _prune_dead_threads(self) -> None:
+        """Close connections owned by threads that have exited."""
+        dead = [ident for ident, (thread, _) in self._connections.items() if not thread.is_alive()]
+        for ident in dead:
+            _, conn = self._connections.pop(ident)
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+    
+    def connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it if needed."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.generation != self._generation:
+            conn = self._open()
+            self._local.conn = conn
+            self._local.depth = 0
+            self._local.generation = self._generation
+            
+            with self._lock:
+                self._prune_dead_threads()
+                self._connections[threading.get_ident()] = (threading.current_thread(), conn)
+            
+            if self.on_open:
+                try:
+                    self.on_open(conn)
+                except BaseException:
+                    # Do not hand out a connection that failed setup
+                    self.close()
+                    raise
+        
+        return conn
+    
+    @contextmanager
+    def transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block inside a transaction on this thread's connection.
+        
+        The outermost scope issues BEGIN and COMMIT (or ROLLBACK on error).
+        Nested scopes use savepoints so an inner failure only undoes
+        the inner block.
+        
+        Args:
+            immediate: Take the write lock up front (BEGIN IMMEDIATE).
+                Use for write transactions to avoid lock-upgrade failures.
+        """
+        conn = self.connection()
+        depth = self._local.depth
+        
+        if depth == 0:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        else:
+            conn.execute(f"SAVEPOINT sp_{depth}")
+        
+        self._local.depth = depth + 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth = depth
+            if depth == 0:
+                if conn.in_transaction:  # SQLite may already have rolled back
+                    conn.execute("ROLLBACK")
+            else:
+                conn.execute(f"ROLLBACK TO sp_{depth}")
+                conn.execute(f"RELEASE sp_{depth}")
+            raise
+        
+        self._local.depth = depth
+        if depth == 0:
+            conn.execute("COMMIT")
+        else:
+            conn.execute(f"RELEASE sp_{depth}")
+    
+    @property
+    def in_transaction(self) -> bool:
+        """Whether the calling thread is inside a transaction() scope."""
+        return getattr(self._local, 'depth', 0) > 0
+    
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            return
+        
+        self._local.conn = None
+        self._local.depth = 0
+        with self._lock:
+            self._connections.pop(threading.get_ident(), None)
+        conn.close()
+    
+    def close_all(self) -> None:
+        """Close every pooled connection (call on shutdown)."""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+            self._generation += 1
+        
+        for _, conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        
+        self._local.conn = None
+        self._local.depth = 0
@@ -8,14 +8,46 @@ file indexes, and application state.
 import sqlite3
 import json
 import os
+import threading
+import time
+import calendar
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from contextlib import contextmanager
 
+from .connection import ConnectionManager
+from .timeseries import TimeSeriesStore
+from .rollup import RollupManager, RollupTier, DEFAULT_TIERS
+from .retention import RetentionWorker
 from .errors import DatabaseError
 
 
+# Columns of the 'system' metric series; the snapshot ID is kept so
+# rows read back from the series still line up with process_history
+SNAPSHOT_SERIES = 'system'
+SNAPSHOT_COLUMNS = (
+    'snapshot_id', 'cpu_percent', 'memory_percent', 'memory_used_bytes',
+    'memory_total_bytes', 'disk_read_bytes', 'disk_write_bytes',
+    'network_sent_bytes', 'network_recv_bytes',
+)
+
+# Snapshot IDs reserved per id_sequences update
+SNAPSHOT_ID_BLOCK = 256
+
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _to_epoch(timestamp: str) -> int:
+    """Convert a UTC 'YYYY-MM-DD HH:MM:SS' timestamp to epoch seconds."""
+    return calendar.timegm(time.strptime(timestamp, _TIMESTAMP_FORMAT))
+
+
+def _from_epoch(ts: int) -> str:
+    """Convert epoch seconds to a UTC 'YYYY-MM-DD HH:MM:SS' timestamp."""
+    return time.strftime(_TIMESTAMP_FORMAT, time.gmtime(ts))
+
+
 class Database:
     """
     SQLite database wrapper for SYSMIND.
@@ -24,186 +56,356 @@ class Database:
     baselines, file indexes, and other persistent data.
     """
     
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 3
     
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, rollup_tiers: Sequence[RollupTier] = DEFAULT_TIERS):
         """
         Initialize database connection.
         
         Args:
             data_dir: Directory where database file will be stored
+            rollup_tiers: Downsampling tiers kept for snapshot metrics
         """
         self.data_dir = Path(data_dir)
         self.db_path = self.data_dir / "sysmind.db"
-        self._connection: Optional[sqlite3.Connection] = None
         
         # Ensure directory exists
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize database
-        self._initialize()
+        # One persistent, pragma-tuned connection per thread. Nothing is
+        # opened until first use; the schema is checked at that point.
+        self._schema_ready = False
+        self._pool = ConnectionManager(self.db_path, on_open=self._check_schema)
+        
+        # Snapshot metrics are read from the partitioned columnar store
+        self.timeseries = TimeSeriesStore(self._pool)
+        self.timeseries.register_series(SNAPSHOT_SERIES, SNAPSHOT_COLUMNS)
+        
+        # Long ranges are served from downsampled tiers
+        self.rollups = RollupManager(self._pool, self.timeseries, rollup_tiers)
+        self.rollups.register_series(SNAPSHOT_SERIES, SNAPSHOT_COLUMNS[1:])
+        
+        # Reserved snapshot ID range (next, end) and newest sample written
+        self._snapshot_ids: Tuple[int, int] = (0, 0)
+        self._id_lock = threading.Lock()
+        self._newest_ts: Optional[int] = None
     
     @contextmanager
-    def _get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+    def _get_connection(self, write: bool = False):
+        """
+        Context manager for a transaction on this thread's pooled connection.
+        
+        Args:
+            write: Take the write lock when the transaction starts
+        """
         try:
-            yield conn
-            conn.commit()
+            with self._pool.transaction(immediate=write) as conn:
+                yield conn
         except sqlite3.Error as e:
-            conn.rollback()
             raise DatabaseError(str(e), operation="transaction")
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Group several Database calls into a single write transaction.
+        
+        Calls made inside the block join the outer transaction instead
+        of committing individually.
+        """
+        with self._get_connection(write=True) as conn:
+            yield conn
+    
+    def close(self) -> None:
+        """Flush buffered metric blocks and close all pooled connections."""
+        try:
+            self.timeseries.flush()
         finally:
-            conn.close()
+            self._pool.close_all()
     
-    def _initialize(self) -> None:
-        """Initialize database schema."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # System snapshots table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS system_snapshots (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    cpu_percent REAL,
-                    memory_percent REAL,
-                    memory_used_bytes INTEGER,
-                    memory_total_bytes INTEGER,
-                    disk_read_bytes INTEGER,
-                    disk_write_bytes INTEGER,
-                    network_sent_bytes INTEGER,
-                    network_recv_bytes INTEGER
-                )
-            """)
-            
-            # Process history table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS process_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    snapshot_id INTEGER REFERENCES system_snapshots(id),
-                    pid INTEGER,
-                    name TEXT,
-                    cpu_percent REAL,
-                    memory_bytes INTEGER,
-                    status TEXT,
-                    create_time DATETIME
-                )
-            """)
-            
-            # Baselines table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS baselines (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    metric_name TEXT UNIQUE,
-                    mean_value REAL,
-                    std_deviation REAL,
-                    min_value REAL,
-                    max_value REAL,
-                    percentile_95 REAL,
-                    sample_count INTEGER,
-                    last_updated DATETIME
-                )
-            """)
-            
-            # File index table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS file_index (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    path TEXT UNIQUE,
-                    size_bytes INTEGER,
-                    hash_sha256 TEXT,
-                    created_at DATETIME,
-                    modified_at DATETIME,
-                    last_scanned DATETIME,
-                    category TEXT
-                )
-            """)
-            
-            # Duplicate groups table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS duplicate_groups (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    hash_sha256 TEXT,
-                    total_size_bytes INTEGER,
-                    file_count INTEGER,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Duplicate files table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS duplicate_files (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    group_id INTEGER REFERENCES duplicate_groups(id),
-                    file_path TEXT,
-                    is_kept BOOLEAN DEFAULT FALSE
-                )
-            """)
-            
-            # Watchdog rules table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS watchdog_rules (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT,
-                    process_pattern TEXT,
-                    condition_json TEXT,
-                    action TEXT,
-                    enabled BOOLEAN DEFAULT TRUE,
-                    last_triggered DATETIME
-                )
-            """)
-            
-            # Alerts table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS alerts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    severity TEXT,
-                    category TEXT,
-                    message TEXT,
-                    details_json TEXT,
-                    acknowledged BOOLEAN DEFAULT FALSE
-                )
-            """)
-            
-            # Quarantine manifest table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS quarantine (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    original_path TEXT,
-                    quarantine_path TEXT,
-                    size_bytes INTEGER,
-                    reason TEXT,
-                    deleted_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    expires_at DATETIME,
-                    restored BOOLEAN DEFAULT FALSE
-                )
-            """)
+    # ==================== Schema Migrations ====================
+    
+    def _check_schema(self, conn: sqlite3.Connection) -> None:
+        """
+        Bring the schema up to SCHEMA_VERSION on a newly opened connection.
+        
+        An up-to-date database costs a single PRAGMA user_version read,
+        and nothing at all once one connection has verified it.
+        """
+        if self._schema_ready:
+            return
+        
+        if conn.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION:
+            self._migrate()
+        self._schema_ready = True
+    
+    def _migrate(self) -> None:
+        """Apply pending migrations in one write transaction."""
+        with self._pool.transaction(immediate=True) as conn:
+            # Re-read under the write lock; another process may have migrated
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
             
-            # Disk scans history
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS disk_scans (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    path TEXT,
-                    total_size_bytes INTEGER,
-                    file_count INTEGER,
-                    folder_count INTEGER,
-                    scan_time DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    details_json TEXT
-                )
-            """)
+            for target, migration in self._MIGRATIONS:
+                if version < target:
+                    migration(self, conn.cursor())
+                    version = target
             
-            # Create indexes
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_timestamp ON system_snapshots(timestamp)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_process_history_name ON process_history(name)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_file_index_hash ON file_index(hash_sha256)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_timestamp ON alerts(timestamp)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_baselines_metric ON baselines(metric_name)")
+            # user_version is part of the database header, so this
+            # commits (or rolls back) together with the migrations
+            conn.execute(f"PRAGMA user_version = {version}")
+    
+    def _migrate_v1(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Create the initial schema.
+        
+        Statements are idempotent: databases created before versioning
+        was introduced (user_version 0) already have some of the tables.
+        """
+        # System snapshots table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS system_snapshots (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                cpu_percent REAL,
+                memory_percent REAL,
+                memory_used_bytes INTEGER,
+                memory_total_bytes INTEGER,
+                disk_read_bytes INTEGER,
+                disk_write_bytes INTEGER,
+                network_sent_bytes INTEGER,
+                network_recv_bytes INTEGER
+            )
+        """)
+        
+        # Process history table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS process_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                snapshot_id INTEGER REFERENCES system_snapshots(id),
+                pid INTEGER,
+                name TEXT,
+                cpu_percent REAL,
+                memory_bytes INTEGER,
+                status TEXT,
+                create_time DATETIME
+            )
+        """)
+        
+        # Baselines table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS baselines (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                metric_name TEXT UNIQUE,
+                mean_value REAL,
+                std_deviation REAL,
+                min_value REAL,
+                max_value REAL,
+                percentile_95 REAL,
+                sample_count INTEGER,
+                last_updated DATETIME
+            )
+        """)
+        
+        # File index table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS file_index (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT UNIQUE,
+                size_bytes INTEGER,
+                hash_sha256 TEXT,
+                created_at DATETIME,
+                modified_at DATETIME,
+                last_scanned DATETIME,
+                category TEXT
+            )
+        """)
+        
+        # Duplicate groups table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS duplicate_groups (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                hash_sha256 TEXT,
+                total_size_bytes INTEGER,
+                file_count INTEGER,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Duplicate files table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS duplicate_files (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                group_id INTEGER REFERENCES duplicate_groups(id),
+                file_path TEXT,
+                is_kept BOOLEAN DEFAULT FALSE
+            )
+        """)
+        
+        # Watchdog rules table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS watchdog_rules (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT,
+                process_pattern TEXT,
+                condition_json TEXT,
+                action TEXT,
+                enabled BOOLEAN DEFAULT TRUE,
+                last_triggered DATETIME
+            )
+        """)
+        
+        # Alerts table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS alerts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                severity TEXT,
+                category TEXT,
+                message TEXT,
+                details_json TEXT,
+                acknowledged BOOLEAN DEFAULT FALSE
+            )
+        """)
+        
+        # Quarantine manifest table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS quarantine (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                original_path TEXT,
+                quarantine_path TEXT,
+                size_bytes INTEGER,
+                reason TEXT,
+                deleted_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                expires_at DATETIME,
+                restored BOOLEAN DEFAULT FALSE
+            )
+        """)
+        
+        # Disk scans history
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS disk_scans (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT,
+                total_size_bytes INTEGER,
+                file_count INTEGER,
+                folder_count INTEGER,
+                scan_time DATETIME DEFAULT CURRENT_TIMESTAMP,
+                details_json TEXT
+            )
+        """)
+        
+        # Create indexes
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_timestamp ON system_snapshots(timestamp)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_process_history_name ON process_history(name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_process_history_snapshot ON process_history(snapshot_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_file_index_hash ON file_index(hash_sha256)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_timestamp ON alerts(timestamp)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_baselines_metric ON baselines(metric_name)")
+        
+        # Time series partition catalog
+        TimeSeriesStore.create_schema(cursor)
+        RollupManager.create_schema(cursor)
+        
+        # Copy snapshots written before the columnar store existed
+        cursor.execute("""
+            SELECT NOT EXISTS (SELECT 1 FROM ts_partitions)
+               AND EXISTS (SELECT 1 FROM system_snapshots)
+        """)
+        if cursor.fetchone()[0]:
+            self._backfill_timeseries(cursor.connection)
+    
+    def _migrate_v2(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Key watchdog rules by the watchdog's own rule ID.
+        
+        The watchdog names its rules ('high_cpu_any', ...) instead of
+        using row IDs, and keeps a trigger count per rule. Existing rows
+        are keyed by their row ID.
+        """
+        cursor.execute("ALTER TABLE watchdog_rules ADD COLUMN rule_key TEXT")
+        cursor.execute("ALTER TABLE watchdog_rules ADD COLUMN trigger_count INTEGER DEFAULT 0")
+        cursor.execute("UPDATE watchdog_rules SET rule_key = CAST(id AS TEXT)")
+        cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_watchdog_rules_key ON watchdog_rules(rule_key)")
+    
+    def _migrate_v3(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Stop keeping a system_snapshots row per sample.
+        
+        Snapshot values live only in the time series store; IDs come
+        from id_sequences, and process_history rows carry their own
+        timestamp. Existing system_snapshots rows (already copied to
+        the series) are left for retention to age out.
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS id_sequences (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("""
+            INSERT OR IGNORE INTO id_sequences (name, value)
+            SELECT 'snapshot', MAX(
+                COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'system_snapshots'), 0),
+                COALESCE((SELECT MAX(id) FROM system_snapshots), 0)
+            )
+        """)
+        
+        cursor.execute("ALTER TABLE process_history ADD COLUMN timestamp DATETIME")
+        cursor.execute("""
+            UPDATE process_history SET timestamp = (
+                SELECT ss.timestamp FROM system_snapshots ss WHERE ss.id = process_history.snapshot_id
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_process_history_timestamp ON process_history(timestamp)")
+    
+    # (version, migration) pairs, applied in order by _migrate()
+    _MIGRATIONS = (
+        (1, _migrate_v1),
+        (2, _migrate_v2),
+        (3, _migrate_v3),
+    )
+    
+    def _backfill_timeseries(self, conn: sqlite3.Connection) -> None:
+        """Load existing system_snapshots rows into the time series store."""
+        rows = conn.execute(f"""
+            SELECT CAST(strftime('%s', timestamp) AS INTEGER) AS ts, id, {', '.join(SNAPSHOT_COLUMNS[1:])}
+            FROM system_snapshots
+            WHERE timestamp IS NOT NULL
+            ORDER BY id
+        """)
+        for row in rows:
+            self.timeseries.append(SNAPSHOT_SERIES, row[0], tuple(row)[1:])
+        self.timeseries.flush()
     
     # ==================== System Snapshots ====================
     
+    def _allocate_snapshot_ids(self, count: int) -> List[int]:
+        """
+        Hand out snapshot IDs from a range reserved in id_sequences.
+        
+        SNAPSHOT_ID_BLOCK IDs are reserved at a time, so most snapshots
+        cost no write for their ID. IDs are unique across processes but
+        not gap-free, and only ordered by time within one process.
+        """
+        with self._id_lock:
+            next_id, end = self._snapshot_ids
+            if end - next_id < count:
+                reserve = max(count, SNAPSHOT_ID_BLOCK)
+                with self._get_connection(write=True) as conn:
+                    conn.execute(
+                        "UPDATE id_sequences SET value = value + ? WHERE name = 'snapshot'", (reserve,)
+                    )
+                    end = conn.execute(
+                        "SELECT value FROM id_sequences WHERE name = 'snapshot'"
+                    ).fetchone()[0] + 1
+                next_id = end - reserve
+            self._snapshot_ids = (next_id + count, end)
+            return list(range(next_id, next_id + count))
+    
+    def _discard_pending_writes(self) -> None:
+        """Forget buffered blocks and reserved IDs after a failed write."""
+        self.timeseries.discard_open_blocks()
+        self._snapshot_ids = (0, 0)
+    
     def store_snapshot(
         self,
         cpu_percent: float,
@@ -215,58 +417,167 @@ class Database:
         network_sent_bytes: int = 0,
         network_recv_bytes: int = 0
     ) -> int:
-        """Store a system snapshot and return its ID."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO system_snapshots 
-                (cpu_percent, memory_percent, memory_used_bytes, memory_total_bytes,
-                 disk_read_bytes, disk_write_bytes, network_sent_bytes, network_recv_bytes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (cpu_percent, memory_percent, memory_used_bytes, memory_total_bytes,
-                  disk_read_bytes, disk_write_bytes, network_sent_bytes, network_recv_bytes))
-            return cursor.lastrowid
+        """
+        Store a system snapshot and return its ID.
+        
+        The sample goes into the time series store's tail block, which
+        is written when it fills up or ages out (see TimeSeriesStore);
+        flush_metrics() or close() persist it sooner.
+        """
+        now = int(time.time())
+        values = (cpu_percent, memory_percent, memory_used_bytes, memory_total_bytes,
+                  disk_read_bytes, disk_write_bytes, network_sent_bytes, network_recv_bytes)
+        
+        try:
+            snapshot_id = self._allocate_snapshot_ids(1)[0]
+            self.timeseries.append(SNAPSHOT_SERIES, now, (snapshot_id,) + values)
+        except DatabaseError:
+            self._discard_pending_writes()
+            raise
+        
+        self._newest_ts = max(self._newest_ts or now, now)
+        return snapshot_id
+    
+    def store_snapshots_batch(
+        self,
+        snapshots: List[Tuple[str, Tuple[Any, ...], List[Dict[str, Any]]]]
+    ) -> List[int]:
+        """
+        Store many snapshots and their process rows in one transaction.
+        
+        Args:
+            snapshots: (timestamp, snapshot values, process dicts) tuples, where
+                values follow the store_snapshot argument order
+        
+        Returns:
+            IDs assigned to the snapshots, in input order
+        """
+        if not snapshots:
+            return []
+        
+        try:
+            return self._store_snapshots_batch(snapshots)
+        except DatabaseError:
+            self._discard_pending_writes()
+            raise
+    
+    def _store_snapshots_batch(
+        self,
+        snapshots: List[Tuple[str, Tuple[Any, ...], List[Dict[str, Any]]]]
+    ) -> List[int]:
+        """Write a snapshot batch to the time series store and process_history."""
+        ids = self._allocate_snapshot_ids(len(snapshots))
+        
+        with self._get_connection(write=True) as conn:
+            conn.executemany(
+                self._PROCESS_INSERT,
+                [self._process_row(snapshot_id, proc, timestamp)
+                 for snapshot_id, (timestamp, _, processes) in zip(ids, snapshots)
+                 for proc in processes]
+            )
+            
+            for snapshot_id, (timestamp, values, _) in zip(ids, snapshots):
+                self.timeseries.append(SNAPSHOT_SERIES, _to_epoch(timestamp),
+                                       (snapshot_id,) + tuple(values))
+        
+        newest = max(_to_epoch(timestamp) for timestamp, _, _ in snapshots)
+        self._newest_ts = max(self._newest_ts or newest, newest)
+        return ids
+    
+    def flush_metrics(self) -> int:
+        """
+        Persist buffered samples and roll up buckets that have closed.
+        
+        Writes leave both to this call so that storing a sample stays
+        cheap; MetricWriter's background thread runs it after each
+        flush. Rollup time is taken from the data, so historical
+        batches roll up in order.
+        
+        Returns:
+            Number of rollup rows written
+        """
+        self.timeseries.flush()
+        if self._newest_ts is None:
+            return 0
+        return self.rollups.update(self._newest_ts)
     
     def get_snapshots(
         self,
         hours: int = 24,
         limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Get system snapshots from the last N hours."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            query = """
-                SELECT * FROM system_snapshots 
-                WHERE timestamp >= datetime('now', ?)
-                ORDER BY timestamp DESC
-            """
-            if limit:
-                query += f" LIMIT {limit}"
-            
-            cursor.execute(query, (f"-{hours} hours",))
-            return [dict(row) for row in cursor.fetchall()]
+        """
+        Get system snapshots from the last N hours (newest first).
+        
+        Ranges too long to return raw are answered from a rollup tier:
+        each row is then a bucket with 'id' None, the per-column average
+        plus '<column>_min', '_max' and '_p95', 'sample_count' and the
+        tier name under 'resolution'.
+        """
+        end_ts = int(time.time())
+        tier = self.rollups.select_tier(hours * 3600)
+        if tier is not None:
+            return self._get_rollup_snapshots(tier, end_ts - hours * 3600, end_ts, limit)
+        
+        data = self.timeseries.query(SNAPSHOT_SERIES, end_ts - hours * 3600, end_ts)
+        
+        rows = []
+        for row in reversed(data.rows()):
+            snapshot = {'id': int(row.pop('snapshot_id')), 'timestamp': _from_epoch(row.pop('timestamp'))}
+            for name, value in row.items():
+                if value != value:  # NaN marks a missing value
+                    value = None
+                elif name.endswith('_bytes'):
+                    value = int(value)
+                snapshot[name] = value
+            rows.append(snapshot)
+            if limit and len(rows) >= limit:
+                break
+        return rows
+    
+    def _get_rollup_snapshots(
+        self,
+        tier: RollupTier,
+        start_ts: int,
+        end_ts: int,
+        limit: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """Get downsampled snapshot buckets (newest first)."""
+        rows = []
+        for bucket in reversed(self.rollups.query(SNAPSHOT_SERIES, tier, start_ts, end_ts)):
+            snapshot = {'id': None, 'timestamp': _from_epoch(bucket.pop('timestamp'))}
+            for name in SNAPSHOT_COLUMNS[1:]:
+                value = bucket.pop(name, None)
+                snapshot[name] = int(value) if value is not None and name.endswith('_bytes') else value
+            snapshot.update(bucket)
+            snapshot['resolution'] = tier.name
+            rows.append(snapshot)
+            if limit and len(rows) >= limit:
+                break
+        return rows
     
     def get_snapshot_stats(self, hours: int = 24) -> Dict[str, Any]:
         """Get aggregated statistics from snapshots."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT 
-                    AVG(cpu_percent) as avg_cpu,
-                    MAX(cpu_percent) as max_cpu,
-                    MIN(cpu_percent) as min_cpu,
-                    AVG(memory_percent) as avg_memory,
-                    MAX(memory_percent) as max_memory,
-                    MIN(memory_percent) as min_memory,
-                    COUNT(*) as sample_count
-                FROM system_snapshots
-                WHERE timestamp >= datetime('now', ?)
-            """, (f"-{hours} hours",))
-            
-            row = cursor.fetchone()
-            if row:
-                return dict(row)
-            return {}
+        end_ts = int(time.time())
+        start_ts = end_ts - hours * 3600
+        columns = ('cpu_percent', 'memory_percent')
+        
+        tier = self.rollups.select_tier(hours * 3600)
+        if tier is None:
+            stats = self.timeseries.stats(SNAPSHOT_SERIES, start_ts, end_ts, columns=columns)
+        else:
+            stats = self.rollups.stats(SNAPSHOT_SERIES, tier, start_ts, end_ts, columns=columns)
+        cpu, memory = stats['cpu_percent'], stats['memory_percent']
+        
+        return {
+            'avg_cpu': cpu['avg'],
+            'max_cpu': cpu['max'],
+            'min_cpu': cpu['min'],
+            'avg_memory': memory['avg'],
+            'max_memory': memory['max'],
+            'min_memory': memory['min'],
+            'sample_count': cpu['count'],
+        }
     
     # ==================== Baselines ====================
     
@@ -281,7 +592,7 @@ class Database:
         sample_count: int
     ) -> None:
         """Store or update a baseline metric."""
-        with self._get_connection() as conn:
+        with self._get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR REPLACE INTO baselines 
@@ -319,7 +630,7 @@ class Database:
         details: Optional[Dict] = None
     ) -> int:
         """Store an alert and return its ID."""
-        with self._get_connection() as conn:
+        with self._get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO alerts (severity, category, message, details_json)
@@ -327,6 +638,23 @@ class Database:
             """, (severity, category, message, json.dumps(details or {})))
             return cursor.lastrowid
     
+    def store_alerts(self, alerts: List[Tuple[str, str, str, Optional[Dict]]]) -> None:
+        """
+        Store several alerts in one transaction.
+        
+        Args:
+            alerts: (severity, category, message, details) tuples
+        """
+        if not alerts:
+            return
+        
+        with self._get_connection(write=True) as conn:
+            conn.executemany("""
+                INSERT INTO alerts (severity, category, message, details_json)
+                VALUES (?, ?, ?, ?)
+            """, [(severity, category, message, json.dumps(details or {}))
+                  for severity, category, message, details in alerts])
+    
     def get_alerts(
         self,
         hours: int = 24,
@@ -361,7 +689,7 @@ class Database:
     
     def acknowledge_alert(self, alert_id: int) -> None:
         """Mark an alert as acknowledged."""
-        with self._get_connection() as conn:
+        with self._get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "UPDATE alerts SET acknowledged = TRUE WHERE id = ?",
@@ -370,7 +698,7 @@ class Database:
     
     def acknowledge_all_alerts(self) -> int:
         """Mark all alerts as acknowledged. Returns count."""
-        with self._get_connection() as conn:
+        with self._get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute("UPDATE alerts SET acknowledged = TRUE WHERE acknowledged = FALSE")
             return cursor.rowcount
@@ -388,7 +716,7 @@ class Database:
         """Store a quarantined item record."""
         expires_at = datetime.now() + timedelta(days=retention_days)
         
-        with self._get_connection() as conn:
+        with self._get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO quarantine 
@@ -411,7 +739,7 @@ class Database:
     
     def mark_restored(self, quarantine_id: int) -> None:
         """Mark a quarantine item as restored."""
-        with self._get_connection() as conn:
+        with self._get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "UPDATE quarantine SET restored = TRUE WHERE id = ?",
@@ -439,7 +767,7 @@ class Database:
         details: Optional[Dict] = None
     ) -> int:
         """Store a disk scan result."""
-        with self._get_connection() as conn:
+        with self._get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO disk_scans 
@@ -482,14 +810,51 @@ class Database:
         action: str
     ) -> int:
         """Store a watchdog rule."""
-        with self._get_connection() as conn:
+        with self._get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO watchdog_rules 
                 (name, process_pattern, condition_json, action)
                 VALUES (?, ?, ?, ?)
             """, (name, process_pattern, json.dumps(conditions), action))
-            return cursor.lastrowid
+            rule_id = cursor.lastrowid
+            cursor.execute(
+                "UPDATE watchdog_rules SET rule_key = CAST(id AS TEXT) WHERE id = ?",
+                (rule_id,)
+            )
+            return rule_id
+    
+    def save_watchdog_rule(
+        self,
+        rule_id: str,
+        name: str,
+        pattern: str,
+        conditions: Dict,
+        action: str,
+        enabled: bool = True,
+        last_triggered: Optional[datetime] = None,
+        trigger_count: int = 0
+    ) -> None:
+        """Insert or update a watchdog rule by its rule ID."""
+        with self._get_connection(write=True) as conn:
+            conn.execute("""
+                INSERT INTO watchdog_rules
+                (rule_key, name, process_pattern, condition_json, action, enabled,
+                 last_triggered, trigger_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(rule_key) DO UPDATE SET
+                    name = excluded.name,
+                    process_pattern = excluded.process_pattern,
+                    condition_json = excluded.condition_json,
+                    action = excluded.action,
+                    enabled = excluded.enabled,
+                    last_triggered = excluded.last_triggered,
+                    trigger_count = excluded.trigger_count
+            """, (
+                rule_id, name, pattern, json.dumps(conditions), action, enabled,
+                last_triggered.isoformat(sep=' ', timespec='seconds') if last_triggered else None,
+                trigger_count
+            ))
     
     def get_watchdog_rules(self, enabled_only: bool = True) -> List[Dict[str, Any]]:
         """Get watchdog rules."""
@@ -509,37 +874,47 @@ class Database:
                 results.append(item)
             return results
     
-    def delete_watchdog_rule(self, rule_id: int) -> bool:
-        """Delete a watchdog rule."""
-        with self._get_connection() as conn:
+    def delete_watchdog_rule(self, rule_id: str) -> bool:
+        """Delete a watchdog rule by its rule ID."""
+        with self._get_connection(write=True) as conn:
             cursor = conn.cursor()
-            cursor.execute("DELETE FROM watchdog_rules WHERE id = ?", (rule_id,))
+            cursor.execute("DELETE FROM watchdog_rules WHERE rule_key = ?", (str(rule_id),))
             return cursor.rowcount > 0
     
     # ==================== Process History ====================
     
+    _PROCESS_INSERT = """
+        INSERT INTO process_history 
+        (snapshot_id, timestamp, pid, name, cpu_percent, memory_bytes, status, create_time)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def _process_row(snapshot_id: int, proc: Dict[str, Any], timestamp: str) -> Tuple[Any, ...]:
+        """Convert a process dict into a process_history row."""
+        return (
+            snapshot_id,
+            timestamp,
+            proc.get('pid'),
+            proc.get('name'),
+            proc.get('cpu_percent'),
+            proc.get('memory_bytes'),
+            proc.get('status'),
+            proc.get('create_time')
+        )
+    
     def store_process_snapshot(
         self,
         snapshot_id: int,
         processes: List[Dict[str, Any]]
     ) -> None:
         """Store process data for a snapshot."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            for proc in processes:
-                cursor.execute("""
-                    INSERT INTO process_history 
-                    (snapshot_id, pid, name, cpu_percent, memory_bytes, status, create_time)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    snapshot_id,
-                    proc.get('pid'),
-                    proc.get('name'),
-                    proc.get('cpu_percent'),
-                    proc.get('memory_bytes'),
-                    proc.get('status'),
-                    proc.get('create_time')
-                ))
+        timestamp = _from_epoch(int(time.time()))
+        with self._get_connection(write=True) as conn:
+            conn.executemany(
+                self._PROCESS_INSERT,
+                [self._process_row(snapshot_id, proc, timestamp) for proc in processes]
+            )
     
     def get_process_history(
         self,
@@ -550,51 +925,51 @@ class Database:
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT ph.*, ss.timestamp 
-                FROM process_history ph
-                JOIN system_snapshots ss ON ph.snapshot_id = ss.id
-                WHERE ph.name LIKE ? AND ss.timestamp >= datetime('now', ?)
-                ORDER BY ss.timestamp DESC
+                SELECT * FROM process_history
+                WHERE name LIKE ? AND timestamp >= datetime('now', ?)
+                ORDER BY timestamp DESC
             """, (f"%{process_name}%", f"-{hours} hours"))
             return [dict(row) for row in cursor.fetchall()]
     
     # ==================== Cleanup ====================
     
     def cleanup_old_data(self, retention_days: int = 30) -> Dict[str, int]:
-        """Remove old data beyond retention period."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cutoff = f"-{retention_days} days"
-            
-            counts = {}
-            
-            # Cleanup snapshots
-            cursor.execute(
-                "DELETE FROM system_snapshots WHERE timestamp < datetime('now', ?)",
-                (cutoff,)
-            )
-            counts['snapshots'] = cursor.rowcount
-            
-            # Cleanup alerts
-            cursor.execute(
-                "DELETE FROM alerts WHERE timestamp < datetime('now', ?) AND acknowledged = TRUE",
-                (cutoff,)
-            )
-            counts['alerts'] = cursor.rowcount
-            
-            # Cleanup disk scans
-            cursor.execute(
-                "DELETE FROM disk_scans WHERE scan_time < datetime('now', ?)",
-                (cutoff,)
-            )
-            counts['disk_scans'] = cursor.rowcount
-            
-            return counts
+        """
+        Remove old data beyond retention period.
+        
+        Deletes run in small batches (see RetentionWorker); use
+        RetentionWorker.start() to do this periodically in the background.
+        """
+        return RetentionWorker(self, retention_days).run_once()
     
     def vacuum(self) -> None:
         """Optimize database by running VACUUM."""
-        with self._get_connection() as conn:
-            conn.execute("VACUUM")
+        # VACUUM cannot run inside a transaction
+        try:
+            self._pool.connection().execute("VACUUM")
+        except sqlite3.Error as e:
+            raise DatabaseError(str(e), operation="vacuum")
+    
+    def incremental_vacuum(self, max_pages: int) -> int:
+        """
+        Return up to max_pages free pages to the file system.
+        
+        Returns:
+            Number of pages released (0 unless auto_vacuum is INCREMENTAL)
+        """
+        try:
+            conn = self._pool.connection()
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                return 0
+            
+            pages = min(conn.execute("PRAGMA freelist_count").fetchone()[0], max_pages)
+            if pages:
+                # executescript() steps the pragma to completion; execute()
+                # would stop after the first page
+                conn.executescript(f"PRAGMA incremental_vacuum({pages})")
+            return pages
+        except sqlite3.Error as e:
+            raise DatabaseError(str(e), operation="vacuum")
     
     def get_database_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
@@ -613,6 +988,12 @@ class Database:
             for table in tables:
                 cursor.execute(f"SELECT COUNT(*) FROM {table}")
                 stats[f"{table}_count"] = cursor.fetchone()[0]
+            
+            cursor.execute("SELECT COUNT(*) FROM ts_partitions")
+            stats['metric_partitions_count'] = cursor.fetchone()[0]
+            
+            cursor.execute("SELECT COUNT(*) FROM metric_rollups")
+            stats['metric_rollups_count'] = cursor.fetchone()[0]
         
         # Get file size
         if self.db_path.exists():
@@ -147,3 +147,16 @@ class QuarantineError(SysmindError):
             "Check the quarantine directory permissions"
         ]
         super().__init__(message, code="QUARANTINE_ERROR", suggestions=suggestions)
+
+
+class DaemonError(SysmindError):
+    """Daemon socket and lifecycle errors."""
+    
+    def __init__(self, message: str, socket_path: Optional[str] = None):
+        suggestions = [
+            "Run 'sysmind daemon status' to check whether the daemon is running",
+            "Start it with 'sysmind daemon start'"
+        ]
+        if socket_path:
+            suggestions.append(f"Remove a stale socket file: {socket_path}")
+        super().__init__(message, code="DAEMON_ERROR", suggestions=suggestions)
@@ -0,0 +1,193 @@
+"""
+SYSMIND Metric Writer Module
+
+Write-behind buffer for system snapshots and process history.
+Samples are queued in memory and persisted in batches, one
+transaction and a handful of executemany() calls per flush.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
+
+from .database import Database
+from .errors import DatabaseError
+from ..utils.logger import get_logger
+
+
+logger = get_logger('sysmind.metric_writer')
+
+
+# (timestamp, snapshot column values, process rows)
+PendingSnapshot = Tuple[str, Tuple[Any, ...], List[Dict[str, Any]]]
+
+
+class MetricWriter:
+    """
+    Buffered writer for the snapshot collector hot path.
+    
+    A flush happens when the number of pending rows (snapshots plus
+    their process rows) reaches max_batch_rows, when flush_interval
+    has elapsed since the last flush, or when flush() is called.
+    If the database cannot keep up and pending rows reach
+    max_pending_rows, producers flush synchronously; if that fails
+    the oldest snapshots are dropped so memory stays bounded.
+    """
+    
+    def __init__(
+        self,
+        database: Database,
+        max_batch_rows: int = 2000,
+        flush_interval: float = 10.0,
+        max_pending_rows: int = 50000
+    ):
+        """
+        Initialize metric writer.
+        
+        Args:
+            database: Database to persist into
+            max_batch_rows: Pending row count that triggers a flush
+            flush_interval: Maximum seconds between flushes
+            max_pending_rows: Row count at which back-pressure applies
+        """
+        self.database = database
+        self.max_batch_rows = max_batch_rows
+        self.flush_interval = flush_interval
+        self.max_pending_rows = max(max_pending_rows, max_batch_rows)
+        
+        self._pending: List[PendingSnapshot] = []
+        self._pending_rows = 0
+        self._last_flush = time.monotonic()
+        self._dropped = 0
+        
+        self._lock = threading.Lock()        # guards the buffer
+        self._flush_lock = threading.Lock()  # serializes flushes
+        self._running = False
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def pending_rows(self) -> int:
+        """Number of rows waiting to be written."""
+        return self._pending_rows
+    
+    @property
+    def dropped_snapshots(self) -> int:
+        """Snapshots discarded because the buffer overflowed."""
+        return self._dropped
+    
+    def add_snapshot(
+        self,
+        cpu_percent: float,
+        memory_percent: float,
+        memory_used_bytes: int,
+        memory_total_bytes: int,
+        disk_read_bytes: int = 0,
+        disk_write_bytes: int = 0,
+        network_sent_bytes: int = 0,
+        network_recv_bytes: int = 0,
+        processes: Optional[List[Dict[str, Any]]] = None,
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """
+        Queue a system snapshot and, optionally, its process rows.
+        
+        Args:
+            processes: Process dicts as accepted by Database.store_process_snapshot
+            timestamp: Sample time (defaults to now; naive values are local time)
+        """
+        ts = (timestamp or datetime.now(timezone.utc)).astimezone(timezone.utc)
+        values = (cpu_percent, memory_percent, memory_used_bytes, memory_total_bytes,
+                  disk_read_bytes, disk_write_bytes, network_sent_bytes, network_recv_bytes)
+        process_rows = list(processes or [])
+        
+        with self._lock:
+            self._pending.append((ts.strftime('%Y-%m-%d %H:%M:%S'), values, process_rows))
+            self._pending_rows += 1 + len(process_rows)
+            pending = self._pending_rows
+            due = (time.monotonic() - self._last_flush) >= self.flush_interval
+        
+        if pending >= self.max_pending_rows:
+            # Back-pressure: the producer pays for the write itself
+            try:
+                self.flush()
+            except DatabaseError as e:
+                logger.warning(f"Metric flush failed under back-pressure: {e}")
+                self._shed_overflow()
+        elif pending >= self.max_batch_rows or due:
+            try:
+                self.flush()
+            except DatabaseError as e:
+                logger.warning(f"Metric flush failed, keeping rows buffered: {e}")
+    
+    def _shed_overflow(self) -> None:
+        """Drop the oldest snapshots until the buffer is under its limit."""
+        with self._lock:
+            while self._pending and self._pending_rows >= self.max_pending_rows:
+                _, _, process_rows = self._pending.pop(0)
+                self._pending_rows -= 1 + len(process_rows)
+                self._dropped += 1
+    
+    def flush(self) -> int:
+        """
+        Write all pending rows in a single transaction.
+        
+        Returns:
+            Number of snapshots written
+        
+        Raises:
+            DatabaseError: If the write fails; rows stay buffered
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = self._pending
+                batch_rows = self._pending_rows
+                self._pending = []
+                self._pending_rows = 0
+                self._last_flush = time.monotonic()
+            
+            if not batch:
+                return 0
+            
+            try:
+                self.database.store_snapshots_batch(batch)
+            except DatabaseError:
+                # Put the batch back in front of anything queued meanwhile
+                with self._lock:
+                    self._pending[:0] = batch
+                    self._pending_rows += batch_rows
+                raise
+            
+            return len(batch)
+    
+    def _flush_loop(self) -> None:
+        """Background loop flushing on the time threshold and rolling up."""
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+                self.database.flush_metrics()
+            except DatabaseError as e:
+                logger.warning(f"Background metric flush failed: {e}")
+    
+    def start(self) -> None:
+        """Start a background thread that flushes every flush_interval."""
+        if self._running:
+            return
+        
+        self._running = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop the background thread and flush what is left."""
+        if self._running:
+            self._running = False
+            self._stop_event.set()
+            if self._thread:
+                self._thread.join(timeout=self.flush_interval + 1)
+                self._thread = None
+        
+        self.flush()
+        self.database.flush_metrics()
@@ -0,0 +1,197 @@
+"""
+SYSMIND Retention Module
+
+Incremental removal of data older than the retention period.
+Rows are deleted in small batches, each in its own short write
+transaction, so collectors can keep writing while a cleanup of a
+large backlog is in progress. Freed pages are returned to the file
+system with incremental vacuum rather than a full VACUUM.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+
+import sqlite3
+
+from .errors import DatabaseError
+from ..utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from .database import Database
+
+
+logger = get_logger('sysmind.retention')
+
+
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class RetentionWorker:
+    """
+    Chunked retention cleanup for the SYSMIND database.
+    
+    Expired snapshots and duplicate groups are removed together with
+    their child rows (process_history and duplicate_files), children
+    first, so no orphans are left even if a run is interrupted.
+    """
+    
+    def __init__(
+        self,
+        database: 'Database',
+        retention_days: int = 30,
+        batch_size: int = 2000,
+        pause: float = 0.01,
+        vacuum_pages: int = 512
+    ):
+        """
+        Initialize retention worker.
+        
+        Args:
+            database: Database to clean up
+            retention_days: Age in days after which data is removed
+            batch_size: Maximum rows deleted per transaction
+            pause: Seconds to sleep between batches, letting writers in
+            vacuum_pages: Pages released per incremental vacuum step
+        """
+        self.database = database
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.pause = pause
+        self.vacuum_pages = vacuum_pages
+        
+        self._running = False
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    # ==================== Cleanup ====================
+    
+    def _delete_batches(self, table: str, where: str, params: Tuple = ()) -> int:
+        """
+        Delete matching rows in rowid batches.
+        
+        Returns:
+            Number of rows deleted
+        """
+        deleted = 0
+        while True:
+            with self.database.transaction() as conn:
+                cursor = conn.execute(f"""
+                    DELETE FROM {table} WHERE rowid IN (
+                        SELECT rowid FROM {table} WHERE {where} LIMIT ?
+                    )
+                """, params + (self.batch_size,))
+                count = cursor.rowcount
+            
+            deleted += count
+            if count < self.batch_size:
+                return deleted
+            
+            # Yield to writers between batches; stop() cuts a run short
+            if self._stop_event.wait(self.pause):
+                return deleted
+    
+    def _last_expired_id(self, table: str, column: str, cutoff: str) -> Optional[int]:
+        """Highest ID among rows older than the cutoff (IDs grow with time)."""
+        with self.database.transaction() as conn:
+            return conn.execute(
+                f"SELECT MAX(id) FROM {table} WHERE {column} < ?", (cutoff,)
+            ).fetchone()[0]
+    
+    def run_once(self, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Remove everything older than the retention period.
+        
+        Args:
+            now: Reference time in epoch seconds (default: time.time())
+        
+        Returns:
+            Number of rows (or partitions, or pages) removed per kind of data
+        """
+        now = int(now if now is not None else time.time())
+        cutoff_ts = now - self.retention_days * 86400
+        cutoff = time.strftime(_TIMESTAMP_FORMAT, time.gmtime(cutoff_ts))
+        counts = {}
+        
+        try:
+            counts['process_history'] = self._delete_batches(
+                'process_history', 'timestamp < ?', (cutoff,))
+            # Rows from before snapshots moved to the time series store
+            counts['snapshots'] = self._delete_batches(
+                'system_snapshots', 'timestamp < ?', (cutoff,))
+            
+            counts['alerts'] = self._delete_batches(
+                'alerts', 'timestamp < ? AND acknowledged = TRUE', (cutoff,))
+            counts['disk_scans'] = self._delete_batches(
+                'disk_scans', 'scan_time < ?', (cutoff,))
+            
+            # Duplicate groups cascade to their files
+            last_group = self._last_expired_id('duplicate_groups', 'created_at', cutoff)
+            if last_group is not None:
+                counts['duplicate_files'] = self._delete_batches(
+                    'duplicate_files', 'group_id <= ?', (last_group,))
+                counts['duplicate_groups'] = self._delete_batches(
+                    'duplicate_groups', 'id <= ?', (last_group,))
+            else:
+                counts['duplicate_files'] = counts['duplicate_groups'] = 0
+            
+            # Metric partitions are dropped whole; rollups have their own retention
+            counts['metric_partitions'] = self.database.timeseries.drop_partitions_before(cutoff_ts)
+            counts['metric_rollups'] = sum(self.database.rollups.enforce_retention(now).values())
+            
+            counts['vacuumed_pages'] = self.incremental_vacuum()
+        except sqlite3.Error as e:
+            raise DatabaseError(str(e), operation="retention")
+        
+        return counts
+    
+    def incremental_vacuum(self) -> int:
+        """
+        Release free pages in small steps.
+        
+        Only has an effect on databases using auto_vacuum=INCREMENTAL;
+        older files are converted by one full Database.vacuum().
+        
+        Returns:
+            Number of pages released
+        """
+        released = 0
+        while True:
+            step = self.database.incremental_vacuum(self.vacuum_pages)
+            released += step
+            if step < self.vacuum_pages or self._stop_event.wait(self.pause):
+                return released
+    
+    # ==================== Background Worker ====================
+    
+    def _worker_loop(self, interval: float) -> None:
+        """Run cleanup every interval seconds until stopped."""
+        while not self._stop_event.is_set():
+            try:
+                counts = self.run_once()
+                logger.debug(f"Retention cleanup: {counts}")
+            except DatabaseError as e:
+                logger.warning(f"Retention cleanup failed: {e}")
+            
+            self._stop_event.wait(interval)
+    
+    def start(self, interval: float = 3600.0) -> None:
+        """Start cleaning up in a background thread every interval seconds."""
+        if self._running:
+            return
+        
+        self._running = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._worker_loop, args=(interval,), daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop the background thread, interrupting a run in progress."""
+        if not self._running:
+            return
+        
+        self._running = False
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
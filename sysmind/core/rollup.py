@@ -0,0 +1,441 @@
+"""
+SYSMIND Rollup Module
+
+Downsampling of raw time series into coarser aggregate tiers.
+
+Raw samples from the time series store are continuously folded into
+fixed-resolution buckets (1 minute, 15 minutes and 1 hour by default)
+holding min/max/avg/p95/count per metric. Each tier has its own
+retention, and long-range reads are served from the finest tier that
+keeps the result under a target number of points.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+import sqlite3
+
+from .connection import ConnectionManager
+from .timeseries import TimeSeriesStore, SECONDS_PER_DAY
+from .errors import DatabaseError
+
+
+@dataclass(frozen=True)
+class RollupTier:
+    """A downsampling tier."""
+    name: str
+    resolution: int  # bucket width in seconds
+    retention_days: int
+
+
+DEFAULT_TIERS: Tuple[RollupTier, ...] = (
+    RollupTier('1m', 60, 7),
+    RollupTier('15m', 900, 90),
+    RollupTier('1h', 3600, 365),
+)
+
+
+def _percentile(sorted_values: Sequence[float], percent: float) -> float:
+    """Nearest-rank percentile of pre-sorted values."""
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _aggregate(values: Sequence[float]) -> Optional[Tuple[float, float, float, float, int]]:
+    """Compute (min, max, avg, p95, count) ignoring NaN."""
+    finite = sorted(v for v in values if v == v)
+    if not finite:
+        return None
+    return (finite[0], finite[-1], sum(finite) / len(finite), _percentile(finite, 95), len(finite))
+
+
+class RollupManager:
+    """
+    Maintains rollup tiers for registered time series.
+    
+    update() is incremental: each tier keeps a watermark (the end of
+    the last completed bucket) and only buckets that have closed since
+    are computed. Buckets are considered closed once settle_seconds
+    have passed, leaving time for buffered writers to flush.
+    """
+    
+    def __init__(
+        self,
+        pool: ConnectionManager,
+        timeseries: TimeSeriesStore,
+        tiers: Sequence[RollupTier] = DEFAULT_TIERS,
+        raw_interval: float = 1.0,
+        max_points: int = 5000,
+        settle_seconds: int = 120,
+        chunk_seconds: int = 6 * 3600
+    ):
+        """
+        Initialize rollup manager.
+        
+        Args:
+            pool: Connection pool of the owning Database
+            timeseries: Raw sample store to aggregate from
+            tiers: Tiers ordered from finest to coarsest
+            raw_interval: Assumed seconds between raw samples (for tier selection)
+            max_points: Largest result size a range read should produce
+            settle_seconds: Delay before a closed bucket is aggregated
+            chunk_seconds: Raw data decoded per step when catching up
+        """
+        self.pool = pool
+        self.timeseries = timeseries
+        self.tiers = tuple(sorted(tiers, key=lambda t: t.resolution))
+        self.raw_interval = raw_interval
+        self.max_points = max_points
+        self.settle_seconds = settle_seconds
+        self.chunk_seconds = chunk_seconds
+        
+        self._series: Dict[str, Tuple[str, ...]] = {}
+        self._watermarks: Dict[Tuple[str, int], int] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+    
+    @staticmethod
+    def create_schema(cursor: sqlite3.Cursor) -> None:
+        """Create rollup tables."""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS metric_rollups (
+                series TEXT NOT NULL,
+                resolution INTEGER NOT NULL,
+                metric TEXT NOT NULL,
+                bucket_ts INTEGER NOT NULL,
+                min_value REAL,
+                max_value REAL,
+                avg_value REAL,
+                p95_value REAL,
+                sample_count INTEGER,
+                PRIMARY KEY (series, resolution, metric, bucket_ts)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS rollup_watermarks (
+                series TEXT NOT NULL,
+                resolution INTEGER NOT NULL,
+                watermark INTEGER NOT NULL,
+                PRIMARY KEY (series, resolution)
+            )
+        """)
+    
+    def register_series(self, name: str, columns: Sequence[str]) -> None:
+        """Declare which columns of a series are rolled up."""
+        self._series[name] = tuple(columns)
+    
+    # ==================== Aggregation ====================
+    
+    def _load_watermarks(self, conn: sqlite3.Connection) -> None:
+        """Read persisted watermarks (once)."""
+        if self._loaded:
+            return
+        for row in conn.execute("SELECT series, resolution, watermark FROM rollup_watermarks"):
+            self._watermarks[(row[0], row[1])] = row[2]
+        self._loaded = True
+    
+    def _initial_watermark(self, conn: sqlite3.Connection, tier: RollupTier, now: int) -> int:
+        """Starting point for a tier that has never run: the oldest raw data."""
+        oldest_day = conn.execute("SELECT MIN(day) FROM ts_partitions").fetchone()[0]
+        start = oldest_day * SECONDS_PER_DAY if oldest_day is not None else now
+        return start - start % tier.resolution
+    
+    def _bucketize(
+        self,
+        timestamps: Sequence[int],
+        columns: Dict[str, Sequence[float]],
+        resolution: int,
+        start_ts: int,
+        end_ts: int
+    ) -> Dict[int, Dict[str, List[float]]]:
+        """Group samples in [start_ts, end_ts) into buckets of one resolution."""
+        buckets: Dict[int, Dict[str, List[float]]] = {}
+        names = list(columns)
+        for i, ts in enumerate(timestamps):
+            if start_ts <= ts < end_ts:
+                bucket = buckets.get(ts - ts % resolution)
+                if bucket is None:
+                    bucket = {name: [] for name in names}
+                    buckets[ts - ts % resolution] = bucket
+                for name in names:
+                    bucket[name].append(columns[name][i])
+        return buckets
+    
+    def update(self, now: Optional[int] = None, max_chunks: int = 8) -> int:
+        """
+        Aggregate buckets that have closed since the last update.
+        
+        Samples written with a timestamp behind a tier's watermark are
+        not rolled up, so callers should pass the newest sample time
+        they have written rather than the wall clock.
+        
+        Args:
+            now: Newest sample time in epoch seconds (default: time.time())
+            max_chunks: Upper bound on raw chunks decoded in this call,
+                so catching up on a large backlog is spread over calls
+        
+        Returns:
+            Number of rollup rows written
+        """
+        now = int(now if now is not None else time.time())
+        horizon = now - self.settle_seconds
+        written = 0
+        
+        if not self._has_due(horizon):
+            return 0
+        
+        try:
+            with self._lock, self.pool.transaction(immediate=True) as conn:
+                self._load_watermarks(conn)
+                
+                for series, metric_columns in self._series.items():
+                    for _ in range(max_chunks):
+                        rows, done = self._update_chunk(conn, series, metric_columns, horizon)
+                        written += rows
+                        if done:
+                            break
+        except (sqlite3.Error, DatabaseError) as e:
+            self.reset()
+            if isinstance(e, DatabaseError):
+                raise
+            raise DatabaseError(str(e), operation="rollup update")
+        
+        return written
+    
+    def _has_due(self, horizon: int) -> bool:
+        """Cheap check whether any tier has a closed bucket to aggregate."""
+        with self._lock:
+            if not self._loaded:
+                return True
+            for series in self._series:
+                for tier in self.tiers:
+                    watermark = self._watermarks.get((series, tier.resolution))
+                    if watermark is None or watermark + tier.resolution <= horizon:
+                        return True
+            return False
+    
+    def reset(self) -> None:
+        """
+        Forget cached watermarks so they are re-read from the database.
+        
+        Call after a transaction that included update() was rolled back.
+        """
+        with self._lock:
+            self._watermarks.clear()
+            self._loaded = False
+    
+    def _update_chunk(
+        self,
+        conn: sqlite3.Connection,
+        series: str,
+        metric_columns: Tuple[str, ...],
+        horizon: int
+    ) -> Tuple[int, bool]:
+        """Aggregate one chunk of raw data for every tier with closed buckets."""
+        due = []
+        for tier in self.tiers:
+            key = (series, tier.resolution)
+            if key not in self._watermarks:
+                self._watermarks[key] = self._initial_watermark(conn, tier, horizon)
+            if self._watermarks[key] + tier.resolution <= horizon:
+                due.append(tier)
+        
+        if not due:
+            return 0, True
+        
+        start = min(self._watermarks[(series, tier.resolution)] for tier in due)
+        stop = min(start + self.chunk_seconds, horizon)
+        data = self.timeseries.query(series, start, stop, metric_columns)
+        
+        written = 0
+        for tier in due:
+            key = (series, tier.resolution)
+            watermark = self._watermarks[key]
+            closed_until = stop - stop % tier.resolution
+            if closed_until <= watermark:
+                continue
+            
+            buckets = self._bucketize(data.timestamps, data.columns, tier.resolution,
+                                      watermark, closed_until)
+            rows = []
+            for bucket_ts, bucket in buckets.items():
+                for metric, values in bucket.items():
+                    agg = _aggregate(values)
+                    if agg:
+                        rows.append((series, tier.resolution, metric, bucket_ts) + agg)
+            
+            conn.executemany("""
+                INSERT OR REPLACE INTO metric_rollups
+                (series, resolution, metric, bucket_ts, min_value, max_value,
+                 avg_value, p95_value, sample_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.execute("""
+                INSERT OR REPLACE INTO rollup_watermarks (series, resolution, watermark)
+                VALUES (?, ?, ?)
+            """, (series, tier.resolution, closed_until))
+            
+            self._watermarks[key] = closed_until
+            written += len(rows)
+        
+        return written, stop >= horizon
+    
+    def enforce_retention(self, now: Optional[int] = None) -> Dict[str, int]:
+        """
+        Delete rollup buckets older than each tier's retention.
+        
+        Returns:
+            Rows deleted per tier name
+        """
+        now = int(now if now is not None else time.time())
+        counts = {}
+        try:
+            with self.pool.transaction(immediate=True) as conn:
+                for tier in self.tiers:
+                    cursor = conn.execute(
+                        "DELETE FROM metric_rollups WHERE resolution = ? AND bucket_ts < ?",
+                        (tier.resolution, now - tier.retention_days * SECONDS_PER_DAY)
+                    )
+                    counts[tier.name] = cursor.rowcount
+        except sqlite3.Error as e:
+            raise DatabaseError(str(e), operation="rollup retention")
+        return counts
+    
+    # ==================== Reads ====================
+    
+    def select_tier(self, span_seconds: int) -> Optional[RollupTier]:
+        """
+        Pick the storage level for a range read.
+        
+        Returns None when raw samples fit within max_points, otherwise
+        the finest tier that does (and that retains the whole span).
+        Falls back to the coarsest tier.
+        """
+        if span_seconds / self.raw_interval <= self.max_points:
+            return None
+        
+        for tier in self.tiers:
+            if (span_seconds / tier.resolution <= self.max_points
+                    and span_seconds <= tier.retention_days * SECONDS_PER_DAY):
+                return tier
+        return self.tiers[-1] if self.tiers else None
+    
+    def watermark(self, series: str, tier: RollupTier) -> Optional[int]:
+        """End of the last aggregated bucket of a tier, if any."""
+        with self._lock:
+            return self._watermarks.get((series, tier.resolution))
+    
+    def _stored_watermark(self, conn: sqlite3.Connection, series: str, tier: RollupTier) -> Optional[int]:
+        """
+        Watermark as persisted, or as cached if this process is ahead.
+        
+        Readers that never call update() (the CLI, while a daemon does
+        the rolling up) have nothing cached, so the table is the source
+        of truth; it also picks up progress made by another process.
+        """
+        row = conn.execute(
+            "SELECT watermark FROM rollup_watermarks WHERE series = ? AND resolution = ?",
+            (series, tier.resolution)
+        ).fetchone()
+        cached = self.watermark(series, tier)
+        candidates = [w for w in (row[0] if row else None, cached) if w is not None]
+        return max(candidates) if candidates else None
+    
+    def query(
+        self,
+        series: str,
+        tier: RollupTier,
+        start_ts: int,
+        end_ts: int,
+        columns: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get aggregated buckets overlapping [start_ts, end_ts], oldest first.
+        
+        Buckets past the tier's watermark are aggregated on the fly from
+        raw samples so the result always reaches end_ts.
+        
+        Returns:
+            One dict per bucket with 'timestamp', 'sample_count' and,
+            per metric, its average plus '<metric>_min', '_max' and '_p95'
+        """
+        metrics = list(columns or self._series[series])
+        first_bucket = start_ts - start_ts % tier.resolution
+        buckets: Dict[int, Dict[str, Any]] = {}
+        
+        def put(bucket_ts: int, metric: str, agg: Tuple[float, float, float, float, int]) -> None:
+            entry = buckets.setdefault(bucket_ts, {'timestamp': bucket_ts, 'sample_count': 0})
+            entry[metric] = agg[2]
+            entry[f'{metric}_min'] = agg[0]
+            entry[f'{metric}_max'] = agg[1]
+            entry[f'{metric}_p95'] = agg[3]
+            entry['sample_count'] = max(entry['sample_count'], agg[4])
+        
+        try:
+            with self.pool.transaction() as conn:
+                watermark = self._stored_watermark(conn, series, tier)
+                stored_until = min(watermark, end_ts + 1) if watermark is not None else first_bucket
+                placeholders = ', '.join('?' * len(metrics))
+                for row in conn.execute(f"""
+                    SELECT metric, bucket_ts, min_value, max_value, avg_value, p95_value, sample_count
+                    FROM metric_rollups
+                    WHERE series = ? AND resolution = ? AND bucket_ts >= ? AND bucket_ts < ?
+                      AND metric IN ({placeholders})
+                """, (series, tier.resolution, first_bucket, stored_until, *metrics)):
+                    put(row['bucket_ts'], row['metric'], tuple(row)[2:])
+        except sqlite3.Error as e:
+            raise DatabaseError(str(e), operation="rollup read")
+        
+        # Tail that has not been rolled up yet
+        tail_start = max(first_bucket, stored_until)
+        if tail_start <= end_ts:
+            data = self.timeseries.query(series, tail_start, end_ts, metrics)
+            tail = self._bucketize(data.timestamps, data.columns, tier.resolution, tail_start, end_ts + 1)
+            for bucket_ts, bucket in tail.items():
+                for metric, values in bucket.items():
+                    agg = _aggregate(values)
+                    if agg:
+                        put(bucket_ts, metric, agg)
+        
+        return [buckets[ts] for ts in sorted(buckets)]
+    
+    def stats(
+        self,
+        series: str,
+        tier: RollupTier,
+        start_ts: int,
+        end_ts: int,
+        columns: Optional[Sequence[str]] = None
+    ) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Get min/max/avg/count per metric over a range from a tier.
+        
+        Same result shape as TimeSeriesStore.stats(); the averages are
+        weighted by each bucket's sample count.
+        """
+        metrics = list(columns or self._series[series])
+        acc = {name: [float('inf'), float('-inf'), 0.0, 0] for name in metrics}
+        
+        for bucket in self.query(series, tier, start_ts, end_ts, metrics):
+            for name in metrics:
+                if name not in bucket:
+                    continue
+                count = bucket['sample_count']
+                entry = acc[name]
+                entry[0] = min(entry[0], bucket[f'{name}_min'])
+                entry[1] = max(entry[1], bucket[f'{name}_max'])
+                entry[2] += bucket[name] * count
+                entry[3] += count
+        
+        return {
+            name: {
+                'min': entry[0] if entry[3] else None,
+                'max': entry[1] if entry[3] else None,
+                'avg': entry[2] / entry[3] if entry[3] else None,
+                'count': entry[3],
+            }
+            for name, entry in acc.items()
+        }
@@ -0,0 +1,509 @@
+"""
+SYSMIND Time Series Module
+
+Columnar, time-partitioned storage for numeric metric series.
+
+Samples carry integer epoch timestamps and are grouped into blocks
+of up to BLOCK_SIZE samples. Each block stores its timestamps as
+zigzag varint deltas and its values as packed float64 columns, plus
+a per-column (min, max, sum, count) summary so aggregate queries over
+fully covered blocks never decode the samples. Blocks live in one
+table per UTC day, so range queries only touch the days they span
+and retention is a DROP TABLE rather than a large DELETE.
+"""
+
+import sys
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Sequence, Set, Tuple
+
+import sqlite3
+
+from .connection import ConnectionManager
+from .errors import DatabaseError
+
+
+SECONDS_PER_DAY = 86400
+BLOCK_SIZE = 256
+FLUSH_INTERVAL = 60.0
+
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+def _pack_floats(values: Sequence[float]) -> bytes:
+    """Pack floats as little-endian float64."""
+    arr = array('d', values)
+    if not _LITTLE_ENDIAN:
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _unpack_floats(data: bytes) -> array:
+    """Unpack little-endian float64 values."""
+    arr = array('d')
+    arr.frombytes(data)
+    if not _LITTLE_ENDIAN:
+        arr.byteswap()
+    return arr
+
+
+def _encode_timestamps(base: int, timestamps: Sequence[int]) -> bytes:
+    """Encode timestamps as zigzag varint deltas, the first relative to base."""
+    out = bytearray()
+    prev = base
+    for ts in timestamps:
+        delta = ts - prev
+        prev = ts
+        value = (delta << 1) ^ (delta >> 63)  # zigzag
+        while value > 0x7F:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def _decode_timestamps(base: int, data: bytes, count: int) -> List[int]:
+    """Decode timestamps written by _encode_timestamps."""
+    timestamps: List[int] = []
+    current = base
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        current += (value >> 1) ^ -(value & 1)
+        timestamps.append(current)
+        value = 0
+        shift = 0
+    return timestamps[:count]
+
+
+def partition_day(ts: int) -> int:
+    """Partition key (days since the epoch, UTC) for a timestamp."""
+    return ts // SECONDS_PER_DAY
+
+
+def partition_table(day: int) -> str:
+    """Table name holding a day partition."""
+    return f"ts_p{day}"
+
+
+@dataclass
+class SeriesData:
+    """Result of a range query: timestamps plus one list per column."""
+    timestamps: List[int] = field(default_factory=list)
+    columns: Dict[str, List[float]] = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def rows(self) -> List[Dict[str, Any]]:
+        """Convert to a list of row dicts with a 'timestamp' key."""
+        names = list(self.columns)
+        cols = [self.columns[name] for name in names]
+        return [
+            dict(zip(names, values), timestamp=ts)
+            for ts, values in zip(self.timestamps, zip(*cols))
+        ]
+
+
+@dataclass
+class _OpenBlock:
+    """In-memory tail block of a series that is still accepting samples."""
+    day: int
+    timestamps: List[int] = field(default_factory=list)
+    values: List[List[float]] = field(default_factory=list)  # one list per column
+    row_id: Optional[int] = None  # set once the block has been persisted
+    dirty: bool = False
+    persisted_at: float = field(default_factory=time.monotonic)
+
+
+class TimeSeriesStore:
+    """
+    Partitioned columnar store on top of the shared SQLite pool.
+    
+    Series are registered with a fixed column list. Appends go to an
+    in-memory tail block that is written when it fills up, when it
+    has not been persisted for flush_interval seconds, or by flush();
+    until it fills up it is rewritten in place, so flushes do not
+    leave behind a trail of tiny blocks. Reads in the same process
+    include the unwritten tail.
+    """
+    
+    def __init__(
+        self,
+        pool: ConnectionManager,
+        block_size: int = BLOCK_SIZE,
+        flush_interval: float = FLUSH_INTERVAL
+    ):
+        """
+        Initialize time series store.
+        
+        Args:
+            pool: Connection pool of the owning Database
+            block_size: Maximum samples per block
+            flush_interval: Longest time appended samples stay unwritten
+        """
+        self.pool = pool
+        self.block_size = block_size
+        self.flush_interval = flush_interval
+        
+        self._series: Dict[str, Tuple[str, ...]] = {}
+        self._open: Dict[str, _OpenBlock] = {}
+        self._days: Optional[Set[int]] = None
+        self._lock = threading.RLock()
+    
+    # ==================== Schema ====================
+    
+    @staticmethod
+    def create_schema(cursor: sqlite3.Cursor) -> None:
+        """Create the partition catalog."""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ts_partitions (
+                day INTEGER PRIMARY KEY,
+                table_name TEXT NOT NULL,
+                created_at INTEGER
+            )
+        """)
+    
+    def register_series(self, name: str, columns: Sequence[str]) -> None:
+        """Declare a series and its value columns."""
+        self._series[name] = tuple(columns)
+    
+    def _known_days(self, conn: sqlite3.Connection) -> Set[int]:
+        """Load (once) the set of existing day partitions."""
+        if self._days is None:
+            rows = conn.execute("SELECT day FROM ts_partitions").fetchall()
+            self._days = {row[0] for row in rows}
+        return self._days
+    
+    def _ensure_partition(self, conn: sqlite3.Connection, day: int) -> str:
+        """Create the partition table for a day if it does not exist."""
+        table = partition_table(day)
+        days = self._known_days(conn)
+        if day not in days:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id INTEGER PRIMARY KEY,
+                    series TEXT NOT NULL,
+                    start_ts INTEGER NOT NULL,
+                    end_ts INTEGER NOT NULL,
+                    sample_count INTEGER NOT NULL,
+                    column_count INTEGER NOT NULL,
+                    ts_block BLOB NOT NULL,
+                    value_block BLOB NOT NULL,
+                    summary_block BLOB NOT NULL
+                )
+            """)
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_range ON {table}(series, end_ts)")
+            conn.execute(
+                "INSERT OR IGNORE INTO ts_partitions (day, table_name, created_at) VALUES (?, ?, ?)",
+                (day, table, int(time.time()))
+            )
+            days.add(day)
+        return table
+    
+    # ==================== Writes ====================
+    
+    def append(self, series: str, ts: int, values: Sequence[float]) -> None:
+        """
+        Append one sample to a series.
+        
+        Args:
+            series: Registered series name
+            ts: Epoch seconds
+            values: One value per registered column (None is stored as NaN)
+        """
+        columns = self._series[series]
+        if len(values) != len(columns):
+            raise ValueError(f"Series '{series}' expects {len(columns)} values, got {len(values)}")
+        
+        day = partition_day(ts)
+        with self._lock:
+            block = self._open.get(series)
+            if block is not None and (block.day != day or len(block.timestamps) >= self.block_size):
+                self._write_block(series, block)
+                block = None
+            
+            if block is None:
+                block = _OpenBlock(day=day, values=[[] for _ in columns])
+                self._open[series] = block
+            
+            block.timestamps.append(ts)
+            for col, value in zip(block.values, values):
+                col.append(float('nan') if value is None else float(value))
+            block.dirty = True
+            
+            if len(block.timestamps) >= self.block_size:
+                self._write_block(series, block)
+                del self._open[series]
+            elif time.monotonic() - block.persisted_at >= self.flush_interval:
+                self._write_block(series, block)
+    
+    def _write_block(self, series: str, block: _OpenBlock) -> None:
+        """Persist (insert or rewrite) a block."""
+        if not block.dirty:
+            return
+        
+        summary = []
+        for col in block.values:
+            finite = [v for v in col if v == v]  # drop NaN
+            if finite:
+                summary.extend((min(finite), max(finite), sum(finite), len(finite)))
+            else:
+                summary.extend((0.0, 0.0, 0.0, 0))
+        
+        start_ts = min(block.timestamps)  # samples may arrive out of order
+        row = (
+            series,
+            start_ts,
+            max(block.timestamps),
+            len(block.timestamps),
+            len(block.values),
+            _encode_timestamps(start_ts, block.timestamps),
+            b''.join(_pack_floats(col) for col in block.values),
+            _pack_floats(summary),
+        )
+        
+        try:
+            with self.pool.transaction(immediate=True) as conn:
+                table = self._ensure_partition(conn, block.day)
+                if block.row_id is None:
+                    cursor = conn.execute(f"""
+                        INSERT INTO {table}
+                        (series, start_ts, end_ts, sample_count, column_count,
+                         ts_block, value_block, summary_block)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """, row)
+                    block.row_id = cursor.lastrowid
+                else:
+                    conn.execute(f"""
+                        UPDATE {table} SET
+                            series = ?, start_ts = ?, end_ts = ?, sample_count = ?,
+                            column_count = ?, ts_block = ?, value_block = ?, summary_block = ?
+                        WHERE id = ?
+                    """, row + (block.row_id,))
+        except sqlite3.Error as e:
+            raise DatabaseError(str(e), operation="timeseries write")
+        
+        block.dirty = False
+        block.persisted_at = time.monotonic()
+    
+    def flush(self) -> None:
+        """Persist every open tail block (they stay open for more samples)."""
+        with self._lock:
+            for series, block in self._open.items():
+                self._write_block(series, block)
+    
+    def discard_open_blocks(self) -> None:
+        """Forget unflushed tail blocks (used after a failed transaction)."""
+        with self._lock:
+            self._open.clear()
+            self._days = None
+    
+    # ==================== Reads ====================
+    
+    def _partitions_for(self, conn: sqlite3.Connection, start_ts: int, end_ts: int) -> List[str]:
+        """Existing partition tables overlapping a time range, oldest first."""
+        # Read the catalog rather than the write-side cache so partitions
+        # created by another process (e.g. a running collector) are seen
+        rows = conn.execute(
+            "SELECT table_name FROM ts_partitions WHERE day BETWEEN ? AND ? ORDER BY day",
+            (partition_day(start_ts), partition_day(end_ts))
+        ).fetchall()
+        return [row[0] for row in rows]
+    
+    def _blocks(
+        self,
+        series: str,
+        start_ts: int,
+        end_ts: int,
+        fields: str
+    ) -> List[Tuple[str, sqlite3.Row]]:
+        """Fetch (partition table, block row) pairs overlapping a range."""
+        try:
+            with self.pool.transaction() as conn:
+                rows: List[Tuple[str, sqlite3.Row]] = []
+                for table in self._partitions_for(conn, start_ts, end_ts):
+                    for row in conn.execute(f"""
+                        SELECT id, {fields} FROM {table}
+                        WHERE series = ? AND end_ts >= ? AND start_ts <= ?
+                        ORDER BY start_ts
+                    """, (series, start_ts, end_ts)):
+                        rows.append((table, row))
+                return rows
+        except sqlite3.Error as e:
+            raise DatabaseError(str(e), operation="timeseries read")
+    
+    def _is_open_copy(self, series: str, table: str, row_id: int) -> bool:
+        """Whether a persisted block is the stored copy of the open tail block."""
+        block = self._open.get(series)
+        return (block is not None and block.row_id == row_id
+                and partition_table(block.day) == table)
+    
+    @staticmethod
+    def _decode_block(row: sqlite3.Row, column_count: int) -> Tuple[List[int], List[Sequence[float]]]:
+        """Decode a block row into timestamps and per-column values."""
+        count = row['sample_count']
+        timestamps = _decode_timestamps(row['start_ts'], row['ts_block'], count)
+        values = _unpack_floats(row['value_block'])
+        return timestamps, [values[i * count:(i + 1) * count] for i in range(column_count)]
+    
+    def query(
+        self,
+        series: str,
+        start_ts: int,
+        end_ts: int,
+        columns: Optional[Sequence[str]] = None
+    ) -> SeriesData:
+        """
+        Get samples in [start_ts, end_ts], oldest first.
+        
+        Args:
+            series: Registered series name
+            start_ts: Range start (epoch seconds, inclusive)
+            end_ts: Range end (epoch seconds, inclusive)
+            columns: Subset of columns to decode (default: all)
+        """
+        all_columns = self._series[series]
+        wanted = list(columns or all_columns)
+        indexes = [all_columns.index(name) for name in wanted]
+        
+        result = SeriesData(columns={name: [] for name in wanted})
+        
+        def add(timestamps: Sequence[int], column_values: List[Sequence[float]]) -> None:
+            for i, ts in enumerate(timestamps):
+                if start_ts <= ts <= end_ts:
+                    result.timestamps.append(ts)
+                    for name, idx in zip(wanted, indexes):
+                        result.columns[name].append(column_values[idx][i])
+        
+        with self._lock:
+            rows = self._blocks(series, start_ts, end_ts,
+                                "start_ts, sample_count, ts_block, value_block")
+            for table, row in rows:
+                if self._is_open_copy(series, table, row['id']):
+                    continue  # the in-memory copy is newer
+                add(*self._decode_block(row, len(all_columns)))
+            
+            open_block = self._open.get(series)
+            if open_block and open_block.timestamps:
+                add(open_block.timestamps, open_block.values)
+        
+        # Blocks are time-ordered within a partition; re-sort if any overlap
+        if any(b < a for a, b in zip(result.timestamps, result.timestamps[1:])):
+            order = sorted(range(len(result.timestamps)), key=result.timestamps.__getitem__)
+            result.timestamps = [result.timestamps[i] for i in order]
+            for name in wanted:
+                col = result.columns[name]
+                result.columns[name] = [col[i] for i in order]
+        
+        return result
+    
+    def stats(
+        self,
+        series: str,
+        start_ts: int,
+        end_ts: int,
+        columns: Optional[Sequence[str]] = None
+    ) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Get min/max/avg/count per column over a range.
+        
+        Blocks entirely inside the range are answered from their stored
+        summaries; only blocks straddling the range edges are decoded.
+        """
+        all_columns = self._series[series]
+        wanted = list(columns or all_columns)
+        acc = {name: [float('inf'), float('-inf'), 0.0, 0] for name in wanted}
+        
+        def merge(name: str, lo: float, hi: float, total: float, count: int) -> None:
+            if count:
+                entry = acc[name]
+                entry[0] = min(entry[0], lo)
+                entry[1] = max(entry[1], hi)
+                entry[2] += total
+                entry[3] += count
+        
+        def merge_samples(timestamps: Sequence[int], column_values: List[Sequence[float]]) -> None:
+            in_range = [i for i, ts in enumerate(timestamps) if start_ts <= ts <= end_ts]
+            for name in wanted:
+                col = column_values[all_columns.index(name)]
+                values = [col[i] for i in in_range if col[i] == col[i]]  # skip NaN
+                if values:
+                    merge(name, min(values), max(values), sum(values), len(values))
+        
+        with self._lock:
+            rows = self._blocks(series, start_ts, end_ts, "start_ts, end_ts, summary_block")
+            straddling: List[Tuple[str, int]] = []
+            
+            for table, row in rows:
+                if self._is_open_copy(series, table, row['id']):
+                    continue
+                if row['start_ts'] >= start_ts and row['end_ts'] <= end_ts:
+                    summary = _unpack_floats(row['summary_block'])
+                    for name in wanted:
+                        i = all_columns.index(name) * 4
+                        merge(name, summary[i], summary[i + 1], summary[i + 2], int(summary[i + 3]))
+                else:
+                    straddling.append((table, row['id']))
+            
+            if straddling:
+                try:
+                    with self.pool.transaction() as conn:
+                        for table, row_id in straddling:
+                            row = conn.execute(f"""
+                                SELECT start_ts, sample_count, ts_block, value_block
+                                FROM {table} WHERE id = ?
+                            """, (row_id,)).fetchone()
+                            if row:
+                                merge_samples(*self._decode_block(row, len(all_columns)))
+                except sqlite3.Error as e:
+                    raise DatabaseError(str(e), operation="timeseries read")
+            
+            open_block = self._open.get(series)
+            if open_block and open_block.timestamps:
+                merge_samples(open_block.timestamps, open_block.values)
+        
+        return {
+            name: {
+                'min': entry[0] if entry[3] else None,
+                'max': entry[1] if entry[3] else None,
+                'avg': entry[2] / entry[3] if entry[3] else None,
+                'count': entry[3],
+            }
+            for name, entry in acc.items()
+        }
+    
+    # ==================== Retention ====================
+    
+    def drop_partitions_before(self, cutoff_ts: int) -> int:
+        """
+        Drop every day partition that ends before cutoff_ts.
+        
+        Returns:
+            Number of partitions dropped
+        """
+        cutoff_day = partition_day(cutoff_ts)
+        try:
+            with self._lock, self.pool.transaction(immediate=True) as conn:
+                old_days = sorted(day for day in self._known_days(conn) if day < cutoff_day)
+                for day in old_days:
+                    conn.execute(f"DROP TABLE IF EXISTS {partition_table(day)}")
+                    conn.execute("DELETE FROM ts_partitions WHERE day = ?", (day,))
+                    self._days.discard(day)
+                for series, block in list(self._open.items()):
+                    if block.day < cutoff_day:
+                        del self._open[series]
+                return len(old_days)
+        except sqlite3.Error as e:
+            raise DatabaseError(str(e), operation="timeseries retention")
+    
+    def partition_count(self) -> int:
+        """Number of day partitions on disk."""
+        with self.pool.transaction() as conn:
+            return len(self._known_days(conn))
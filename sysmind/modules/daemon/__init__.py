@@ -0,0 +1 @@
+"""Daemon module: background collectors and local socket API."""
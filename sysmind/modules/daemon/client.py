@@ -0,0 +1,157 @@
+"""
+SYSMIND Daemon Client Module
+
+Client side of the daemon's Unix socket API.
+
+Requests and replies are single JSON objects, one per line:
+
+    {"method": "snapshot", "params": {}}
+    {"ok": true, "result": {...}}
+
+This module imports no collectors, so a CLI command can ask a
+running daemon for data at the cost of one connect() and fall back
+to collecting it itself when no daemon is listening.
+"""
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ...core.config import Config
+from ...core.errors import DaemonError
+
+
+SOCKET_NAME = 'daemon.sock'
+DEFAULT_TIMEOUT = 5.0
+
+# Set to make CLI commands ignore a running daemon
+NO_DAEMON_ENV = 'SYSMIND_NO_DAEMON'
+SOCKET_ENV = 'SYSMIND_SOCKET'
+
+
+def default_socket_path() -> Path:
+    """Socket path: $SYSMIND_SOCKET, else daemon.sock in the data directory."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(os.path.expanduser(override))
+    return Config().data_dir / SOCKET_NAME
+
+
+class DaemonClient:
+    """
+    JSON-lines connection to a running sysmind daemon.
+    
+    One connection can carry any number of calls; use it as a context
+    manager or call close().
+    """
+    
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        timeout: float = DEFAULT_TIMEOUT
+    ):
+        """
+        Initialize daemon client.
+        
+        Args:
+            path: Socket path (default_socket_path() if not given)
+            timeout: Seconds to wait for connect and for each reply
+        """
+        self.path = Path(path) if path else default_socket_path()
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+    
+    @classmethod
+    def connect_if_running(cls, path: Optional[Union[str, Path]] = None) -> Optional['DaemonClient']:
+        """
+        Connect to the daemon if one is listening.
+        
+        Returns:
+            Connected client, or None if there is no daemon (or the
+            SYSMIND_NO_DAEMON environment variable is set)
+        """
+        if os.environ.get(NO_DAEMON_ENV) or not hasattr(socket, 'AF_UNIX'):
+            return None
+        
+        client = cls(path)
+        if not client.path.exists():
+            return None
+        try:
+            client.connect()
+        except DaemonError:
+            return None
+        return client
+    
+    def connect(self) -> None:
+        """
+        Open the connection.
+        
+        Raises:
+            DaemonError: If no daemon is listening on the socket
+        """
+        if self._sock is not None:
+            return
+        if not hasattr(socket, 'AF_UNIX'):
+            raise DaemonError("Unix domain sockets are not supported on this platform")
+        
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.path))
+        except OSError as e:
+            sock.close()
+            raise DaemonError(f"Daemon not reachable at {self.path}: {e.strerror or e}")
+        
+        self._sock = sock
+        self._reader = sock.makefile('rb')
+    
+    def call(self, method: str, **params: Any) -> Any:
+        """
+        Call a daemon method.
+        
+        Args:
+            method: Method name (see SysmindDaemon.METHODS)
+            **params: Method parameters
+        
+        Returns:
+            The method's result
+        
+        Raises:
+            DaemonError: If the connection fails or the method failed
+        """
+        self.connect()
+        request = json.dumps({'method': method, 'params': params}) + '\n'
+        try:
+            self._sock.sendall(request.encode('utf-8'))
+            line = self._reader.readline()
+        except OSError as e:
+            self.close()
+            raise DaemonError(f"Daemon connection failed: {e}")
+        
+        if not line:
+            self.close()
+            raise DaemonError("Daemon closed the connection")
+        
+        reply = json.loads(line)
+        if not reply.get('ok'):
+            raise DaemonError(reply.get('error') or f"Daemon call '{method}' failed")
+        return reply.get('result')
+    
+    def close(self) -> None:
+        """Close the connection."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+    
+    def __enter__(self) -> 'DaemonClient':
+        self.connect()
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
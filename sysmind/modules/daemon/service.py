@@ -0,0 +1,428 @@
+"""
+SYSMIND Daemon Service Module
+
+Long-running collector process behind a local Unix socket.
+
+The daemon samples CPU, memory and network rates every interval,
+refreshes the process list and health score on slower cadences, runs
+the anomaly detector on every sample and keeps the process watchdog
+running. Results are held in memory and served to clients (see
+client.py) as JSON lines, so a CLI command answered by the daemon
+reads no /proc files at all.
+"""
+
+import json
+import os
+import signal
+import socketserver
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, replace
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .client import DaemonClient, default_socket_path
+from ..intelligence.anomaly import AnomalyDetector
+from ..intelligence.context import SystemContext
+from ..intelligence.health import HealthScorer
+from ..process.manager import ProcessInfo
+from ..process.watchdog import ProcessWatchdog, WatchdogAlert
+from ...core.database import Database
+from ...core.errors import DaemonError, SysmindError
+from ...core.metric_writer import MetricWriter
+from ...core.retention import RetentionWorker
+from ...utils.logger import get_logger
+
+
+logger = get_logger('sysmind.daemon')
+
+DEFAULT_INTERVAL = 2.0
+DEFAULT_PROCESS_INTERVAL = 5.0
+DEFAULT_HEALTH_INTERVAL = 30.0
+HISTORY_SECONDS = 3600
+MAX_ANOMALIES = 200
+MAX_REQUEST_BYTES = 64 * 1024
+
+# Sort keys for the 'processes' method, descending like ProcessManager.list_processes
+PROCESS_SORT_KEYS = {
+    'cpu': lambda p: p.cpu_percent,
+    'memory': lambda p: p.memory_rss,
+    'name': lambda p: p.name.lower(),
+    'pid': lambda p: p.pid,
+}
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize the non-JSON types found in collector dataclasses."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """One client connection: a JSON request per line, a JSON reply per line."""
+    
+    def handle(self):
+        service = self.server.service
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES)
+            if not line:
+                break
+            self.wfile.write(service.handle_request(line))
+            self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    
+    def __init__(self, path: str, service: 'SysmindDaemon'):
+        self.service = service
+        super().__init__(path, _RequestHandler)
+
+
+class SysmindDaemon:
+    """
+    Background collectors with a JSON-lines socket API.
+    
+    run() blocks until stop() is called, a client sends 'stop', or
+    the process gets SIGTERM/SIGINT.
+    """
+    
+    METHODS = (
+        'ping', 'snapshot', 'history', 'processes', 'health',
+        'overview', 'alerts', 'anomalies', 'anomaly_summary', 'stop',
+    )
+    
+    def __init__(
+        self,
+        database: Optional[Database] = None,
+        socket_path: Optional[Union[str, Path]] = None,
+        interval: float = DEFAULT_INTERVAL,
+        process_interval: float = DEFAULT_PROCESS_INTERVAL,
+        health_interval: float = DEFAULT_HEALTH_INTERVAL,
+        snapshot_interval: float = 300.0,
+        watchdog_interval: float = 30.0,
+        retention_days: int = 30,
+        history_seconds: float = HISTORY_SECONDS
+    ):
+        """
+        Initialize daemon.
+        
+        Args:
+            database: Database for stored snapshots, watchdog rules and
+                retention (None keeps everything in memory)
+            socket_path: Socket to listen on (default_socket_path() if not given)
+            interval: Seconds between CPU/memory/network samples
+            process_interval: Seconds between process list refreshes
+            health_interval: Seconds between health score updates
+            snapshot_interval: Seconds between snapshots written to the database
+            watchdog_interval: Watchdog threshold check interval
+            retention_days: Days of stored history to keep
+            history_seconds: Seconds of samples kept in memory
+        """
+        self.database = database
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path()
+        self.interval = interval
+        self.process_interval = process_interval
+        self.health_interval = health_interval
+        self.snapshot_interval = snapshot_interval
+        
+        # One context shared by every analyzer, refreshed by the collector loop
+        self.context = SystemContext(ttl=interval)
+        self.detector = AnomalyDetector(context=self.context)
+        self.health_scorer = HealthScorer(database, context=self.context)
+        self.watchdog = ProcessWatchdog(database, check_interval=watchdog_interval)
+        self.writer = MetricWriter(database) if database else None
+        self.retention = RetentionWorker(database, retention_days) if database else None
+        
+        self.started_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._history: deque = deque(maxlen=max(1, int(history_seconds / interval)))
+        self._processes: List[ProcessInfo] = []
+        self._health: Optional[Dict[str, Any]] = None
+        self._anomalies: deque = deque(maxlen=MAX_ANOMALIES)
+        self._due = {'processes': 0.0, 'health': 0.0, 'persist': 0.0}
+        
+        self._stop_event = threading.Event()
+        self._server: Optional[_UnixServer] = None
+        self._threads: List[threading.Thread] = []
+    
+    # ==================== Collection ====================
+    
+    def collect_once(self) -> None:
+        """Take one sample and refresh whatever is due."""
+        now = time.monotonic()
+        self.context.invalidate('snapshot')
+        snapshot = self.context.snapshot()
+        sent_rate, recv_rate = self.context.bandwidth_monitor.get_total_bandwidth()
+        snapshot.network_stats = {'bytes_sent_rate': sent_rate, 'bytes_recv_rate': recv_rate}
+        with self._lock:
+            anomalies = self.detector.analyze_snapshot()
+        
+        processes = None
+        if now >= self._due['processes']:
+            self.context.invalidate('processes')
+            processes = self.context.processes()
+            self._due['processes'] = now + self.process_interval
+        
+        health = None
+        if now >= self._due['health']:
+            health = asdict(self.health_scorer.calculate_health())
+            self._due['health'] = now + self.health_interval
+        
+        if self.writer is not None and now >= self._due['persist']:
+            cpu, mem = snapshot.cpu_metrics, snapshot.memory_metrics
+            self.writer.add_snapshot(
+                cpu.usage_percent, mem.usage_percent, mem.used, mem.total,
+                timestamp=snapshot.timestamp
+            )
+            self._due['persist'] = now + self.snapshot_interval
+        
+        sample = {
+            'timestamp': snapshot.timestamp.isoformat(),
+            'cpu_percent': snapshot.cpu_metrics.usage_percent,
+            'memory_percent': snapshot.memory_metrics.usage_percent,
+            'load_1': snapshot.cpu_metrics.load_average[0],
+            'bytes_sent_rate': sent_rate,
+            'bytes_recv_rate': recv_rate,
+        }
+        
+        with self._lock:
+            self._snapshot = snapshot.to_dict()
+            self._history.append(sample)
+            self._anomalies.extend(anomalies)
+            if processes is not None:
+                # The process table updates these rows in place on its
+                # next refresh; requests are served from copies
+                self._processes = [replace(p) for p in processes]
+            if health is not None:
+                self._health = health
+    
+    def _collect_loop(self) -> None:
+        """Sample every interval until stopped."""
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self.collect_once()
+            except (OSError, SysmindError) as e:
+                logger.warning(f"Collection failed: {e}")
+            self._stop_event.wait(max(0.0, self.interval - (time.monotonic() - started)))
+    
+    # ==================== Socket API ====================
+    
+    def handle_request(self, line: bytes) -> bytes:
+        """
+        Answer one request line.
+        
+        Args:
+            line: JSON object with 'method' and optional 'params'
+        
+        Returns:
+            JSON reply line: {"ok": true, "result": ...} or
+            {"ok": false, "error": "..."}
+        """
+        try:
+            request = json.loads(line)
+            method = request.get('method')
+            if method not in self.METHODS:
+                raise DaemonError(f"Unknown method: {method}")
+            result = getattr(self, f'api_{method}')(**(request.get('params') or {}))
+            reply = {'ok': True, 'result': result}
+        except (ValueError, TypeError, AttributeError, SysmindError) as e:
+            reply = {'ok': False, 'error': str(e)}
+        except Exception as e:
+            logger.exception(f"Daemon request failed: {line!r}")
+            reply = {'ok': False, 'error': f"Internal error: {e}"}
+        
+        return (json.dumps(reply, default=_json_default) + '\n').encode('utf-8')
+    
+    def api_ping(self) -> Dict[str, Any]:
+        """Daemon status."""
+        with self._lock:
+            samples = len(self._history)
+            processes = len(self._processes)
+        return {
+            'pid': os.getpid(),
+            'uptime': time.monotonic() - self.started_at if self.started_at else 0.0,
+            'socket': str(self.socket_path),
+            'interval': self.interval,
+            'samples': samples,
+            'processes': processes,
+            'watchdog_mode': self.watchdog.event_mode,
+            'watchdog_rules': len(self.watchdog.rules),
+        }
+    
+    def api_snapshot(self) -> Dict[str, Any]:
+        """Latest snapshot, as SystemSnapshot.to_dict()."""
+        with self._lock:
+            if self._snapshot is None:
+                raise DaemonError("No snapshot collected yet")
+            return self._snapshot
+    
+    def api_history(self, seconds: float = 300) -> List[Dict[str, Any]]:
+        """Samples from the last `seconds` seconds, oldest first."""
+        cutoff = (datetime.now() - timedelta(seconds=float(seconds))).isoformat()
+        with self._lock:
+            return [s for s in self._history if s['timestamp'] >= cutoff]
+    
+    def api_processes(self, sort: str = 'memory', limit: int = 20) -> List[Dict[str, Any]]:
+        """Processes from the last refresh, sorted by 'memory', 'cpu', 'name' or 'pid'."""
+        if sort not in PROCESS_SORT_KEYS:
+            raise DaemonError(f"Unknown sort key: {sort}")
+        with self._lock:
+            processes = self._processes
+        # Refreshes arrive sorted by memory
+        if sort != 'memory':
+            processes = sorted(processes, key=PROCESS_SORT_KEYS[sort], reverse=True)
+        return [asdict(p) for p in processes[:limit]]
+    
+    def api_health(self) -> Dict[str, Any]:
+        """Latest SystemHealth, as a dict."""
+        with self._lock:
+            if self._health is None:
+                raise DaemonError("Health score not computed yet")
+            return self._health
+    
+    def api_overview(self) -> Dict[str, Any]:
+        """CPU, memory and health summary for 'sysmind quick'."""
+        with self._lock:
+            if self._snapshot is None or self._health is None:
+                raise DaemonError("No snapshot collected yet")
+            snapshot, health = self._snapshot, self._health
+        issues = []
+        for component in health['components'].values():
+            issues.extend(component['issues'])
+        return {
+            'timestamp': snapshot['timestamp'],
+            'cpu_percent': snapshot['cpu_metrics']['usage_percent'],
+            'memory_percent': snapshot['memory_metrics']['usage_percent'],
+            'health_score': health['overall_score'],
+            'health_status': health['overall_status'],
+            'issues': issues,
+        }
+    
+    def api_alerts(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Recent watchdog alerts, newest first."""
+        return [_alert_dict(a) for a in self.watchdog.get_alerts(limit=limit)]
+    
+    def api_anomalies(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Recent anomalies, newest first."""
+        with self._lock:
+            anomalies = list(self._anomalies)[-limit:]
+        return [asdict(a) for a in reversed(anomalies)]
+    
+    def api_anomaly_summary(self) -> Dict[str, Any]:
+        """Anomaly detector sensitivity, summary and per-metric statistics."""
+        with self._lock:
+            summary = self.detector.get_anomaly_summary()
+            stats = {metric: asdict(stat) for metric, stat in self.detector.get_stats().items()}
+        return {'sensitivity': self.detector.sensitivity, 'summary': summary, 'stats': stats}
+    
+    def api_stop(self) -> bool:
+        """Ask the daemon to shut down."""
+        self.stop()
+        return True
+    
+    # ==================== Lifecycle ====================
+    
+    def _bind(self) -> _UnixServer:
+        """Bind the socket, replacing a stale one left by a crashed daemon."""
+        if self.socket_path.exists():
+            try:
+                with DaemonClient(self.socket_path, timeout=1.0) as client:
+                    pid = client.call('ping').get('pid')
+            except DaemonError:
+                pid = None
+            if pid is not None:
+                raise DaemonError(f"Daemon already running (pid {pid}) on {self.socket_path}")
+            self.socket_path.unlink()
+        
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            server = _UnixServer(str(self.socket_path), self)
+        except OSError as e:
+            raise DaemonError(f"Cannot listen on {self.socket_path}: {e}", socket_path=str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        return server
+    
+    def run(self) -> None:
+        """
+        Run until stopped.
+        
+        Raises:
+            DaemonError: If another daemon owns the socket or it cannot be bound
+        """
+        self._server = self._bind()
+        self.started_at = time.monotonic()
+        self._stop_event.clear()
+        
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, lambda *_: self.stop())
+        
+        try:
+            # First sample before serving, so no client sees an empty daemon
+            try:
+                self.collect_once()
+            except (OSError, SysmindError) as e:
+                logger.warning(f"Collection failed: {e}")
+            
+            self.watchdog.start()
+            if self.writer is not None:
+                self.writer.start()
+            if self.retention is not None:
+                self.retention.start()
+            
+            self._threads = [
+                threading.Thread(target=self._collect_loop, daemon=True),
+                threading.Thread(target=self._server.serve_forever, daemon=True),
+            ]
+            for thread in self._threads:
+                thread.start()
+            
+            logger.info(f"Daemon listening on {self.socket_path}")
+            while not self._stop_event.wait(1.0):
+                pass
+        finally:
+            self._shutdown()
+    
+    def stop(self) -> None:
+        """Signal run() to return."""
+        self._stop_event.set()
+    
+    def _shutdown(self) -> None:
+        """Stop the server and workers and remove the socket."""
+        self._stop_event.set()
+        if self._server is not None:
+            if any(t.is_alive() for t in self._threads):
+                self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for thread in self._threads:
+            thread.join(timeout=self.interval + 1)
+        self._threads = []
+        
+        try:
+            self.socket_path.unlink()
+        except OSError:
+            pass
+        
+        self.watchdog.stop()
+        if self.writer is not None:
+            self.writer.stop()
+        if self.retention is not None:
+            self.retention.stop()
+
+
+def _alert_dict(alert: WatchdogAlert) -> Dict[str, Any]:
+    """WatchdogAlert as a dict, with the process reduced to pid and name."""
+    data = asdict(alert)
+    process = data.pop('process')
+    data['pid'] = process['pid'] if process else None
+    data['process_name'] = process['name'] if process else None
+    return data
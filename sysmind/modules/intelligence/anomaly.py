@@ -10,7 +10,7 @@ from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
 from collections import deque
 
-from ..monitor.realtime import RealtimeMonitor
+from .context import SystemContext
 from ...core.database import Database
 
 
@@ -51,7 +51,8 @@ class AnomalyDetector:
         self,
         database: Optional[Database] = None,
         window_size: int = 100,
-        sensitivity: float = 2.0
+        sensitivity: float = 2.0,
+        context: Optional[SystemContext] = None
     ):
         """
         Initialize anomaly detector.
@@ -60,12 +61,14 @@ class AnomalyDetector:
             database: Optional database for persistence
             window_size: Number of samples for rolling statistics
             sensitivity: Number of standard deviations for anomaly threshold
+            context: Shared system state (pass one to reuse its data)
         """
         self.database = database
         self.window_size = window_size
         self.sensitivity = sensitivity
         
-        self.realtime = RealtimeMonitor()
+        self.context = context or SystemContext()
+        self.realtime = self.context.realtime
         
         # Rolling windows for each metric
         self._windows: Dict[str, deque] = {
@@ -168,7 +171,7 @@ class AnomalyDetector:
         Returns:
             List of detected anomalies
         """
-        snapshot = self.realtime.get_snapshot()
+        snapshot = self.context.snapshot()
         anomalies = []
         
         # Check CPU
@@ -211,6 +214,8 @@ class AnomalyDetector:
         start_time = time.time()
         
         while (time.time() - start_time) < duration:
+            # Every sample must be fresh, whatever the context TTL
+            self.context.invalidate('snapshot')
             anomalies = self.analyze_snapshot()
             
             if anomalies:
@@ -0,0 +1,109 @@
+"""
+SYSMIND System Context Module
+
+Shared, short-lived cache of system state for the analyzers.
+
+Health scoring, recommendations, anomaly detection and correlation
+all look at the same snapshot, process list, partitions and interface
+counters. A SystemContext collects each of these at most once per TTL
+and hands the same data to every analyzer it is passed to, so one
+command walks /proc once instead of once per analyzer.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..monitor.realtime import RealtimeMonitor, SystemSnapshot
+from ..process.manager import ProcessManager, ProcessInfo
+from ..disk.analyzer import DiskAnalyzer
+from ..network.bandwidth import BandwidthMonitor, InterfaceStats
+
+
+class SystemContext:
+    """
+    Per-invocation cache of system state.
+    
+    Each kind of data is collected on first access and reused until
+    it is older than ttl seconds (or invalidate() is called).
+    """
+    
+    def __init__(
+        self,
+        ttl: float = 2.0,
+        realtime: Optional[RealtimeMonitor] = None,
+        process_manager: Optional[ProcessManager] = None,
+        disk_analyzer: Optional[DiskAnalyzer] = None,
+        bandwidth_monitor: Optional[BandwidthMonitor] = None
+    ):
+        """
+        Initialize system context.
+        
+        Args:
+            ttl: Seconds collected data stays valid
+            realtime: Snapshot source (created if not given)
+            process_manager: Process source (created if not given)
+            disk_analyzer: Partition source (created if not given)
+            bandwidth_monitor: Interface counter source (created if not given)
+        """
+        self.ttl = ttl
+        self.realtime = realtime or RealtimeMonitor()
+        # The analyzers never show usernames, so don't resolve them
+        self.process_manager = process_manager or ProcessManager(resolve_usernames=False)
+        self.disk_analyzer = disk_analyzer or DiskAnalyzer()
+        self.bandwidth_monitor = bandwidth_monitor or BandwidthMonitor()
+        
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.RLock()
+    
+    def _get(self, key: str, collect: Callable[[], Any]) -> Any:
+        """Return cached data for key, collecting it if missing or stale."""
+        with self._lock:
+            entry = self._cache.get(key)
+            now = time.monotonic()
+            if entry is None or now - entry[0] > self.ttl:
+                entry = (now, collect())
+                self._cache[key] = entry
+            return entry[1]
+    
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop cached data so the next access collects it again.
+        
+        Args:
+            key: One of 'snapshot', 'processes', 'partitions',
+                'interfaces'; None drops everything
+        """
+        with self._lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
+    
+    def snapshot(self) -> SystemSnapshot:
+        """Get the CPU/memory snapshot."""
+        return self._get('snapshot', self.realtime.get_snapshot)
+    
+    def processes(self) -> List[ProcessInfo]:
+        """Get all processes, sorted by memory (largest first)."""
+        return self._get('processes', self.process_manager.list_processes)
+    
+    def top_processes(self, by: str = 'memory', n: int = 10) -> List[ProcessInfo]:
+        """
+        Get the top N processes from the cached list.
+        
+        Args:
+            by: 'memory' or 'cpu'
+            n: Number of processes to return
+        """
+        if by == 'cpu':
+            return sorted(self.processes(), key=lambda p: p.cpu_percent, reverse=True)[:n]
+        return self.processes()[:n]
+    
+    def partitions(self) -> List[Dict[str, Any]]:
+        """Get mounted partitions with usage."""
+        return self._get('partitions', self.disk_analyzer.list_partitions)
+    
+    def interface_stats(self) -> Dict[str, InterfaceStats]:
+        """Get network interface counters."""
+        return self._get('interfaces', self.bandwidth_monitor.get_interface_stats)
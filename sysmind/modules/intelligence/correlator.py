@@ -8,8 +8,8 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass
 
-from ..monitor.realtime import RealtimeMonitor, SystemSnapshot
-from ..process.manager import ProcessManager
+from ..monitor.realtime import SystemSnapshot
+from .context import SystemContext
 from ...core.database import Database
 
 
@@ -43,16 +43,22 @@ class MetricCorrelator:
     CPU, memory, disk, network, and process data.
     """
     
-    def __init__(self, database: Optional[Database] = None):
+    def __init__(
+        self,
+        database: Optional[Database] = None,
+        context: Optional[SystemContext] = None
+    ):
         """
         Initialize correlator.
         
         Args:
             database: Optional database for historical analysis
+            context: Shared system state (pass one to reuse its data)
         """
         self.database = database
-        self.realtime = RealtimeMonitor()
-        self.process_manager = ProcessManager()
+        self.context = context or SystemContext()
+        self.realtime = self.context.realtime
+        self.process_manager = self.context.process_manager
         
         self._events: List[CorrelationEvent] = []
         self._correlations: List[ResourceCorrelation] = []
@@ -64,15 +70,15 @@ class MetricCorrelator:
         Returns:
             CorrelationEvent with analysis results
         """
-        snapshot = self.realtime.get_snapshot()
-        processes = self.process_manager.list_processes(sort_by='memory', limit=10)
+        snapshot = self.context.snapshot()
+        processes = self.context.top_processes(by='memory', n=10)
         
         cpu = snapshot.cpu_metrics.usage_percent
         memory = snapshot.memory_metrics.usage_percent
         
         # Get top consumers
-        top_cpu = self.process_manager.get_top_processes(by='cpu', n=5)
-        top_memory = self.process_manager.get_top_processes(by='memory', n=5)
+        top_cpu = self.context.top_processes(by='cpu', n=5)
+        top_memory = self.context.top_processes(by='memory', n=5)
         
         # Determine severity
         if cpu > 90 or memory > 90:
@@ -210,7 +216,7 @@ class MetricCorrelator:
         Returns:
             List of process info with resource usage
         """
-        processes = self.process_manager.list_processes()
+        processes = self.context.processes()
         
         hogs = []
         
@@ -8,10 +8,7 @@ from datetime import datetime
 from typing import Dict, Optional, List, Any
 from dataclasses import dataclass
 
-from ..monitor.realtime import RealtimeMonitor
-from ..process.manager import ProcessManager
-from ..disk.analyzer import DiskAnalyzer
-from ..network.bandwidth import BandwidthMonitor
+from .context import SystemContext
 from .anomaly import AnomalyDetector
 from .recommender import SystemRecommender
 from ...core.database import Database
@@ -45,20 +42,26 @@ class HealthScorer:
     and process analysis into a single health score.
     """
     
-    def __init__(self, database: Optional[Database] = None):
+    def __init__(
+        self,
+        database: Optional[Database] = None,
+        context: Optional[SystemContext] = None
+    ):
         """
         Initialize health scorer.
         
         Args:
             database: Optional database for historical tracking
+            context: Shared system state (pass one to reuse its data)
         """
         self.database = database
-        self.realtime = RealtimeMonitor()
-        self.process_manager = ProcessManager()
-        self.disk_analyzer = DiskAnalyzer()
-        self.bandwidth_monitor = BandwidthMonitor()
-        self.anomaly_detector = AnomalyDetector()
-        self.recommender = SystemRecommender(database)
+        self.context = context or SystemContext()
+        self.realtime = self.context.realtime
+        self.process_manager = self.context.process_manager
+        self.disk_analyzer = self.context.disk_analyzer
+        self.bandwidth_monitor = self.context.bandwidth_monitor
+        self.anomaly_detector = AnomalyDetector(context=self.context)
+        self.recommender = SystemRecommender(database, context=self.context)
         
         # Weights for each component
         self.weights = {
@@ -84,7 +87,7 @@ class HealthScorer:
     
     def _calculate_cpu_health(self) -> HealthComponent:
         """Calculate CPU health score."""
-        snapshot = self.realtime.get_snapshot()
+        snapshot = self.context.snapshot()
         cpu = snapshot.cpu_metrics
         
         issues = []
@@ -120,7 +123,7 @@ class HealthScorer:
     
     def _calculate_memory_health(self) -> HealthComponent:
         """Calculate memory health score."""
-        snapshot = self.realtime.get_snapshot()
+        snapshot = self.context.snapshot()
         memory = snapshot.memory_metrics
         
         issues = []
@@ -157,7 +160,7 @@ class HealthScorer:
         scores = []
         
         try:
-            partitions = self.disk_analyzer.list_partitions()
+            partitions = self.context.partitions()
             
             for part in partitions:
                 # Score based on free space
@@ -189,7 +192,7 @@ class HealthScorer:
         issues = []
         score = 100
         
-        processes = self.process_manager.list_processes()
+        processes = self.context.processes()
         
         # Check for zombies
         zombies = [p for p in processes if 'zombie' in p.status.lower()]
@@ -227,7 +230,7 @@ class HealthScorer:
         
         try:
             # Check interface stats
-            stats = self.bandwidth_monitor.get_interface_stats()
+            stats = self.context.interface_stats()
             
             for name, iface in stats.items():
                 if name.startswith('lo'):
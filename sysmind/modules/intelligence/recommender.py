@@ -8,10 +8,7 @@ from datetime import datetime
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
 
-from ..monitor.realtime import RealtimeMonitor
-from ..process.manager import ProcessManager
-from ..disk.analyzer import DiskAnalyzer
-from ..network.bandwidth import BandwidthMonitor
+from .context import SystemContext
 from ...core.database import Database
 
 
@@ -38,18 +35,24 @@ class SystemRecommender:
     system configuration.
     """
     
-    def __init__(self, database: Optional[Database] = None):
+    def __init__(
+        self,
+        database: Optional[Database] = None,
+        context: Optional[SystemContext] = None
+    ):
         """
         Initialize recommender.
         
         Args:
             database: Optional database for historical analysis
+            context: Shared system state (pass one to reuse its data)
         """
         self.database = database
-        self.realtime = RealtimeMonitor()
-        self.process_manager = ProcessManager()
-        self.disk_analyzer = DiskAnalyzer()
-        self.bandwidth_monitor = BandwidthMonitor()
+        self.context = context or SystemContext()
+        self.realtime = self.context.realtime
+        self.process_manager = self.context.process_manager
+        self.disk_analyzer = self.context.disk_analyzer
+        self.bandwidth_monitor = self.context.bandwidth_monitor
     
     def get_all_recommendations(self) -> List[Recommendation]:
         """
@@ -76,12 +79,12 @@ class SystemRecommender:
         """Analyze CPU/performance issues."""
         recommendations = []
         
-        snapshot = self.realtime.get_snapshot()
+        snapshot = self.context.snapshot()
         cpu = snapshot.cpu_metrics
         
         # High CPU usage
         if cpu.usage_percent > 80:
-            top_cpu = self.process_manager.get_top_processes(by='cpu', n=3)
+            top_cpu = self.context.top_processes(by='cpu', n=3)
             process_names = [p.name for p in top_cpu]
             
             recommendations.append(Recommendation(
@@ -119,12 +122,12 @@ class SystemRecommender:
         """Analyze memory issues."""
         recommendations = []
         
-        snapshot = self.realtime.get_snapshot()
+        snapshot = self.context.snapshot()
         memory = snapshot.memory_metrics
         
         # High memory usage
         if memory.usage_percent > 85:
-            top_memory = self.process_manager.get_top_processes(by='memory', n=3)
+            top_memory = self.context.top_processes(by='memory', n=3)
             
             mem_details = []
             for p in top_memory:
@@ -164,7 +167,7 @@ class SystemRecommender:
         recommendations = []
         
         try:
-            partitions = self.disk_analyzer.list_partitions()
+            partitions = self.context.partitions()
             
             for part in partitions:
                 if part['percent'] > 85:
@@ -188,7 +191,7 @@ class SystemRecommender:
         """Analyze process-related issues."""
         recommendations = []
         
-        processes = self.process_manager.list_processes()
+        processes = self.context.processes()
         
         # Check for zombies
         zombies = [p for p in processes if 'zombie' in p.status.lower()]
@@ -6,9 +6,10 @@ CPU metrics collection and analysis.
 
 import os
 import time
+import threading
 import subprocess
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 
 from ...utils.platform_utils import is_windows, is_linux, is_macos
@@ -27,6 +28,184 @@ class CPUMetrics:
     system_time: float
     idle_time: float
     iowait_time: float
+    steal_time: float = 0.0
+    context_switch_rate: float = 0.0  # per second
+    interrupt_rate: float = 0.0  # per second
+
+
+# Per-CPU line fields of /proc/stat, in file order
+STAT_FIELDS = ('user', 'nice', 'system', 'idle', 'iowait', 'irq', 'softirq', 'steal')
+_IDLE, _IOWAIT = 3, 4
+
+
+@dataclass
+class CPUSample:
+    """One parse of /proc/stat."""
+    timestamp: float  # time.monotonic() at read time
+    total: Tuple[int, ...]  # aggregate 'cpu' line, STAT_FIELDS order
+    cores: Dict[int, Tuple[int, ...]]  # per-core lines by CPU number
+    context_switches: int
+    interrupts: int
+
+
+def parse_cpu_sample(data: bytes, timestamp: float) -> CPUSample:
+    """Parse the contents of /proc/stat."""
+    total: Tuple[int, ...] = ()
+    cores: Dict[int, Tuple[int, ...]] = {}
+    context_switches = interrupts = 0
+    
+    for line in data.split(b'\n'):
+        if line.startswith(b'cpu'):
+            parts = line.split()
+            values = tuple(int(x) for x in parts[1:9])
+            values += (0,) * (len(STAT_FIELDS) - len(values))
+            if parts[0] == b'cpu':
+                total = values
+            else:
+                cores[int(parts[0][3:])] = values
+        elif line.startswith(b'ctxt'):
+            context_switches = int(line.split()[1])
+        elif line.startswith(b'intr'):
+            # Only the total; the per-IRQ counts can be thousands of fields
+            interrupts = int(line.split(None, 2)[1])
+    
+    return CPUSample(timestamp, total, cores, context_switches, interrupts)
+
+
+def read_cpu_sample(path: str = '/proc/stat') -> Optional[CPUSample]:
+    """Read and parse /proc/stat in a single read."""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    
+    sample = parse_cpu_sample(data, time.monotonic())
+    return sample if sample.total else None
+
+
+def cpu_breakdown(prev: Tuple[int, ...], curr: Tuple[int, ...]) -> Tuple[float, float, float, float, float, float]:
+    """
+    Split the time between two /proc/stat lines into percentages.
+    
+    Returns:
+        (usage, user, system, idle, iowait, steal); iowait counts as idle
+        for usage, and nice is included in user, irq/softirq in system
+    """
+    d = [c - p for p, c in zip(prev, curr)]
+    total = sum(d)
+    if total <= 0:
+        return (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    
+    scale = 100.0 / total
+    return (
+        (total - d[_IDLE] - d[_IOWAIT]) * scale,
+        (d[0] + d[1]) * scale,
+        (d[2] + d[5] + d[6]) * scale,
+        d[_IDLE] * scale,
+        d[_IOWAIT] * scale,
+        d[7] * scale,
+    )
+
+
+class CPUSampler:
+    """
+    Process-wide record of recent /proc/stat samples.
+    
+    Usage needs two samples some time apart. Instead of every new
+    CPUMonitor sleeping to get its own pair, monitors record each
+    sample they take here and a fresh monitor computes its first
+    delta against a recent sample someone else already took.
+    """
+    
+    def __init__(self, min_interval: float = 0.05, history: int = 4):
+        """
+        Initialize CPU sampler.
+        
+        Args:
+            min_interval: Minimum age of a reference sample, in seconds;
+                shorter intervals give too few ticks for a usable delta
+            history: Number of recent samples kept
+        """
+        self.min_interval = min_interval
+        self.history = history
+        
+        self._samples: List[CPUSample] = []  # oldest first
+        self._lock = threading.Lock()
+        self._warm_up: Optional[threading.Thread] = None
+    
+    def record(self, sample: CPUSample) -> None:
+        """Remember a sample taken by any consumer."""
+        with self._lock:
+            self._samples.append(sample)
+            if len(self._samples) > self.history:
+                # Keep the oldest sample: it is the fallback reference
+                # while all newer ones are too recent
+                del self._samples[1]
+    
+    def sample(self) -> Optional[CPUSample]:
+        """Read /proc/stat now and record the result."""
+        sample = read_cpu_sample()
+        if sample is not None:
+            self.record(sample)
+        return sample
+    
+    def reference(self, now: Optional[float] = None) -> Optional[CPUSample]:
+        """Newest recorded sample at least min_interval older than now."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            for sample in reversed(self._samples):
+                if now - sample.timestamp >= self.min_interval:
+                    return sample
+        return None
+    
+    def warm_up(self, interval: float = 0.1) -> None:
+        """
+        Start priming in the background.
+        
+        Takes a sample now and another after interval, so monitors
+        created later in the same command find a reference without
+        waiting. Call early when a command builds several monitors.
+        """
+        if not is_linux():
+            return
+        
+        with self._lock:
+            if self._warm_up is not None and self._warm_up.is_alive():
+                return
+            
+            def prime():
+                self.sample()
+                time.sleep(interval)
+                self.sample()
+            
+            self._warm_up = threading.Thread(target=prime, daemon=True)
+            self._warm_up.start()
+    
+    def wait_for_reference(self, timeout: float = 0.2) -> Optional[CPUSample]:
+        """
+        Get a reference sample, warming up first if there is none.
+        
+        Blocks for at most one warm-up per process; every later caller
+        finds a reference immediately.
+        """
+        reference = self.reference()
+        if reference is not None:
+            return reference
+        
+        self.warm_up()
+        warm_up = self._warm_up
+        if warm_up is not None:
+            warm_up.join(timeout)
+        return self.reference()
+
+
+_shared_sampler = CPUSampler()
+
+
+def get_cpu_sampler() -> CPUSampler:
+    """Get the process-wide CPU sampler."""
+    return _shared_sampler
 
 
 class CPUMonitor:
@@ -37,8 +216,15 @@ class CPUMonitor:
     for systems where /proc isn't available.
     """
     
-    def __init__(self):
-        self._prev_stats = None
+    def __init__(self, sampler: Optional[CPUSampler] = None):
+        """
+        Initialize CPU monitor.
+        
+        Args:
+            sampler: Sampler shared between monitors (default: process-wide)
+        """
+        self.sampler = sampler or get_cpu_sampler()
+        self._prev_sample: Optional[CPUSample] = None
         self._prev_time = None
     
     def get_core_count(self) -> int:
@@ -57,75 +243,35 @@ class CPUMonitor:
         
         return (0.0, 0.0, 0.0)
     
-    def _read_proc_stat(self) -> Optional[dict]:
-        """Read CPU stats from /proc/stat on Linux."""
-        if not is_linux():
-            return None
+    def _advance(self) -> Optional[Tuple[CPUSample, CPUSample]]:
+        """
+        Take a new /proc/stat sample (Linux only).
         
-        try:
-            with open('/proc/stat', 'r') as f:
-                lines = f.readlines()
-            
-            stats = {}
-            for line in lines:
-                if line.startswith('cpu'):
-                    parts = line.split()
-                    cpu_name = parts[0]
-                    
-                    # cpu stats: user nice system idle iowait irq softirq steal
-                    values = [int(x) for x in parts[1:9]]
-                    if len(values) >= 8:
-                        stats[cpu_name] = {
-                            'user': values[0],
-                            'nice': values[1],
-                            'system': values[2],
-                            'idle': values[3],
-                            'iowait': values[4],
-                            'irq': values[5],
-                            'softirq': values[6],
-                            'steal': values[7] if len(values) > 7 else 0,
-                        }
-                elif line.startswith('ctxt'):
-                    stats['context_switches'] = int(line.split()[1])
-                elif line.startswith('intr'):
-                    stats['interrupts'] = int(line.split()[1])
-            
-            return stats
-        except:
+        Returns:
+            (previous, current) samples that all metrics of this tick
+            are derived from, or None if /proc/stat is unavailable
+        """
+        if not is_linux():
             return None
-    
-    def _calculate_usage(self, prev: dict, curr: dict) -> float:
-        """Calculate CPU usage percentage from two stat snapshots."""
-        prev_idle = prev['idle'] + prev.get('iowait', 0)
-        curr_idle = curr['idle'] + curr.get('iowait', 0)
         
-        prev_total = sum(prev.values())
-        curr_total = sum(curr.values())
+        prev = self._prev_sample
+        if prev is None:
+            # First call - compare against a sample another consumer took
+            prev = self.sampler.wait_for_reference()
         
-        total_diff = curr_total - prev_total
-        idle_diff = curr_idle - prev_idle
-        
-        if total_diff == 0:
-            return 0.0
+        curr = self.sampler.sample()
+        if curr is None:
+            return None
         
-        return ((total_diff - idle_diff) / total_diff) * 100
+        self._prev_sample = curr
+        return (prev or curr), curr
     
     def get_usage_percent(self) -> float:
         """Get overall CPU usage percentage."""
-        if is_linux():
-            stats = self._read_proc_stat()
-            if stats and 'cpu' in stats:
-                if self._prev_stats and 'cpu' in self._prev_stats:
-                    usage = self._calculate_usage(self._prev_stats['cpu'], stats['cpu'])
-                else:
-                    # First call - need to wait and sample again
-                    self._prev_stats = stats
-                    time.sleep(0.1)
-                    stats = self._read_proc_stat()
-                    usage = self._calculate_usage(self._prev_stats['cpu'], stats['cpu'])
-                
-                self._prev_stats = stats
-                return usage
+        pair = self._advance()
+        if pair:
+            prev, curr = pair
+            return cpu_breakdown(prev.total, curr.total)[0]
         
         if is_windows():
             return self._get_windows_cpu_usage()
@@ -176,63 +322,65 @@ class CPUMonitor:
         
         return 0.0
     
+    @staticmethod
+    def _core_usages(prev: CPUSample, curr: CPUSample) -> List[float]:
+        """Per-core usage between two samples (0.0 for cores that just came online)."""
+        return [
+            cpu_breakdown(prev.cores[cpu], values)[0] if cpu in prev.cores else 0.0
+            for cpu, values in sorted(curr.cores.items())
+        ]
+    
     def get_core_usages(self) -> List[float]:
         """Get per-core CPU usage percentages."""
-        core_count = self.get_core_count()
-        
-        if is_linux():
-            stats = self._read_proc_stat()
-            if stats:
-                usages = []
-                for i in range(core_count):
-                    cpu_key = f'cpu{i}'
-                    if cpu_key in stats:
-                        if self._prev_stats and cpu_key in self._prev_stats:
-                            usage = self._calculate_usage(
-                                self._prev_stats[cpu_key], 
-                                stats[cpu_key]
-                            )
-                        else:
-                            usage = 0.0
-                        usages.append(usage)
-                
-                if usages:
-                    return usages
+        pair = self._advance()
+        if pair:
+            usages = self._core_usages(*pair)
+            if usages:
+                return usages
         
         # Fallback - approximate from overall usage
         overall = self.get_usage_percent()
-        return [overall] * core_count
+        return [overall] * self.get_core_count()
     
     def get_metrics(self) -> CPUMetrics:
-        """Get comprehensive CPU metrics."""
-        stats = self._read_proc_stat() if is_linux() else None
-        
-        core_usages = self.get_core_usages()
-        
-        # Extract timing info from stats
-        user_time = 0.0
-        system_time = 0.0
-        idle_time = 0.0
-        iowait_time = 0.0
-        
-        if stats and 'cpu' in stats:
-            cpu = stats['cpu']
-            total = sum(cpu.values())
-            if total > 0:
-                user_time = (cpu['user'] + cpu['nice']) / total * 100
-                system_time = (cpu['system'] + cpu.get('irq', 0) + cpu.get('softirq', 0)) / total * 100
-                idle_time = cpu['idle'] / total * 100
-                iowait_time = cpu.get('iowait', 0) / total * 100
+        """
+        Get comprehensive CPU metrics.
+        
+        On Linux every field is derived from the same pair of
+        /proc/stat samples, so one call costs one read of the file.
+        """
+        pair = self._advance()
+        if pair is None:
+            usage = self.get_usage_percent()
+            return CPUMetrics(
+                usage_percent=usage,
+                core_count=self.get_core_count(),
+                core_usages=[usage] * self.get_core_count(),
+                load_average=self.get_load_average(),
+                context_switches=0,
+                interrupts=0,
+                user_time=0.0,
+                system_time=0.0,
+                idle_time=0.0,
+                iowait_time=0.0
+            )
+        
+        prev, curr = pair
+        usage, user, system, idle, iowait, steal = cpu_breakdown(prev.total, curr.total)
+        elapsed = curr.timestamp - prev.timestamp
         
         return CPUMetrics(
-            usage_percent=self.get_usage_percent(),
+            usage_percent=usage,
             core_count=self.get_core_count(),
-            core_usages=core_usages,
+            core_usages=self._core_usages(prev, curr) or [usage] * self.get_core_count(),
             load_average=self.get_load_average(),
-            context_switches=stats.get('context_switches', 0) if stats else 0,
-            interrupts=stats.get('interrupts', 0) if stats else 0,
-            user_time=user_time,
-            system_time=system_time,
-            idle_time=idle_time,
-            iowait_time=iowait_time
+            context_switches=curr.context_switches,
+            interrupts=curr.interrupts,
+            user_time=user,
+            system_time=system,
+            idle_time=idle,
+            iowait_time=iowait,
+            steal_time=steal,
+            context_switch_rate=(curr.context_switches - prev.context_switches) / elapsed if elapsed > 0 else 0.0,
+            interrupt_rate=(curr.interrupts - prev.interrupts) / elapsed if elapsed > 0 else 0.0
         )
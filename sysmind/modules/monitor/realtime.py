@@ -10,11 +10,12 @@ import time
 import threading
 from datetime import datetime
 from typing import Callable, Optional, Dict, Any, List
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 
 from .cpu import CPUMonitor, CPUMetrics
 from .memory import MemoryMonitor, MemoryMetrics
 from ...core.database import Database
+from ...core.metric_writer import MetricWriter
 from ...utils.formatters import Formatter, Colors
 
 
@@ -26,6 +27,25 @@ class SystemSnapshot:
     memory_metrics: MemoryMetrics
     disk_usage: Optional[Dict[str, Any]] = None
     network_stats: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to plain JSON-compatible data."""
+        data = asdict(self)
+        data['timestamp'] = self.timestamp.isoformat()
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SystemSnapshot':
+        """Rebuild a snapshot from to_dict() output."""
+        cpu = dict(data['cpu_metrics'])
+        cpu['load_average'] = tuple(cpu['load_average'])
+        return cls(
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            cpu_metrics=CPUMetrics(**cpu),
+            memory_metrics=MemoryMetrics(**data['memory_metrics']),
+            disk_usage=data.get('disk_usage'),
+            network_stats=data.get('network_stats')
+        )
 
 
 class RealtimeMonitor:
@@ -57,6 +77,11 @@ class RealtimeMonitor:
         self.cpu_monitor = CPUMonitor()
         self.memory_monitor = MemoryMonitor()
         
+        # Snapshots are buffered and written in batches
+        self._writer: Optional[MetricWriter] = None
+        if database and persist_snapshots:
+            self._writer = MetricWriter(database)
+        
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._callback: Optional[Callable[[SystemSnapshot], None]] = None
@@ -83,7 +108,7 @@ class RealtimeMonitor:
                     self._history.pop(0)
                 
                 # Persist if enabled
-                if self.persist_snapshots and self.database:
+                if self._writer:
                     self._save_snapshot(snapshot)
                 
                 # Callback if set
@@ -96,15 +121,15 @@ class RealtimeMonitor:
             time.sleep(self.interval)
     
     def _save_snapshot(self, snapshot: SystemSnapshot):
-        """Save snapshot to database."""
-        if self.database:
-            self.database.save_system_snapshot(
-                timestamp=snapshot.timestamp,
+        """Queue snapshot for persistence."""
+        if self._writer:
+            mem = snapshot.memory_metrics
+            self._writer.add_snapshot(
                 cpu_percent=snapshot.cpu_metrics.usage_percent,
-                memory_percent=snapshot.memory_metrics.usage_percent,
-                disk_percent=0.0,  # Will be added with disk module
-                network_bytes_sent=0,
-                network_bytes_recv=0
+                memory_percent=mem.usage_percent,
+                memory_used_bytes=mem.used,
+                memory_total_bytes=mem.total,
+                timestamp=snapshot.timestamp
             )
     
     def start(self, callback: Optional[Callable[[SystemSnapshot], None]] = None):
@@ -128,6 +153,9 @@ class RealtimeMonitor:
         if self._thread:
             self._thread.join(timeout=2.0)
             self._thread = None
+        
+        if self._writer:
+            self._writer.flush()
     
     def get_history(self) -> List[SystemSnapshot]:
         """Get recent snapshot history."""
@@ -0,0 +1,326 @@
+"""
+SYSMIND Process Events Module
+
+Process start, exec and exit notifications.
+
+On Linux the kernel's process connector multicasts fork, exec and
+exit events over netlink the moment they happen, so a listener learns
+about a crashed daemon within milliseconds without scanning /proc.
+Subscribing needs CAP_NET_ADMIN; without it ProcessEventSource falls
+back to diffing a ProcessTable every poll interval.
+"""
+
+import errno
+import os
+import select
+import socket
+import struct
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .manager import ProcessTable, ProcessInfo
+from ...utils.platform_utils import is_linux
+
+
+# linux/netlink.h, linux/connector.h and linux/cn_proc.h
+NETLINK_CONNECTOR = 11
+NLMSG_DONE = 3
+CN_IDX_PROC = 1
+CN_VAL_PROC = 1
+PROC_CN_MCAST_LISTEN = 1
+PROC_CN_MCAST_IGNORE = 2
+
+PROC_EVENT_NONE = 0x00000000  # subscription ack
+PROC_EVENT_FORK = 0x00000001
+PROC_EVENT_EXEC = 0x00000002
+PROC_EVENT_COMM = 0x00000200
+PROC_EVENT_EXIT = 0x80000000
+
+NLMSG_HEADER = struct.Struct('=IHHII')  # len, type, flags, seq, pid
+CN_MSG_HEADER = struct.Struct('=IIIIHH')  # idx, val, seq, ack, len, flags
+PROC_EVENT_HEADER = struct.Struct('=IIQ')  # what, cpu, timestamp_ns
+FORK_EVENT = struct.Struct('=IIII')  # parent pid/tgid, child pid/tgid
+PID_TGID = struct.Struct('=II')  # exec, comm and exit start with pid/tgid
+ACK_EVENT = struct.Struct('=I')  # err
+
+EVENT_HEADER_SIZE = NLMSG_HEADER.size + CN_MSG_HEADER.size + PROC_EVENT_HEADER.size
+RECV_BUFFER_SIZE = 64 * 1024
+SOCKET_BUFFER_SIZE = 1024 * 1024
+ACK_TIMEOUT = 1.0
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+@dataclass
+class ProcEvent:
+    """A process start, exec (or rename) or exit."""
+    kind: str  # start, exec, exit, lost
+    pid: int
+    ppid: Optional[int] = None  # start only
+    timestamp: float = 0.0  # time.monotonic()
+    process: Optional[ProcessInfo] = None  # when the source already read it
+
+
+def _control_message(op: int) -> bytes:
+    """Build a PROC_CN_MCAST_LISTEN/IGNORE request."""
+    payload = ACK_EVENT.pack(op)
+    cn_msg = CN_MSG_HEADER.pack(CN_IDX_PROC, CN_VAL_PROC, 0, 0, len(payload), 0)
+    length = NLMSG_HEADER.size + len(cn_msg) + len(payload)
+    return NLMSG_HEADER.pack(length, NLMSG_DONE, 0, 0, os.getpid()) + cn_msg + payload
+
+
+def parse_proc_events(data: bytes) -> List[ProcEvent]:
+    """
+    Parse the netlink messages in one datagram from the process connector.
+    
+    Thread events are dropped: only forks that create a process, and
+    exits of a thread group leader, are reported. A subscription ack
+    is returned as kind 'ack' with the error number in pid.
+    
+    Args:
+        data: Datagram as received
+    
+    Returns:
+        List of events
+    """
+    events = []
+    offset = 0
+    while offset + EVENT_HEADER_SIZE <= len(data):
+        length = NLMSG_HEADER.unpack_from(data, offset)[0]
+        if length < EVENT_HEADER_SIZE or offset + length > len(data):
+            break
+        
+        what, _, timestamp_ns = PROC_EVENT_HEADER.unpack_from(
+            data, offset + NLMSG_HEADER.size + CN_MSG_HEADER.size
+        )
+        body = offset + EVENT_HEADER_SIZE
+        timestamp = timestamp_ns / 1e9
+        
+        if what == PROC_EVENT_FORK:
+            _, parent_tgid, child_pid, child_tgid = FORK_EVENT.unpack_from(data, body)
+            if child_pid == child_tgid:
+                events.append(ProcEvent('start', child_tgid, parent_tgid, timestamp))
+        elif what in (PROC_EVENT_EXEC, PROC_EVENT_COMM):
+            pid, tgid = PID_TGID.unpack_from(data, body)
+            if pid == tgid:
+                events.append(ProcEvent('exec', tgid, None, timestamp))
+        elif what == PROC_EVENT_EXIT:
+            pid, tgid = PID_TGID.unpack_from(data, body)
+            if pid == tgid:
+                events.append(ProcEvent('exit', tgid, None, timestamp))
+        elif what == PROC_EVENT_NONE:
+            events.append(ProcEvent('ack', ACK_EVENT.unpack_from(data, body)[0], None, timestamp))
+        
+        offset += (length + 3) & ~3
+    
+    return events
+
+
+class ProcConnector:
+    """
+    Subscription to the Linux process connector.
+    
+    Event timestamps are CLOCK_MONOTONIC, the same clock as
+    time.monotonic().
+    """
+    
+    def __init__(self):
+        self._sock: Optional[socket.socket] = None
+        self._buffer = bytearray(RECV_BUFFER_SIZE)
+    
+    def fileno(self) -> int:
+        """Socket descriptor, for use with select (-1 when closed)."""
+        return self._sock.fileno() if self._sock else -1
+    
+    def open(self) -> None:
+        """
+        Subscribe to process events.
+        
+        Raises:
+            OSError: If netlink is unavailable or the kernel refused
+                the subscription (EPERM without CAP_NET_ADMIN)
+        """
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_CONNECTOR)
+        try:
+            sock.bind((0, CN_IDX_PROC))
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            except OSError:
+                pass
+            sock.send(_control_message(PROC_CN_MCAST_LISTEN))
+            
+            # The kernel acks the request; a non-zero error means refused
+            deadline = time.monotonic() + ACK_TIMEOUT
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([sock], [], [], remaining)[0]:
+                    break
+                acks = [e for e in parse_proc_events(sock.recv(RECV_BUFFER_SIZE)) if e.kind == 'ack']
+                if acks:
+                    if acks[0].pid:
+                        raise OSError(acks[0].pid, os.strerror(acks[0].pid))
+                    break
+            
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            raise
+        
+        self._sock = sock
+    
+    def read(self, timeout: float) -> List[ProcEvent]:
+        """
+        Wait up to timeout seconds for events and return all queued ones.
+        
+        If the socket buffer overflowed and events were dropped, a
+        single 'lost' event is included; the caller should rescan.
+        
+        Raises:
+            OSError: If the socket failed
+        """
+        if not select.select([self._sock], [], [], max(0.0, timeout))[0]:
+            return []
+        
+        events = []
+        view = memoryview(self._buffer)
+        while True:
+            try:
+                size = self._sock.recv_into(self._buffer)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno != errno.ENOBUFS:
+                    raise
+                if not events or events[0].kind != 'lost':
+                    events.insert(0, ProcEvent('lost', 0, None, time.monotonic()))
+                continue
+            events.extend(e for e in parse_proc_events(view[:size]) if e.kind != 'ack')
+        return events
+    
+    def close(self) -> None:
+        """Unsubscribe and close the socket."""
+        if self._sock is None:
+            return
+        try:
+            self._sock.send(_control_message(PROC_CN_MCAST_IGNORE))
+        except OSError:
+            pass
+        self._sock.close()
+        self._sock = None
+
+
+class ProcessEventSource:
+    """
+    Process events from the process connector, or from polling.
+    
+    In 'netlink' mode events arrive as they happen and each carries
+    only a PID. In 'polling' mode a ProcessTable is refreshed every
+    poll_interval seconds; start and exec events then carry the
+    ProcessInfo that was read, and short-lived processes between two
+    polls are not seen at all.
+    """
+    
+    def __init__(self, poll_interval: float = DEFAULT_POLL_INTERVAL, use_netlink: bool = True):
+        """
+        Initialize event source.
+        
+        Args:
+            poll_interval: Seconds between scans in polling mode
+            use_netlink: Try the process connector first
+        """
+        self.poll_interval = poll_interval
+        self.use_netlink = use_netlink
+        self.mode: Optional[str] = None
+        self._connector: Optional[ProcConnector] = None
+        self._table: Optional[ProcessTable] = None
+        self._names: Dict[int, str] = {}
+        self._next_poll = 0.0
+    
+    def open(self) -> str:
+        """
+        Start listening.
+        
+        Returns:
+            'netlink' or 'polling'
+        """
+        if self.use_netlink and is_linux() and hasattr(socket, 'AF_NETLINK'):
+            connector = ProcConnector()
+            try:
+                connector.open()
+                self._connector = connector
+                self.mode = 'netlink'
+                return self.mode
+            except OSError:
+                pass
+        
+        self._start_polling()
+        return self.mode
+    
+    def _start_polling(self) -> None:
+        self._table = ProcessTable()
+        self._table.refresh()
+        self._names = {p.pid: p.name for p in self._table.processes()}
+        self._next_poll = time.monotonic() + self.poll_interval
+        self.mode = 'polling'
+    
+    def read(self, timeout: float) -> List[ProcEvent]:
+        """
+        Wait up to timeout seconds for events.
+        
+        Args:
+            timeout: Maximum seconds to block
+        
+        Returns:
+            List of events (possibly empty)
+        """
+        if self._connector is not None:
+            try:
+                return self._connector.read(timeout)
+            except OSError:
+                # Socket broke: carry on by polling, and have the caller rescan
+                self._connector.close()
+                self._connector = None
+                self._start_polling()
+                return [ProcEvent('lost', 0, None, time.monotonic())]
+        
+        if self._table is None:
+            return []
+        
+        wait = self._next_poll - time.monotonic()
+        if wait > timeout:
+            time.sleep(max(0.0, timeout))
+            return []
+        if wait > 0:
+            time.sleep(wait)
+        self._next_poll = time.monotonic() + self.poll_interval
+        
+        _, table_events = self._table.refresh()
+        now = time.monotonic()
+        # Exits first, so a reused PID ends up started rather than exited
+        events = [ProcEvent('exit', e.pid, None, now) for e in table_events if e.kind == 'exited']
+        started = set()
+        for event in table_events:
+            if event.kind == 'started':
+                started.add(event.pid)
+                events.append(ProcEvent('start', event.pid, event.process.parent_pid, now, event.process))
+        
+        # A changed name on a known PID is an exec (or rename)
+        names = {}
+        for proc in self._table.processes():
+            names[proc.pid] = proc.name
+            previous = self._names.get(proc.pid)
+            if previous is not None and previous != proc.name and proc.pid not in started:
+                events.append(ProcEvent('exec', proc.pid, None, now, proc))
+        self._names = names
+        
+        return events
+    
+    def close(self) -> None:
+        """Stop listening."""
+        if self._connector is not None:
+            self._connector.close()
+            self._connector = None
+        if self._table is not None:
+            self._table.close()
+            self._table = None
+        self.mode = None
@@ -7,12 +7,17 @@ Process listing, filtering, and management.
 import os
 import signal
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Any, Generator
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Any, Generator, Tuple, Callable
+from dataclasses import dataclass, field
 
-from ...utils.platform_utils import is_windows, is_linux, is_macos, is_admin
+from ...utils.platform_utils import (
+    is_windows, is_linux, is_macos, is_admin, get_host_constants, get_username, HostConstants
+)
 from ...core.errors import ProcessError, PermissionError
 
 
@@ -30,6 +35,430 @@ class ProcessInfo:
     command: str
     parent_pid: int
     threads: int
+    uid: Optional[int] = None
+
+
+# Single-letter /proc states to display names
+STATE_NAMES = {
+    'R': 'running',
+    'S': 'sleeping',
+    'D': 'disk-sleep',
+    'Z': 'zombie',
+    'T': 'stopped',
+    'I': 'idle',
+}
+
+# Read size for /proc/[pid]/stat and statm, which fit in one read
+PROC_READ_SIZE = 4096
+
+# Default CPU sampling window for one-shot listings, in seconds
+DEFAULT_CPU_WINDOW = 0.5
+
+# Parallel /proc scanning: PID count from which it pays off, PIDs per
+# worker thread, and the most threads used when auto-tuning
+PARALLEL_SCAN_THRESHOLD = 2000
+PIDS_PER_SCAN_WORKER = 1000
+MAX_SCAN_WORKERS = 8
+
+# Most counters a CPU sampler keeps between full scans; partial updates
+# past it evict the least recently sampled processes
+MAX_SAMPLER_ENTRIES = 8192
+
+# A process is identified by (pid, starttime) so reused PIDs stay distinct
+ProcessKey = Tuple[int, int]
+
+
+def read_proc_file(path: str, buffer: bytearray) -> Optional[bytes]:
+    """
+    Read a small /proc file with one raw read into a reused buffer.
+    
+    Args:
+        path: File to read
+        buffer: Scratch buffer, reused across calls by the same thread
+    
+    Returns:
+        File contents, or None if the file could not be read
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    
+    try:
+        size = os.readv(fd, [buffer])
+        data = memoryview(buffer)[:size].tobytes()
+        if size == len(buffer):
+            # Longer than expected (e.g. a huge comm field); read the rest
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, PROC_READ_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b''.join(chunks)
+        return data
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def split_stat(stat: bytes) -> Tuple[bytes, List[bytes]]:
+    """
+    Split /proc/[pid]/stat into the command name and the fields after it.
+    
+    The name is in parentheses and may itself contain ') ', so the
+    last ')' ends it. In the returned fields, index 0 is the state.
+    """
+    end = stat.rfind(b')')
+    return stat[stat.find(b'(') + 1:end], stat[end + 2:].split()
+
+
+def new_process_info(key: ProcessKey, comm: bytes, uid: int, host: HostConstants) -> ProcessInfo:
+    """Build a ProcessInfo with the fields that stay fixed for a process."""
+    return ProcessInfo(
+        pid=key[0],
+        name=comm.decode('utf-8', 'replace'),
+        status='unknown',
+        cpu_percent=0.0,
+        memory_percent=0.0,
+        memory_rss=0,
+        username='',
+        create_time=datetime.fromtimestamp(host.boot_time + key[1] / host.clock_ticks),
+        command='',
+        parent_pid=0,
+        threads=1,
+        uid=uid
+    )
+
+
+def update_process_info(info: ProcessInfo, fields: List[bytes], statm: bytes, host: HostConstants) -> None:
+    """Update the fields of info that change while a process runs."""
+    # statm: size resident shared ... (in pages)
+    memory_rss = int(statm.split()[1]) * host.page_size
+    info.status = STATE_NAMES.get(fields[0].decode('ascii'), 'unknown')
+    info.parent_pid = int(fields[1])
+    info.threads = int(fields[17])
+    info.memory_rss = memory_rss
+    info.memory_percent = memory_rss / host.total_memory * 100 if host.total_memory else 0.0
+
+
+def read_proc_entries(entries: List[str]) -> List[Tuple[str, bytes, bytes]]:
+    """
+    Read stat and statm for a list of /proc entries.
+    
+    Safe to run in a worker thread: it uses its own buffer, and the
+    reads release the GIL.
+    
+    Returns:
+        List of (entry, stat, statm) for processes that could be read
+    """
+    buffer = bytearray(PROC_READ_SIZE)
+    results = []
+    for entry in entries:
+        base = '/proc/' + entry
+        stat = read_proc_file(base + '/stat', buffer)
+        if stat is None:
+            continue
+        statm = read_proc_file(base + '/statm', buffer)
+        if statm is None:
+            continue
+        results.append((entry, stat, statm))
+    return results
+
+
+class ProcessCPUSampler:
+    """
+    Per-process CPU percent from utime+stime deltas between samples.
+    
+    Counters are keyed by (pid, starttime), so a reused PID never
+    inherits another process's ticks. A full scan keeps only the
+    processes it was given, which evicts dead PIDs; a partial update
+    (a few PIDs looked up directly) leaves the others alone, so callers
+    that only do partial updates should forget() PIDs that exit.
+    Past max_entries, partial updates evict the least recently sampled.
+    """
+    
+    def __init__(self, max_entries: int = MAX_SAMPLER_ENTRIES):
+        self.max_entries = max_entries
+        self._ticks: Dict[ProcessKey, Tuple[int, float]] = {}
+        self._taken: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the last full scan, or None before the first one."""
+        with self._lock:
+            if self._taken is None:
+                return None
+            return time.monotonic() - self._taken
+    
+    def __len__(self) -> int:
+        return len(self._ticks)
+    
+    def update(self, samples: Dict[ProcessKey, int], full: bool = True) -> Dict[ProcessKey, float]:
+        """
+        Record samples and compute CPU percent against the previous ones.
+        
+        A process without a previous sample (the first scan, or one that
+        started since) gets its average over its lifetime, which is what
+        ps reports and, for a new process, the exact rate so far.
+        
+        Args:
+            samples: utime+stime in clock ticks, keyed by (pid, starttime)
+            full: samples cover every process; drop the ones not in it
+        
+        Returns:
+            CPU percent keyed like samples (100 = one full core)
+        """
+        host = get_host_constants()
+        now = time.monotonic()
+        uptime = time.time() - host.boot_time
+        
+        current = {key: (ticks, now) for key, ticks in samples.items()}
+        with self._lock:
+            previous = {key: self._ticks.get(key) for key in samples}
+            if full:
+                self._ticks = current
+                self._taken = now
+            else:
+                self._ticks.update(current)
+                if len(self._ticks) > self.max_entries:
+                    self._evict_oldest()
+        
+        percents = {}
+        for key, ticks in samples.items():
+            before = previous[key]
+            if before is not None and now > before[1]:
+                percents[key] = max(0, ticks - before[0]) * 100.0 / (host.clock_ticks * (now - before[1]))
+            else:
+                lifetime = uptime - key[1] / host.clock_ticks
+                percents[key] = ticks / host.clock_ticks / lifetime * 100 if lifetime > 0 else 0.0
+        return percents
+    
+    def _evict_oldest(self) -> None:
+        """Drop the least recently sampled quarter of max_entries (lock held)."""
+        keep = self.max_entries * 3 // 4
+        newest = sorted(self._ticks.items(), key=lambda item: item[1][1], reverse=True)[:keep]
+        self._ticks = dict(newest)
+    
+    def forget(self, pid: int) -> None:
+        """Drop the samples of a PID, e.g. when it has exited."""
+        with self._lock:
+            for key in [key for key in self._ticks if key[0] == pid]:
+                del self._ticks[key]
+    
+    def reset(self) -> None:
+        """Forget all samples."""
+        with self._lock:
+            self._ticks = {}
+            self._taken = None
+
+
+@dataclass
+class ProcessTreeNode:
+    """A process in a tree, with totals over its whole subtree."""
+    process: ProcessInfo
+    depth: int
+    children: List['ProcessTreeNode'] = field(default_factory=list)
+    total_rss: int = 0
+    total_threads: int = 0
+    total_cpu: float = 0.0
+    descendant_count: int = 0
+    
+    def walk(self) -> Generator['ProcessTreeNode', None, None]:
+        """Yield this node and its (depth-limited) children, pre-order."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the subtree to nested dictionaries (e.g. for JSON)."""
+        result: Dict[str, Any] = {}
+        stack: List[Tuple['ProcessTreeNode', Optional[List[Dict[str, Any]]]]] = [(self, None)]
+        while stack:
+            node, siblings = stack.pop()
+            proc = node.process
+            entry = {
+                'pid': proc.pid,
+                'name': proc.name,
+                'status': proc.status,
+                'memory_rss': proc.memory_rss,
+                'threads': proc.threads,
+                'cpu_percent': round(proc.cpu_percent, 2),
+                'total_rss': node.total_rss,
+                'total_threads': node.total_threads,
+                'total_cpu': round(node.total_cpu, 2),
+                'descendant_count': node.descendant_count,
+                'children': [],
+            }
+            if siblings is None:
+                result = entry
+            else:
+                siblings.append(entry)
+            stack.extend((child, entry['children']) for child in reversed(node.children))
+        return result
+
+
+@dataclass
+class ProcessEvent:
+    """A process that appeared or disappeared between table refreshes."""
+    kind: str  # started, exited
+    pid: int
+    name: str
+    timestamp: datetime
+    process: ProcessInfo
+
+
+class ProcessTable:
+    """
+    Persistent Linux process table keyed by (pid, starttime).
+    
+    A refresh reads /proc/[pid]/stat and statm for every PID, but only
+    new processes are fully built (uid, name, start time). Existing
+    rows have their volatile fields (state, parent, threads, memory)
+    updated in place, so ProcessInfo objects and any command line or
+    username filled into them survive across refreshes. A reused PID
+    has a different starttime and is treated as a new process.
+    
+    On hosts with thousands of PIDs the file reads can be sharded
+    across a thread pool; parsing and merging stay on the calling
+    thread.
+    """
+    
+    def __init__(
+        self,
+        cpu_sampler: Optional[ProcessCPUSampler] = None,
+        workers: Optional[int] = None
+    ):
+        """
+        Initialize process table.
+        
+        Args:
+            cpu_sampler: If given, each refresh sets cpu_percent from it
+            workers: Reader threads per refresh; None picks a count from
+                the number of PIDs and CPUs, 1 always reads sequentially
+        """
+        self.cpu_sampler = cpu_sampler
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_workers = 0
+        self._rows: Dict[ProcessKey, ProcessInfo] = {}
+        self._comms: Dict[ProcessKey, bytes] = {}
+        self._loaded = False
+        self._callbacks: List[Callable[[ProcessEvent], None]] = []
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def on_event(self, callback: Callable[[ProcessEvent], None]) -> None:
+        """Register a callback for started/exited events."""
+        self._callbacks.append(callback)
+    
+    def processes(self) -> List[ProcessInfo]:
+        """Get the processes from the last refresh."""
+        with self._lock:
+            return list(self._rows.values())
+    
+    def scan_workers(self, pid_count: int) -> int:
+        """Number of reader threads to use for pid_count PIDs."""
+        if self.workers is not None:
+            return max(1, self.workers)
+        if pid_count < PARALLEL_SCAN_THRESHOLD:
+            return 1
+        cpus = get_host_constants().cpu_count
+        return max(1, min(MAX_SCAN_WORKERS, cpus, pid_count // PIDS_PER_SCAN_WORKER))
+    
+    def _read_all(self, entries: List[str]) -> List[Tuple[str, bytes, bytes]]:
+        """Read stat and statm for all entries, in parallel if worthwhile."""
+        workers = self.scan_workers(len(entries))
+        if workers <= 1:
+            return read_proc_entries(entries)
+        
+        if self._executor_workers < workers:
+            self.close()
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sysmind-scan')
+            self._executor_workers = workers
+        
+        size = -(-len(entries) // workers)
+        shards = [entries[i:i + size] for i in range(0, len(entries), size)]
+        return [row for shard in self._executor.map(read_proc_entries, shards) for row in shard]
+    
+    def close(self) -> None:
+        """Stop the reader threads, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._executor_workers = 0
+    
+    def refresh(self) -> Tuple[Dict[ProcessKey, int], List[ProcessEvent]]:
+        """
+        Re-scan /proc and update the table.
+        
+        The first refresh only loads the table; later ones report the
+        processes that started or exited in between.
+        
+        Returns:
+            Tuple of (utime+stime ticks keyed by (pid, starttime), events)
+        """
+        host = get_host_constants()
+        
+        with self._lock:
+            rows, comms = self._rows, self._comms
+            current: Dict[ProcessKey, ProcessInfo] = {}
+            current_comms: Dict[ProcessKey, bytes] = {}
+            samples: Dict[ProcessKey, int] = {}
+            started = []
+            
+            entries = [entry for entry in os.listdir('/proc') if entry.isdigit()]
+            
+            for entry, stat, statm in self._read_all(entries):
+                try:
+                    comm, rest = split_stat(stat)
+                    key = (int(entry), int(rest[19]))
+                    
+                    info = rows.get(key)
+                    if info is None:
+                        info = new_process_info(key, comm, os.stat('/proc/' + entry).st_uid, host)
+                        started.append(info)
+                    elif comms[key] != comm:
+                        # Same process after exec: new name and command line
+                        info.name = comm.decode('utf-8', 'replace')
+                        info.command = ''
+                    
+                    update_process_info(info, rest, statm, host)
+                    current[key] = info
+                    current_comms[key] = comm
+                    samples[key] = int(rest[11]) + int(rest[12])
+                except (OSError, ValueError, IndexError):
+                    continue
+            
+            exited = [info for key, info in rows.items() if key not in current]
+            self._rows, self._comms = current, current_comms
+            
+            if self.cpu_sampler is not None:
+                percents = self.cpu_sampler.update(samples)
+                for key, info in current.items():
+                    info.cpu_percent = percents.get(key, 0.0)
+            
+            events = []
+            if self._loaded:
+                now = datetime.now()
+                events = [ProcessEvent('started', p.pid, p.name, now, p) for p in started]
+                events.extend(ProcessEvent('exited', p.pid, p.name, now, p) for p in exited)
+            self._loaded = True
+        
+        for event in events:
+            for callback in self._callbacks:
+                try:
+                    callback(event)
+                except Exception:
+                    pass
+        
+        return samples, events
 
 
 class ProcessManager:
@@ -39,9 +468,44 @@ class ProcessManager:
     Provides cross-platform process listing, filtering, and control.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        fast: bool = True,
+        cpu_window: float = 0.0,
+        cpu_sampler: Optional[ProcessCPUSampler] = None,
+        resolve_usernames: bool = True,
+        scan_workers: Optional[int] = None
+    ):
+        """
+        Initialize process manager.
+        
+        Args:
+            fast: On Linux, keep a ProcessTable that reads only stat and
+                statm per refresh, and read command lines and usernames
+                just for returned rows
+            cpu_window: Minimum seconds of CPU sampling behind a listing.
+                A listing sooner than this after the previous scan (or
+                the first one) waits out the rest; 0 never waits, and
+                the first listing reports lifetime averages instead.
+            cpu_sampler: Shared CPU sampler (created if not given)
+            resolve_usernames: Fill in username for returned rows; if
+                False it stays empty and callers that display it use
+                get_username(proc.uid) (filtering by user still works)
+            scan_workers: Reader threads for the process table (None
+                auto-tunes from the PID count, 1 is sequential)
+        """
+        self.fast = fast
+        self.cpu_window = cpu_window
+        self.cpu_sampler = cpu_sampler or ProcessCPUSampler()
+        self.resolve_usernames = resolve_usernames
         self._process_cache: Dict[int, ProcessInfo] = {}
         self._last_refresh = None
+        self._read_buffer = bytearray(PROC_READ_SIZE)
+        self.table = ProcessTable(self.cpu_sampler, workers=scan_workers)
+    
+    def _read_proc_file(self, path: str) -> Optional[bytes]:
+        """Read a small /proc file into this manager's buffer."""
+        return read_proc_file(path, self._read_buffer)
     
     def _parse_proc_stat(self, pid: int) -> Optional[Dict[str, Any]]:
         """Parse /proc/[pid]/stat on Linux."""
@@ -106,15 +570,13 @@ class ProcessManager:
             return ''
     
     def _get_username(self, uid: int) -> str:
-        """Get username from UID."""
-        try:
-            import pwd
-            return pwd.getpwuid(uid).pw_name
-        except:
-            return str(uid)
+        """Get username from UID (cached process-wide)."""
+        return get_username(uid)
     
-    def _get_linux_processes(self) -> Generator[ProcessInfo, None, None]:
-        """Get processes from /proc on Linux."""
+    def _get_linux_processes(self) -> Generator[Tuple[ProcessInfo, int, int], None, None]:
+        """Get processes from /proc on Linux, with starttime and CPU ticks."""
+        host = get_host_constants()
+        
         for entry in os.listdir('/proc'):
             if not entry.isdigit():
                 continue
@@ -131,50 +593,113 @@ class ProcessManager:
             
             cmdline = self._parse_proc_cmdline(pid)
             
-            # Calculate CPU percent would require sampling over time
-            # For simplicity, return 0 here - realtime module handles this
-            
-            state_map = {
-                'R': 'running',
-                'S': 'sleeping',
-                'D': 'disk-sleep',
-                'Z': 'zombie',
-                'T': 'stopped',
-                'I': 'idle',
-            }
+            # cpu_percent is filled in from the CPU sampler by the caller
             
             try:
-                # Get process start time
-                boot_time = 0
-                try:
-                    with open('/proc/stat', 'r') as f:
-                        for line in f:
-                            if line.startswith('btime'):
-                                boot_time = int(line.split()[1])
-                                break
-                except:
-                    pass
-                
-                # Clock ticks per second
-                clk_tck = os.sysconf(os.sysconf_names['SC_CLK_TCK'])
-                start_time = datetime.fromtimestamp(boot_time + stat['starttime'] / clk_tck)
+                # starttime is in clock ticks since boot
+                start_time = datetime.fromtimestamp(host.boot_time + stat['starttime'] / host.clock_ticks)
+                memory_rss = status.get('vmrss', 0)
                 
-                yield ProcessInfo(
+                info = ProcessInfo(
                     pid=pid,
                     name=status.get('name', stat.get('name', '')),
-                    status=state_map.get(status.get('state', 'S')[0], 'unknown'),
+                    status=STATE_NAMES.get(status.get('state', 'S')[0], 'unknown'),
                     cpu_percent=0.0,
-                    memory_percent=0.0,
-                    memory_rss=status.get('vmrss', 0),
+                    memory_percent=memory_rss / host.total_memory * 100 if host.total_memory else 0.0,
+                    memory_rss=memory_rss,
                     username=self._get_username(status.get('uid', 0)),
                     create_time=start_time,
                     command=cmdline or status.get('name', ''),
                     parent_pid=stat.get('ppid', 0),
-                    threads=status.get('threads', 1)
+                    threads=status.get('threads', 1),
+                    uid=status.get('uid', 0)
                 )
+                yield info, stat['starttime'], stat['utime'] + stat['stime']
             except:
                 continue
     
+    def _fill_details(self, processes: List[ProcessInfo]) -> List[ProcessInfo]:
+        """Fill in command line and username for rows from the process table."""
+        for proc in processes:
+            if proc.uid is None:
+                continue
+            if not proc.command:
+                proc.command = self._parse_proc_cmdline(proc.pid) or proc.name
+            if not proc.username and self.resolve_usernames:
+                proc.username = self._get_username(proc.uid)
+        return processes
+    
+    def _scan_cpu_ticks(self) -> Dict[ProcessKey, int]:
+        """Read utime+stime for every process from /proc/[pid]/stat."""
+        samples = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            
+            stat = self._read_proc_file('/proc/' + entry + '/stat')
+            if stat is None:
+                continue
+            
+            try:
+                _, rest = split_stat(stat)
+                samples[(int(entry), int(rest[19]))] = int(rest[11]) + int(rest[12])
+            except (ValueError, IndexError):
+                continue
+        return samples
+    
+    def prime_cpu(self) -> None:
+        """
+        Take a CPU reference scan now.
+        
+        Call this early in a one-shot command; the time until the
+        listing counts toward cpu_window.
+        """
+        if is_linux():
+            self.cpu_sampler.update(self._scan_cpu_ticks())
+    
+    def _wait_for_cpu_window(self) -> None:
+        """Make sure at least cpu_window seconds lie behind the next scan."""
+        if self.cpu_window <= 0:
+            return
+        
+        age = self.cpu_sampler.age
+        if age is None:
+            self.prime_cpu()
+            age = 0.0
+        
+        if age < self.cpu_window:
+            time.sleep(self.cpu_window - age)
+    
+    def _collect_linux_processes(self) -> List[ProcessInfo]:
+        """Collect Linux processes with CPU percent from the sampler."""
+        self._wait_for_cpu_window()
+        
+        if self.fast:
+            self.table.refresh()
+            return self.table.processes()
+        
+        processes = []
+        samples = {}
+        for info, starttime, ticks in self._get_linux_processes():
+            processes.append(info)
+            samples[(info.pid, starttime)] = ticks
+        
+        percents = self.cpu_sampler.update(samples)
+        for info, key in zip(processes, samples):
+            info.cpu_percent = percents.get(key, 0.0)
+        
+        return processes
+    
+    def _collect_processes(self) -> List[ProcessInfo]:
+        """Collect processes for this platform (fast rows may lack details)."""
+        if is_linux():
+            return self._collect_linux_processes()
+        elif is_windows():
+            return list(self._get_windows_processes())
+        elif is_macos():
+            return list(self._get_macos_processes())
+        return []
+    
     def _get_windows_processes(self) -> Generator[ProcessInfo, None, None]:
         """Get processes on Windows using wmic/powershell."""
         try:
@@ -282,14 +807,7 @@ class ProcessManager:
         Returns:
             List of ProcessInfo
         """
-        if is_linux():
-            processes = list(self._get_linux_processes())
-        elif is_windows():
-            processes = list(self._get_windows_processes())
-        elif is_macos():
-            processes = list(self._get_macos_processes())
-        else:
-            processes = []
+        processes = self._collect_processes()
         
         # Sort
         sort_keys = {
@@ -305,14 +823,92 @@ class ProcessManager:
         if limit:
             processes = processes[:limit]
         
-        return processes
+        # Only the rows being returned pay for cmdline and username
+        return self._fill_details(processes)
+    
+    def _read_linux_process(self, pid: int) -> Optional[Tuple[ProcessInfo, int, int]]:
+        """Read one process from /proc/[pid] only, with starttime and CPU ticks."""
+        base = f'/proc/{pid}'
+        stat = self._read_proc_file(base + '/stat')
+        statm = self._read_proc_file(base + '/statm')
+        if stat is None or statm is None:
+            return None
+        
+        try:
+            host = get_host_constants()
+            comm, rest = split_stat(stat)
+            starttime = int(rest[19])
+            info = new_process_info((pid, starttime), comm, os.stat(base).st_uid, host)
+            update_process_info(info, rest, statm, host)
+            return info, starttime, int(rest[11]) + int(rest[12])
+        except (OSError, ValueError, IndexError):
+            return None
+    
+    def get_processes(self, pids: List[int]) -> Dict[int, ProcessInfo]:
+        """
+        Get information about specific processes.
+        
+        On Linux only /proc/[pid] of the requested PIDs is read; CPU
+        percent is measured since the previous lookup or listing of the
+        same process.
+        
+        Args:
+            pids: Process IDs to look up
+        
+        Returns:
+            Dictionary of PID to ProcessInfo (PIDs not running are missing)
+        """
+        if not is_linux():
+            wanted = set(pids)
+            return {p.pid: p for p in self._fill_details(
+                [p for p in self._collect_processes() if p.pid in wanted]
+            )}
+        
+        found: Dict[int, ProcessInfo] = {}
+        samples: Dict[ProcessKey, int] = {}
+        for pid in dict.fromkeys(pids):
+            result = self._read_linux_process(pid)
+            if result is None:
+                continue
+            info, starttime, ticks = result
+            found[pid] = info
+            samples[(pid, starttime)] = ticks
+        
+        percents = self.cpu_sampler.update(samples, full=False)
+        for key, percent in percents.items():
+            found[key[0]].cpu_percent = percent
+        
+        self._fill_details(list(found.values()))
+        return found
     
     def get_process(self, pid: int) -> Optional[ProcessInfo]:
         """Get information about a specific process."""
-        for proc in self.list_processes():
-            if proc.pid == pid:
-                return proc
-        return None
+        return self.get_processes([pid]).get(pid)
+    
+    def identify_process(self, pid: int) -> Optional[ProcessInfo]:
+        """
+        Get the fields that identify a process: name, start time and owner.
+        
+        On Linux this reads /proc/[pid]/stat only and takes no CPU
+        sample, so it is cheap enough to run for every exec event.
+        Usage fields keep their defaults; use get_process() for those.
+        """
+        if not is_linux():
+            return self.get_process(pid)
+        
+        base = f'/proc/{pid}'
+        stat = self._read_proc_file(base + '/stat')
+        if stat is None:
+            return None
+        
+        try:
+            comm, rest = split_stat(stat)
+            info = new_process_info((pid, int(rest[19])), comm, os.stat(base).st_uid, get_host_constants())
+            info.status = STATE_NAMES.get(rest[0].decode('ascii'), 'unknown')
+            info.parent_pid = int(rest[1])
+            return info
+        except (OSError, ValueError, IndexError):
+            return None
     
     def find_processes(
         self,
@@ -333,15 +929,18 @@ class ProcessManager:
         Returns:
             List of matching processes
         """
-        processes = self.list_processes()
+        processes = self._collect_processes()
         results = []
         
         for proc in processes:
             if name and name.lower() not in proc.name.lower():
                 continue
             
-            if user and user.lower() != proc.username.lower():
-                continue
+            if user:
+                if not proc.username and proc.uid is not None:
+                    proc.username = self._get_username(proc.uid)
+                if user.lower() != proc.username.lower():
+                    continue
             
             if min_memory and proc.memory_rss < min_memory:
                 continue
@@ -351,7 +950,7 @@ class ProcessManager:
             
             results.append(proc)
         
-        return results
+        return self._fill_details(results)
     
     def kill_process(self, pid: int, force: bool = False) -> bool:
         """
@@ -382,34 +981,93 @@ class ProcessManager:
         except Exception as e:
             raise ProcessError(f"Failed to kill process {pid}: {e}")
     
-    def get_process_tree(self, pid: int) -> Dict[str, Any]:
+    def build_process_tree(
+        self,
+        root_pid: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        processes: Optional[List[ProcessInfo]] = None
+    ) -> List[ProcessTreeNode]:
         """
-        Get process tree starting from a PID.
+        Build process trees from a single listing.
+        
+        Children are found through a parent -> children index and the
+        trees are built without recursion, so the cost is O(n) however
+        deep or wide the hierarchy is. Subtree totals always cover every
+        descendant, including those below max_depth.
         
         Args:
-            pid: Root process ID
+            root_pid: Root process ID (default: every process whose
+                parent is not running, e.g. init and kthreadd)
+            max_depth: Deepest level to keep in children (root is 0)
+            processes: Listing to build from (collected if not given)
         
         Returns:
-            Dictionary with process info and children
+            List of root nodes (empty if root_pid is not running)
         """
-        processes = self.list_processes()
-        pid_map = {p.pid: p for p in processes}
+        if processes is None:
+            processes = self._collect_processes()
+        
+        by_pid = {p.pid: p for p in processes}
+        children_of: Dict[int, List[ProcessInfo]] = {}
+        for proc in sorted(processes, key=lambda p: p.pid):
+            if proc.parent_pid != proc.pid:
+                children_of.setdefault(proc.parent_pid, []).append(proc)
         
-        def build_tree(root_pid: int) -> Dict[str, Any]:
-            proc = pid_map.get(root_pid)
-            if not proc:
-                return {}
+        if root_pid is not None:
+            roots = [by_pid[root_pid]] if root_pid in by_pid else []
+        else:
+            roots = [p for p in sorted(processes, key=lambda p: p.pid) if p.parent_pid not in by_pid]
+        
+        trees = []
+        visited = set()
+        for root in roots:
+            # Pre-order pass creates nodes; the reverse pass rolls totals up
+            order: List[Tuple[ProcessTreeNode, Optional[ProcessTreeNode]]] = []
+            stack: List[Tuple[ProcessInfo, int, Optional[ProcessTreeNode]]] = [(root, 0, None)]
+            while stack:
+                proc, depth, parent = stack.pop()
+                if proc.pid in visited:
+                    continue
+                visited.add(proc.pid)
+                
+                node = ProcessTreeNode(
+                    process=proc,
+                    depth=depth,
+                    total_rss=proc.memory_rss,
+                    total_threads=proc.threads,
+                    total_cpu=proc.cpu_percent
+                )
+                if parent is not None and (max_depth is None or depth <= max_depth):
+                    parent.children.append(node)
+                order.append((node, parent))
+                
+                for child in reversed(children_of.get(proc.pid, [])):
+                    stack.append((child, depth + 1, node))
             
-            children = [p for p in processes if p.parent_pid == root_pid]
+            for node, parent in reversed(order):
+                if parent is not None:
+                    parent.total_rss += node.total_rss
+                    parent.total_threads += node.total_threads
+                    parent.total_cpu += node.total_cpu
+                    parent.descendant_count += node.descendant_count + 1
             
-            return {
-                'pid': proc.pid,
-                'name': proc.name,
-                'memory_rss': proc.memory_rss,
-                'children': [build_tree(c.pid) for c in children]
-            }
+            trees.append(order[0][0])
         
-        return build_tree(pid)
+        return trees
+    
+    def get_process_tree(self, pid: int) -> Dict[str, Any]:
+        """
+        Get process tree starting from a PID.
+        
+        Args:
+            pid: Root process ID
+        
+        Returns:
+            Dictionary with process info, subtree totals and children
+        """
+        # Only listing fields are used, so skip _fill_details()
+        trees = self.build_process_tree(root_pid=pid)
+        return trees[0].to_dict() if trees else {}
     
     def get_top_processes(
         self,
@@ -6,16 +6,39 @@ Detailed process analysis and resource profiling.
 
 import os
 import time
+from array import array
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Any
+from dataclasses import dataclass, field
 
-from .manager import ProcessManager, ProcessInfo
-from ...utils.platform_utils import is_linux, is_windows
+from .manager import (
+    ProcessManager, ProcessInfo, ProcessCPUSampler, ProcessKey,
+    STATE_NAMES, PROC_READ_SIZE, read_proc_file, split_stat
+)
+from ...utils.platform_utils import is_linux, is_windows, get_host_constants
 from ...core.errors import ProcessError
 
 
+# Number of hottest threads kept in a ProcessProfile
+HOT_THREAD_COUNT = 5
+
+# Processes whose thread CPU deltas are remembered between calls
+MAX_THREAD_SAMPLERS = 64
+
+
+@dataclass
+class ThreadUsage:
+    """CPU usage of a single thread."""
+    tid: int
+    name: str
+    status: str
+    cpu_percent: float
+    cpu_times_user: float
+    cpu_times_system: float
+
+
 @dataclass
 class ProcessProfile:
     """Detailed process profile."""
@@ -52,6 +75,272 @@ class ProcessProfile:
     # Timing
     create_time: datetime
     running_time: timedelta
+    
+    # Hottest threads first (Linux only)
+    hot_threads: List[ThreadUsage] = field(default_factory=list)
+
+
+@dataclass
+class ProcessSeries:
+    """
+    Compact time series recorded by ProcessSampler.
+    
+    Each metric is a typed array with one entry per sample. CPU is
+    stored as cumulative seconds; cpu_percent() turns it into a rate.
+    """
+    pid: int
+    interval: float
+    started: datetime
+    offsets: array  # seconds since started
+    cpu_time: array  # cumulative utime+stime seconds
+    memory_rss: array  # bytes
+    io_read_bytes: array  # cumulative
+    io_write_bytes: array  # cumulative
+    threads: array
+    
+    @classmethod
+    def allocate(cls, pid: int, interval: float, capacity: int) -> 'ProcessSeries':
+        """Create a series with room for capacity samples."""
+        return cls(
+            pid=pid,
+            interval=interval,
+            started=datetime.now(),
+            offsets=array('d', bytes(8 * capacity)),
+            cpu_time=array('d', bytes(8 * capacity)),
+            memory_rss=array('q', bytes(8 * capacity)),
+            io_read_bytes=array('q', bytes(8 * capacity)),
+            io_write_bytes=array('q', bytes(8 * capacity)),
+            threads=array('q', bytes(8 * capacity)),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.offsets)
+    
+    def truncate(self, count: int) -> None:
+        """Drop unused preallocated entries beyond count."""
+        for values in (self.offsets, self.cpu_time, self.memory_rss,
+                       self.io_read_bytes, self.io_write_bytes, self.threads):
+            del values[count:]
+    
+    def cpu_percent(self, window: Optional[float] = None) -> array:
+        """
+        CPU percent at each sample over a trailing window.
+        
+        stat counts CPU time in clock ticks (usually 10 ms), so rates
+        over shorter spans are quantized; the default window is one
+        interval but at least ten ticks.
+        
+        Args:
+            window: Seconds to average over
+        
+        Returns:
+            Array of CPU percent (the first sample is 0)
+        """
+        if window is None:
+            window = max(self.interval, 10.0 / get_host_constants().clock_ticks)
+        
+        result = array('d', bytes(8 * len(self)))
+        offsets, cpu = self.offsets, self.cpu_time
+        start = 0
+        for i in range(1, len(self)):
+            while start + 1 < i and offsets[i] - offsets[start + 1] >= window:
+                start += 1
+            elapsed = offsets[i] - offsets[start]
+            if elapsed > 0:
+                result[i] = (cpu[i] - cpu[start]) / elapsed * 100
+        return result
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the series.
+        
+        Returns:
+            Dictionary with sample count, duration, CPU average/max,
+            memory average/max and I/O totals
+        """
+        count = len(self)
+        if count == 0:
+            return {
+                'samples': 0, 'duration': 0.0, 'cpu_average': 0.0, 'cpu_max': 0.0,
+                'memory_average': 0.0, 'memory_max': 0, 'io_read_bytes': 0,
+                'io_write_bytes': 0, 'threads_max': 0,
+            }
+        
+        duration = self.offsets[-1] - self.offsets[0]
+        cpu = self.cpu_percent()
+        return {
+            'samples': count,
+            'duration': duration,
+            'cpu_average': (self.cpu_time[-1] - self.cpu_time[0]) / duration * 100 if duration > 0 else 0.0,
+            'cpu_max': max(cpu),
+            'memory_average': sum(self.memory_rss) / count,
+            'memory_max': max(self.memory_rss),
+            'io_read_bytes': self.io_read_bytes[-1] - self.io_read_bytes[0],
+            'io_write_bytes': self.io_write_bytes[-1] - self.io_write_bytes[0],
+            'threads_max': max(self.threads),
+        }
+    
+    def to_samples(self) -> List[Dict[str, Any]]:
+        """Convert to the per-sample dictionaries of monitor_process()."""
+        total_memory = get_host_constants().total_memory
+        cpu = self.cpu_percent()
+        return [
+            {
+                'timestamp': (self.started + timedelta(seconds=self.offsets[i])).isoformat(),
+                'cpu_percent': cpu[i],
+                'memory_rss': self.memory_rss[i],
+                'memory_percent': self.memory_rss[i] / total_memory * 100 if total_memory else 0.0,
+                'io_read': self.io_read_bytes[i],
+                'io_write': self.io_write_bytes[i],
+                'threads': self.threads[i],
+            }
+            for i in range(len(self))
+        ]
+
+
+class ProcessSampler:
+    """
+    Low-overhead, high-frequency sampler for a single process.
+    
+    /proc/[pid]/stat, statm and io are opened once and re-read with
+    os.preadv into one reused buffer on every tick, and values go into
+    preallocated arrays. A tick is three syscalls plus a little
+    parsing, so 50-100 Hz sampling does not perturb the host. The file
+    descriptors stay bound to the original process: once it exits,
+    reads fail even if the PID is reused.
+    """
+    
+    def __init__(self, pid: int):
+        """
+        Initialize sampler.
+        
+        Args:
+            pid: Process ID to sample
+        """
+        self.pid = pid
+        self._stat_fd: Optional[int] = None
+        self._statm_fd: Optional[int] = None
+        self._io_fd: Optional[int] = None
+        self._buffer = bytearray(PROC_READ_SIZE)
+    
+    def open(self) -> None:
+        """
+        Open the /proc files.
+        
+        Raises:
+            ProcessError: If the process is not running
+        """
+        base = f'/proc/{self.pid}/'
+        try:
+            self._stat_fd = os.open(base + 'stat', os.O_RDONLY)
+            self._statm_fd = os.open(base + 'statm', os.O_RDONLY)
+        except OSError:
+            self.close()
+            raise ProcessError(f"Process {self.pid} not found")
+        
+        # io needs the same privileges as ptrace; sample without it if denied
+        # (see sample_into: the denial usually only shows on the first read)
+        try:
+            self._io_fd = os.open(base + 'io', os.O_RDONLY)
+        except OSError:
+            self._io_fd = None
+    
+    def close(self) -> None:
+        """Close the /proc files."""
+        for fd in (self._stat_fd, self._statm_fd, self._io_fd):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._stat_fd = self._statm_fd = self._io_fd = None
+    
+    def __enter__(self) -> 'ProcessSampler':
+        self.open()
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def _pread(self, fd: int) -> bytes:
+        """Re-read an open /proc file from the start."""
+        size = os.preadv(fd, [self._buffer], 0)
+        return memoryview(self._buffer)[:size].tobytes()
+    
+    def sample_into(self, series: ProcessSeries, index: int, offset: float) -> bool:
+        """
+        Take one sample and store it at index.
+        
+        Returns:
+            False if the process has exited
+        """
+        host = get_host_constants()
+        try:
+            _, fields = split_stat(self._pread(self._stat_fd))
+            statm = self._pread(self._statm_fd)
+        except (OSError, TypeError):
+            return False
+        
+        # Opening io succeeds for other users' processes; the permission
+        # check is on read. Give up on it and keep the io columns at zero.
+        io = None
+        if self._io_fd is not None:
+            try:
+                io = self._pread(self._io_fd).split()
+            except OSError:
+                os.close(self._io_fd)
+                self._io_fd = None
+        
+        try:
+            series.offsets[index] = offset
+            series.cpu_time[index] = (int(fields[11]) + int(fields[12])) / host.clock_ticks
+            series.threads[index] = int(fields[17])
+            series.memory_rss[index] = int(statm.split()[1]) * host.page_size
+            if io is not None:
+                # rchar wchar syscr syscw read_bytes write_bytes ... as "key: value"
+                series.io_read_bytes[index] = int(io[9])
+                series.io_write_bytes[index] = int(io[11])
+        except (ValueError, IndexError):
+            return False
+        return True
+    
+    def run(self, duration: float, interval: float = 0.02) -> ProcessSeries:
+        """
+        Sample at a fixed rate for a while.
+        
+        Ticks are scheduled against the start time, so a slow tick
+        does not shift the ones after it.
+        
+        Args:
+            duration: Seconds to sample for
+            interval: Seconds between samples (0.02 = 50 Hz)
+        
+        Returns:
+            ProcessSeries, cut short if the process exits
+        """
+        capacity = int(duration / interval) + 1
+        series = ProcessSeries.allocate(self.pid, interval, capacity)
+        
+        opened = self._stat_fd is None
+        if opened:
+            self.open()
+        
+        count = 0
+        try:
+            start = time.monotonic()
+            for index in range(capacity):
+                delay = start + index * interval - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                if not self.sample_into(series, index, time.monotonic() - start):
+                    break
+                count += 1
+        finally:
+            if opened:
+                self.close()
+        
+        series.truncate(count)
+        return series
 
 
 class ProcessProfiler:
@@ -63,8 +352,14 @@ class ProcessProfiler:
     """
     
     def __init__(self):
+        # CPU percent comes from the manager's sampler, measured between
+        # successive get_process() calls for the same process
         self.manager = ProcessManager()
-        self._cpu_times_cache: Dict[int, Tuple[float, float, float]] = {}  # pid -> (user, system, timestamp)
+        
+        # Per-process thread samplers, least recently used first; entries
+        # are keyed by (tid, starttime)
+        self._thread_samplers: 'OrderedDict[int, ProcessCPUSampler]' = OrderedDict()
+        self._task_buffer = bytearray(PROC_READ_SIZE)
     
     def _read_proc_io(self, pid: int) -> Dict[str, int]:
         """Read I/O stats from /proc/[pid]/io on Linux."""
@@ -102,7 +397,7 @@ class ProcessProfiler:
             with open(f'/proc/{pid}/statm', 'r') as f:
                 parts = f.read().split()
             
-            page_size = os.sysconf('SC_PAGE_SIZE')
+            page_size = get_host_constants().page_size
             
             return {
                 'vms': int(parts[0]) * page_size,
@@ -154,45 +449,94 @@ class ProcessProfiler:
         
         return environ
     
-    def _get_cpu_percent(self, pid: int) -> float:
-        """Calculate CPU percent for a process."""
+    def get_thread_usage(self, pid: int) -> List[ThreadUsage]:
+        """
+        Get per-thread CPU usage of a process, hottest first.
+        
+        Reads only /proc/[pid]/task/[tid]/stat per thread (the thread
+        name is in it), so processes with thousands of threads stay
+        cheap. CPU percent is measured since the previous call for the
+        same process; on the first call it is each thread's average
+        over its lifetime.
+        
+        Args:
+            pid: Process ID
+        
+        Returns:
+            List of ThreadUsage sorted by CPU percent
+        
+        Raises:
+            ProcessError: If the process is not running
+        """
         if not is_linux():
-            return 0.0
+            return []
         
+        task_dir = f'/proc/{pid}/task/'
         try:
-            with open(f'/proc/{pid}/stat', 'r') as f:
-                stat = f.read()
-            
-            # Parse stat
-            end = stat.rfind(')')
-            parts = stat[end+2:].split()
-            
-            utime = int(parts[11])
-            stime = int(parts[12])
-            
-            clk_tck = os.sysconf(os.sysconf_names['SC_CLK_TCK'])
-            current_time = time.time()
-            
-            # Check cache
-            if pid in self._cpu_times_cache:
-                prev_utime, prev_stime, prev_time = self._cpu_times_cache[pid]
-                
-                delta_time = current_time - prev_time
-                if delta_time > 0:
-                    delta_utime = (utime - prev_utime) / clk_tck
-                    delta_stime = (stime - prev_stime) / clk_tck
-                    cpu_percent = ((delta_utime + delta_stime) / delta_time) * 100
-                else:
-                    cpu_percent = 0.0
-            else:
-                cpu_percent = 0.0
+            tids = os.listdir(task_dir)
+        except OSError:
+            self._thread_samplers.pop(pid, None)
+            raise ProcessError(f"Process {pid} not found")
+        
+        clk_tck = get_host_constants().clock_ticks
+        buffer = self._task_buffer
+        threads: Dict[ProcessKey, ThreadUsage] = {}
+        samples: Dict[ProcessKey, int] = {}
+        
+        for tid in tids:
+            stat = read_proc_file(task_dir + tid + '/stat', buffer)
+            if stat is None:
+                continue
             
-            # Update cache
-            self._cpu_times_cache[pid] = (utime, stime, current_time)
+            try:
+                comm, rest = split_stat(stat)
+                utime, stime = int(rest[11]), int(rest[12])
+                key = (int(tid), int(rest[19]))
+            except (ValueError, IndexError):
+                continue
             
-            return cpu_percent
-        except:
-            return 0.0
+            threads[key] = ThreadUsage(
+                tid=key[0],
+                name=comm.decode('utf-8', 'replace'),
+                status=STATE_NAMES.get(rest[0].decode('ascii'), 'unknown'),
+                cpu_percent=0.0,
+                cpu_times_user=utime / clk_tck,
+                cpu_times_system=stime / clk_tck
+            )
+            samples[key] = utime + stime
+        
+        sampler = self._thread_samplers.pop(pid, None) or ProcessCPUSampler()
+        self._prune_thread_samplers()
+        self._thread_samplers[pid] = sampler
+        for key, percent in sampler.update(samples).items():
+            threads[key].cpu_percent = percent
+        
+        return sorted(threads.values(), key=lambda t: t.cpu_percent, reverse=True)
+    
+    def _prune_thread_samplers(self) -> None:
+        """Drop samplers of exited processes, then the least recently used."""
+        for pid in [pid for pid in self._thread_samplers if not os.path.exists(f'/proc/{pid}')]:
+            del self._thread_samplers[pid]
+        while len(self._thread_samplers) >= MAX_THREAD_SAMPLERS:
+            self._thread_samplers.popitem(last=False)
+    
+    def get_hot_threads(self, pid: int, n: int = HOT_THREAD_COUNT, interval: float = 0.5) -> List[ThreadUsage]:
+        """
+        Get the threads using the most CPU right now.
+        
+        Args:
+            pid: Process ID
+            n: Number of threads to return
+            interval: Seconds to sample over if this process has not
+                been sampled before
+        
+        Returns:
+            Top n threads by CPU percent
+        """
+        if pid not in self._thread_samplers:
+            self.get_thread_usage(pid)
+            time.sleep(interval)
+        return self.get_thread_usage(pid)[:n]
     
     def _get_net_connections(self, pid: int) -> List[Dict[str, Any]]:
         """Get network connections for a process on Linux."""
@@ -238,7 +582,7 @@ class ProcessProfiler:
         Raises:
             ProcessError: If process not found or access denied
         """
-        # Get basic info first
+        # Get basic info first (reads /proc/[pid] only)
         proc_info = self.manager.get_process(pid)
         if not proc_info:
             raise ProcessError(f"Process {pid} not found")
@@ -250,16 +594,21 @@ class ProcessProfiler:
             open_files = self._read_proc_fd(pid)
             cwd = self._read_proc_cwd(pid)
             environ = self._read_proc_environ(pid)
-            cpu_percent = self._get_cpu_percent(pid)
+            cpu_percent = proc_info.cpu_percent
             connections = self._get_net_connections(pid)
             
+            try:
+                hot_threads = self.get_thread_usage(pid)[:HOT_THREAD_COUNT]
+            except ProcessError:
+                hot_threads = []
+            
             # Get CPU times
             try:
                 with open(f'/proc/{pid}/stat', 'r') as f:
                     stat = f.read()
                 end = stat.rfind(')')
                 parts = stat[end+2:].split()
-                clk_tck = os.sysconf(os.sysconf_names['SC_CLK_TCK'])
+                clk_tck = get_host_constants().clock_ticks
                 cpu_user = int(parts[11]) / clk_tck
                 cpu_system = int(parts[12]) / clk_tck
             except:
@@ -267,15 +616,8 @@ class ProcessProfiler:
                 cpu_system = 0.0
             
             # Calculate memory percent
-            try:
-                with open('/proc/meminfo', 'r') as f:
-                    for line in f:
-                        if line.startswith('MemTotal:'):
-                            total_mem = int(line.split()[1]) * 1024
-                            break
-                memory_percent = (mem_stats['rss'] / total_mem) * 100 if total_mem > 0 else 0
-            except:
-                memory_percent = 0.0
+            total_mem = get_host_constants().total_memory
+            memory_percent = (mem_stats['rss'] / total_mem) * 100 if total_mem > 0 else 0.0
         else:
             # Minimal info for non-Linux
             mem_stats = {'rss': proc_info.memory_rss, 'vms': 0}
@@ -288,6 +630,7 @@ class ProcessProfiler:
             cpu_system = 0.0
             memory_percent = proc_info.memory_percent
             connections = []
+            hot_threads = []
         
         running_time = datetime.now() - proc_info.create_time
         
@@ -310,7 +653,8 @@ class ProcessProfiler:
             environ=environ,
             threads=proc_info.threads,
             create_time=proc_info.create_time,
-            running_time=running_time
+            running_time=running_time,
+            hot_threads=hot_threads
         )
     
     def monitor_process(
@@ -330,6 +674,12 @@ class ProcessProfiler:
         Returns:
             List of samples with CPU and memory usage
         """
+        if is_linux():
+            try:
+                return self.sample_process(pid, duration, interval).to_samples()
+            except ProcessError:
+                return []
+        
         samples = []
         start_time = time.time()
         
@@ -354,6 +704,35 @@ class ProcessProfiler:
         
         return samples
     
+    def sample_process(
+        self,
+        pid: int,
+        duration: float = 10.0,
+        interval: float = 0.02
+    ) -> ProcessSeries:
+        """
+        Record CPU, memory, I/O and thread count at a high rate.
+        
+        Only stat, statm and io are read (see ProcessSampler); use
+        profile_process() for open files, connections and environment.
+        
+        Args:
+            pid: Process ID to sample
+            duration: How long to sample in seconds
+            interval: Sampling interval in seconds (0.02 = 50 Hz)
+        
+        Returns:
+            ProcessSeries with one entry per sample
+        
+        Raises:
+            ProcessError: If the process is not running (or not on Linux)
+        """
+        if not is_linux():
+            raise ProcessError("High-frequency sampling requires /proc (Linux)")
+        
+        with ProcessSampler(pid) as sampler:
+            return sampler.run(duration, interval)
+    
     def get_resource_summary(self) -> Dict[str, Any]:
         """
         Get summary of resource usage across all processes.
@@ -2,19 +2,40 @@
 SYSMIND Process Watchdog Module
 
 Automated process monitoring with rules and actions.
+
+On Linux the watchdog is event-driven by default: process start, exec
+and exit notifications keep each rule's set of matching PIDs current,
+so count limits are checked the moment a process appears or exits,
+and the periodic threshold check only re-reads the PIDs that threshold
+rules match. Elsewhere it polls the full process list.
+
+Alerts are tracked per (rule, pid, condition) and only raised when a
+condition starts firing or resolves, with per-rule hysteresis and
+cooldown; the transitions are written to the database in one batch
+per check cycle.
+
+Rules with a window compare averages instead of single readings, and
+can watch RSS growth for leaks. Each such rule keeps a small ring of
+recent samples per matching process, with running sums so every
+check costs O(1) per process.
 """
 
+import math
 import os
 import time
 import threading
+import re
 import fnmatch
+from array import array
 from datetime import datetime
-from typing import List, Dict, Optional, Any, Callable
+from typing import List, Dict, Optional, Any, Callable, Set, Tuple
 from dataclasses import dataclass, field
 
 from .manager import ProcessManager, ProcessInfo
+from .events import ProcessEventSource, ProcEvent, DEFAULT_POLL_INTERVAL
 from ...core.database import Database
 from ...core.errors import ProcessError
+from ...utils.platform_utils import is_linux
 
 
 @dataclass
@@ -29,6 +50,16 @@ class WatchdogRule:
     memory_threshold: Optional[int] = None  # Memory bytes threshold
     min_count: Optional[int] = None  # Minimum instance count
     max_count: Optional[int] = None  # Maximum instance count
+    memory_growth_threshold: Optional[int] = None  # RSS growth bytes/minute, over the window
+    
+    # Sustained conditions: CPU and memory thresholds compare averages
+    # over this many seconds (None compares the latest reading)
+    window: Optional[float] = None
+    
+    # Hysteresis and rate limiting
+    breach_count: int = 1  # Consecutive breaching evaluations before firing
+    clear_ratio: float = 0.9  # Firing thresholds resolve below threshold * clear_ratio
+    cooldown: float = 60.0  # Minimum seconds between firings of this rule for one process
     
     # Actions
     action: str = 'alert'  # alert, log, kill, notify
@@ -48,9 +79,441 @@ class WatchdogAlert:
     condition: str
     message: str
     severity: str  # info, warning, critical
+    state: str = 'firing'  # firing, resolved
     timestamp: datetime = field(default_factory=datetime.now)
 
 
+# Rule settings stored in the condition_json column
+RULE_CONDITIONS = (
+    'cpu_threshold', 'memory_threshold', 'min_count', 'max_count',
+    'memory_growth_threshold', 'window', 'breach_count', 'clear_ratio', 'cooldown',
+)
+
+# (rule ID, PID or None for count conditions, condition)
+AlertKey = Tuple[str, Optional[int], str]
+
+
+@dataclass
+class AlertState:
+    """Hysteresis state of one (rule, pid, condition)."""
+    breaches: int = 0  # Consecutive breaching evaluations
+    alert: Optional[WatchdogAlert] = None  # Set while firing
+
+
+class AlertTracker:
+    """
+    Firing/resolved state machine per (rule, pid, condition).
+    
+    A condition fires after breach_count consecutive breaching
+    evaluations, unless its rule fired for the same process (or, for
+    count conditions, at all) less than cooldown seconds ago; it then
+    stays pending and fires on a later evaluation. A firing
+    condition resolves once its value drops below the clear level, or
+    when its process goes away. Only these transitions produce alerts.
+    """
+    
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._states: Dict[AlertKey, AlertState] = {}
+        self._last_fired: Dict[Tuple[str, Optional[int]], float] = {}
+    
+    def __len__(self) -> int:
+        return len(self._states)
+    
+    def firing(self) -> List[WatchdogAlert]:
+        """Get the alerts currently firing."""
+        return [state.alert for state in self._states.values() if state.alert is not None]
+    
+    def observe(
+        self,
+        rule: WatchdogRule,
+        key: AlertKey,
+        breach: Optional[WatchdogAlert],
+        cleared: bool = True
+    ) -> Optional[WatchdogAlert]:
+        """
+        Feed one evaluation of a condition.
+        
+        Args:
+            rule: Rule the condition belongs to
+            key: (rule ID, PID, condition)
+            breach: Alert describing the breach, or None within limits
+            cleared: Whether the value is below the clear level (only
+                used when not breaching)
+        
+        Returns:
+            The firing or resolved alert on a transition, else None
+        """
+        state = self._states.get(key)
+        
+        if breach is not None:
+            if state is None:
+                state = self._states[key] = AlertState()
+            state.breaches += 1
+            if state.alert is not None or state.breaches < rule.breach_count:
+                return None
+            
+            now = self._clock()
+            fired_key = (rule.id, key[1])
+            last = self._last_fired.get(fired_key)
+            if last is not None and now - last < rule.cooldown:
+                return None
+            
+            # Cooldowns of this rule that have run out are no longer needed
+            self._last_fired = {
+                other: at for other, at in self._last_fired.items()
+                if other[0] != rule.id or now - at < rule.cooldown
+            }
+            self._last_fired[fired_key] = now
+            state.alert = breach
+            return breach
+        
+        if state is None:
+            return None
+        
+        state.breaches = 0
+        if state.alert is not None and not cleared:
+            return None  # Between the clear level and the threshold
+        
+        del self._states[key]
+        return self._resolved(state.alert, 'back within limits') if state.alert else None
+    
+    @staticmethod
+    def _resolved(alert: WatchdogAlert, reason: str) -> WatchdogAlert:
+        """Build the resolved counterpart of a firing alert."""
+        return WatchdogAlert(
+            rule_id=alert.rule_id,
+            rule_name=alert.rule_name,
+            process=alert.process,
+            condition=alert.condition,
+            message=f"Resolved ({reason}): {alert.message}",
+            severity='info',
+            state='resolved'
+        )
+    
+    def _drop(self, keys: List[AlertKey], reason: str) -> List[WatchdogAlert]:
+        """Forget states, resolving the firing ones."""
+        resolved = []
+        for key in keys:
+            state = self._states.pop(key)
+            if state.alert is not None:
+                resolved.append(self._resolved(state.alert, reason))
+        return resolved
+    
+    def sweep(self, rule_id: str, seen: Set[AlertKey], conditions: Tuple[str, ...]) -> List[WatchdogAlert]:
+        """
+        Resolve a rule's conditions that were not evaluated this cycle.
+        
+        Args:
+            rule_id: Rule that was evaluated
+            seen: Keys evaluated this cycle
+            conditions: Conditions the cycle covered
+        
+        Returns:
+            Resolved alerts (the processes exited or stopped matching)
+        """
+        keys = [
+            key for key in self._states
+            if key[0] == rule_id and key[2] in conditions and key not in seen
+        ]
+        return self._drop(keys, 'process gone')
+    
+    def forget_pid(self, pid: int) -> List[WatchdogAlert]:
+        """Resolve every condition of an exited process."""
+        for key in [key for key in self._last_fired if key[1] == pid]:
+            del self._last_fired[key]
+        return self._drop([key for key in self._states if key[1] == pid], 'process exited')
+    
+    def forget_rule(self, rule_id: str) -> None:
+        """Drop all state of a removed or disabled rule, without alerts."""
+        for key in [key for key in self._states if key[0] == rule_id]:
+            del self._states[key]
+        for key in [key for key in self._last_fired if key[0] == rule_id]:
+            del self._last_fired[key]
+
+
+# Characters that make a rule pattern a glob rather than an exact name
+GLOB_CHARS = frozenset('*?[')
+
+# Named groups and backreferences in fnmatch.translate() output (< 3.11).
+# A literal '(' in a pattern is escaped and a '?' is a wildcard, so this
+# never matches text that came from the pattern itself.
+FNMATCH_GROUP = re.compile(r'\(\?P([<=])(g\d+)')
+
+THRESHOLD_CONDITIONS = ('cpu_threshold', 'memory_threshold', 'memory_growth_threshold')
+
+# Window for memory_growth_threshold on rules without one
+DEFAULT_GROWTH_WINDOW = 300.0
+
+# Upper bound on samples kept per process and rule
+MAX_RING_SLOTS = 512
+
+MB = 1024 * 1024
+COUNT_CONDITIONS = ('min_count', 'max_count')
+
+# Longest the event loop blocks, so stop() and rule changes take effect
+EVENT_WAIT = 1.0
+
+
+class SampleRing:
+    """
+    Recent (time, CPU percent, RSS) samples of one process.
+    
+    Values live in fixed-size array('f') slots (RSS in MiB) and are
+    evicted once older than the window, keeping the one sample that
+    straddles its start so coverage can be told. Running sums are
+    updated per sample, so the window mean and the least-squares RSS
+    slope are O(1) to read; they are recomputed from the slots each
+    time the ring wraps, which bounds rounding drift.
+    """
+    
+    def __init__(self, window: float, slots: int, create_time: Optional[datetime] = None):
+        """
+        Initialize sample ring.
+        
+        Args:
+            window: Seconds of samples to keep
+            slots: Capacity (samples)
+            create_time: Start time of the process, to notice PID reuse
+        """
+        self.window = window
+        self.create_time = create_time
+        self._times = array('d', bytes(8 * slots))
+        self._cpu = array('f', bytes(4 * slots))
+        self._rss = array('f', bytes(4 * slots))
+        self._head = 0  # Next slot to write
+        self._count = 0
+        self._base = 0.0  # Time origin of the slope sums
+        self._cpu_sum = self._rss_sum = 0.0
+        self._t_sum = self._tt_sum = self._trss_sum = 0.0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def _oldest(self) -> int:
+        return (self._head - self._count) % len(self._times)
+    
+    def _add(self, i: int, sign: float) -> None:
+        """Add (sign 1) or remove (sign -1) slot i from the running sums."""
+        t = self._times[i] - self._base
+        rss = self._rss[i]
+        self._cpu_sum += sign * self._cpu[i]
+        self._rss_sum += sign * rss
+        self._t_sum += sign * t
+        self._tt_sum += sign * t * t
+        self._trss_sum += sign * t * rss
+    
+    def _evict(self) -> None:
+        self._add(self._oldest(), -1.0)
+        self._count -= 1
+    
+    def _resum(self) -> None:
+        """Recompute the running sums from the slots."""
+        self._cpu_sum = self._rss_sum = 0.0
+        self._t_sum = self._tt_sum = self._trss_sum = 0.0
+        oldest = self._oldest()
+        self._base = self._times[oldest] if self._count else 0.0
+        size = len(self._times)
+        for n in range(self._count):
+            self._add((oldest + n) % size, 1.0)
+    
+    def append(self, timestamp: float, cpu_percent: float, rss: int) -> None:
+        """
+        Add a sample and evict the ones that fell out of the window.
+        
+        Args:
+            timestamp: time.monotonic() of the sample
+            cpu_percent: CPU percent since the previous sample
+            rss: Resident set size in bytes
+        """
+        size = len(self._times)
+        if self._count == size:
+            self._evict()
+        if self._count == 0:
+            self._base = timestamp
+        
+        i = self._head
+        self._times[i] = timestamp
+        self._cpu[i] = cpu_percent
+        self._rss[i] = rss / MB
+        self._add(i, 1.0)
+        self._head = (i + 1) % size
+        self._count += 1
+        
+        # Keep the newest sample at least a window old, drop older ones
+        cutoff = timestamp - self.window
+        while self._count > 2 and self._times[(self._oldest() + 1) % size] <= cutoff:
+            self._evict()
+        
+        if self._head == 0:
+            self._resum()
+    
+    def covers_window(self) -> bool:
+        """Whether the samples span the whole window (or fill the ring)."""
+        if self._count < 2:
+            return False
+        if self._count == len(self._times):
+            return True
+        newest = self._times[(self._head - 1) % len(self._times)]
+        return newest - self._times[self._oldest()] >= self.window
+    
+    def mean_cpu(self) -> float:
+        """Mean CPU percent of the samples in the window."""
+        return self._cpu_sum / self._count if self._count else 0.0
+    
+    def mean_rss(self) -> float:
+        """Mean RSS in bytes of the samples in the window."""
+        return self._rss_sum / self._count * MB if self._count else 0.0
+    
+    def rss_growth(self) -> float:
+        """RSS trend over the window in bytes per second (least squares)."""
+        n = self._count
+        denominator = n * self._tt_sum - self._t_sum * self._t_sum
+        if n < 2 or denominator <= 0:
+            return 0.0
+        return (n * self._trss_sum - self._t_sum * self._rss_sum) / denominator * MB
+
+
+class RuleIndex:
+    """
+    Rule patterns compiled once into a name matcher.
+    
+    Patterns are case-insensitive globs, stored by shape:
+    
+    - exact names go into a hash table,
+    - plain 'prefix*' globs (including '*') go into a character trie,
+    - everything else is translated once into one combined regex, with
+      a capturing lookahead per pattern so one match reports every
+      pattern that fits.
+    
+    Adding or removing exact and prefix patterns updates the index in
+    place; the combined regex is rebuilt on the next lookup after a
+    glob rule changes.
+    """
+    
+    def __init__(self):
+        self._exact: Dict[str, Set[str]] = {}
+        self._trie: Dict[str, Any] = {}  # char -> node; '' -> rule ids ending here
+        self._globs: Dict[str, str] = {}  # rule id -> lowercased pattern
+        self._regex: Optional['re.Pattern'] = None
+        self._regex_groups: Dict[str, str] = {}  # group name -> rule id
+        self._patterns: Dict[str, str] = {}  # rule id -> lowercased pattern
+    
+    def __len__(self) -> int:
+        return len(self._patterns)
+    
+    def add(self, rule_id: str, pattern: str) -> None:
+        """Index a rule pattern (replacing the rule's previous one)."""
+        self.remove(rule_id)
+        pattern = pattern.lower()
+        self._patterns[rule_id] = pattern
+        
+        if not GLOB_CHARS.intersection(pattern):
+            self._exact.setdefault(pattern, set()).add(rule_id)
+        elif pattern.endswith('*') and not GLOB_CHARS.intersection(pattern[:-1]):
+            node = self._trie
+            for char in pattern[:-1]:
+                node = node.setdefault(char, {})
+            node.setdefault('', set()).add(rule_id)
+        else:
+            self._globs[rule_id] = pattern
+            self._regex = None
+    
+    def remove(self, rule_id: str) -> None:
+        """Drop a rule from the index (no-op if not indexed)."""
+        pattern = self._patterns.pop(rule_id, None)
+        if pattern is None:
+            return
+        
+        if rule_id in self._globs:
+            del self._globs[rule_id]
+            self._regex = None
+        elif pattern in self._exact:
+            self._exact[pattern].discard(rule_id)
+            if not self._exact[pattern]:
+                del self._exact[pattern]
+        else:
+            # Walk down, then prune nodes left empty
+            path = [self._trie]
+            for char in pattern[:-1]:
+                path.append(path[-1].get(char, {}))
+            path[-1].get('', set()).discard(rule_id)
+            if not path[-1].get('', True):
+                del path[-1]['']
+            for char, node in zip(reversed(pattern[:-1]), reversed(path[:-1])):
+                if node.get(char) == {}:
+                    del node[char]
+    
+    def _compile(self) -> None:
+        """Build the combined regex for the remaining glob patterns."""
+        self._regex_groups = {}
+        parts = []
+        for i, (rule_id, pattern) in enumerate(self._globs.items()):
+            # Before 3.11 translate() emulates atomic groups with its own
+            # named groups (g0, g1, ...); make them unique per pattern
+            translated = FNMATCH_GROUP.sub(rf'(?P\1r{i}_\2', fnmatch.translate(pattern))
+            self._regex_groups[f'r{i}'] = rule_id
+            parts.append(f'(?:(?=(?P<r{i}>{translated}))|)')
+        self._regex = re.compile(''.join(parts)) if parts else None
+    
+    def match(self, name: str) -> Set[str]:
+        """
+        Get the IDs of all rules whose pattern matches a process name.
+        
+        Args:
+            name: Process name
+        
+        Returns:
+            Set of rule IDs
+        """
+        name = name.lower()
+        matched = set(self._exact.get(name, ()))
+        
+        node = self._trie
+        for char in name:
+            if '' in node:
+                matched.update(node[''])
+            node = node.get(char)
+            if node is None:
+                break
+        else:
+            if '' in node:
+                matched.update(node[''])
+        
+        if self._globs:
+            if self._regex is None:
+                self._compile()
+            found = self._regex.match(name)
+            matched.update(
+                rule_id for group, rule_id in self._regex_groups.items()
+                if found.group(group) is not None
+            )
+        
+        return matched
+    
+    def classify(self, processes: List[ProcessInfo]) -> Dict[str, List[ProcessInfo]]:
+        """
+        Group processes by the rules they match.
+        
+        Each distinct name is matched once, however many processes share it.
+        
+        Args:
+            processes: Processes to classify
+        
+        Returns:
+            Dictionary of rule ID to matching processes
+        """
+        by_name: Dict[str, Set[str]] = {}
+        result: Dict[str, List[ProcessInfo]] = {}
+        for proc in processes:
+            rule_ids = by_name.get(proc.name)
+            if rule_ids is None:
+                rule_ids = by_name[proc.name] = self.match(proc.name)
+            for rule_id in rule_ids:
+                result.setdefault(rule_id, []).append(proc)
+        return result
+
+
 class ProcessWatchdog:
     """
     Process watchdog for automated monitoring.
@@ -62,20 +525,33 @@ class ProcessWatchdog:
     def __init__(
         self,
         database: Optional[Database] = None,
-        check_interval: float = 30.0
+        check_interval: float = 30.0,
+        event_driven: bool = True
     ):
         """
         Initialize watchdog.
         
         Args:
             database: Optional database for rule persistence
-            check_interval: Seconds between checks
+            check_interval: Seconds between checks (between threshold
+                checks when event-driven)
+            event_driven: On Linux, track process starts and exits as
+                they happen instead of polling
         """
         self.database = database
         self.check_interval = check_interval
+        self.event_driven = event_driven
+        self.event_mode: Optional[str] = None  # netlink or polling, while running
         
-        self.manager = ProcessManager()
+        # Rules match on name and resources only; skip username lookups
+        self.manager = ProcessManager(resolve_usernames=False)
         self.rules: Dict[str, WatchdogRule] = {}
+        self._index = RuleIndex()
+        
+        # Rule ID -> matching PIDs and back, kept current by events
+        self._members: Dict[str, Set[int]] = {}
+        self._pid_rules: Dict[int, Set[str]] = {}
+        self._stale = True
         
         self._running = False
         self._thread: Optional[threading.Thread] = None
@@ -83,6 +559,14 @@ class ProcessWatchdog:
         self._alerts: List[WatchdogAlert] = []
         self._max_alerts = 1000
         
+        # Alert state, and what the next flush() writes
+        self._tracker = AlertTracker()
+        
+        # Rule ID -> PID -> recent samples, for rules with windowed conditions
+        self._rings: Dict[str, Dict[int, SampleRing]] = {}
+        self._pending_alerts: List[WatchdogAlert] = []
+        self._dirty_rules: Set[str] = set()
+        
         # Load rules from database
         self._load_rules()
     
@@ -91,20 +575,21 @@ class ProcessWatchdog:
         if not self.database:
             return
         
-        rules = self.database.get_watchdog_rules()
-        for rule_data in rules:
+        for rule_data in self.database.get_watchdog_rules(enabled_only=False):
+            conditions = rule_data.get('conditions') or {}
+            last_triggered = rule_data.get('last_triggered')
             rule = WatchdogRule(
-                id=rule_data['id'],
+                id=rule_data.get('rule_key') or str(rule_data['id']),
                 name=rule_data['name'],
-                pattern=rule_data['pattern'],
-                cpu_threshold=rule_data.get('cpu_threshold'),
-                memory_threshold=rule_data.get('memory_threshold'),
-                min_count=rule_data.get('min_count'),
-                max_count=rule_data.get('max_count'),
-                action=rule_data.get('action', 'alert'),
-                enabled=rule_data.get('enabled', True)
+                pattern=rule_data['process_pattern'],
+                action=rule_data.get('action') or 'alert',
+                enabled=bool(rule_data.get('enabled', True)),
+                last_triggered=datetime.fromisoformat(last_triggered) if last_triggered else None,
+                trigger_count=rule_data.get('trigger_count') or 0,
+                **{key: conditions[key] for key in RULE_CONDITIONS if key in conditions}
             )
             self.rules[rule.id] = rule
+            self._index.add(rule.id, rule.pattern)
     
     def _save_rule(self, rule: WatchdogRule):
         """Save rule to database."""
@@ -113,12 +598,11 @@ class ProcessWatchdog:
                 rule_id=rule.id,
                 name=rule.name,
                 pattern=rule.pattern,
-                cpu_threshold=rule.cpu_threshold,
-                memory_threshold=rule.memory_threshold,
-                min_count=rule.min_count,
-                max_count=rule.max_count,
+                conditions={key: getattr(rule, key) for key in RULE_CONDITIONS},
                 action=rule.action,
-                enabled=rule.enabled
+                enabled=rule.enabled,
+                last_triggered=rule.last_triggered,
+                trigger_count=rule.trigger_count
             )
     
     def add_rule(self, rule: WatchdogRule):
@@ -129,6 +613,9 @@ class ProcessWatchdog:
             rule: Rule to add
         """
         self.rules[rule.id] = rule
+        self._index.add(rule.id, rule.pattern)
+        self._rings.pop(rule.id, None)
+        self._stale = True
         self._save_rule(rule)
     
     def remove_rule(self, rule_id: str) -> bool:
@@ -143,6 +630,10 @@ class ProcessWatchdog:
         """
         if rule_id in self.rules:
             del self.rules[rule_id]
+            self._index.remove(rule_id)
+            self._tracker.forget_rule(rule_id)
+            self._rings.pop(rule_id, None)
+            self._stale = True
             if self.database:
                 self.database.delete_watchdog_rule(rule_id)
             return True
@@ -152,12 +643,15 @@ class ProcessWatchdog:
         """Enable a rule."""
         if rule_id in self.rules:
             self.rules[rule_id].enabled = True
+            self._stale = True
             self._save_rule(self.rules[rule_id])
     
     def disable_rule(self, rule_id: str):
         """Disable a rule."""
         if rule_id in self.rules:
             self.rules[rule_id].enabled = False
+            self._tracker.forget_rule(rule_id)
+            self._rings.pop(rule_id, None)
             self._save_rule(self.rules[rule_id])
     
     def list_rules(self) -> List[WatchdogRule]:
@@ -180,120 +674,377 @@ class ProcessWatchdog:
             except:
                 pass
         
-        # Save to database
         if self.database:
-            self.database.save_alert(
-                alert_type='watchdog',
-                severity=alert.severity,
-                message=alert.message,
-                source=alert.rule_name,
-                details={
+            self._pending_alerts.append(alert)
+    
+    def flush(self) -> None:
+        """
+        Persist queued alert transitions and rule statistics.
+        
+        Everything queued since the last flush is written in one
+        transaction. The check methods flush at the end of each cycle.
+        """
+        alerts, self._pending_alerts = self._pending_alerts, []
+        dirty, self._dirty_rules = self._dirty_rules, set()
+        if not self.database or not (alerts or dirty):
+            return
+        
+        with self.database.transaction():
+            self.database.store_alerts([
+                (alert.severity, 'watchdog', alert.message, {
                     'rule_id': alert.rule_id,
+                    'rule_name': alert.rule_name,
                     'condition': alert.condition,
+                    'state': alert.state,
                     'process_pid': alert.process.pid if alert.process else None,
                     'process_name': alert.process.name if alert.process else None,
-                }
-            )
+                })
+                for alert in alerts
+            ])
+            for rule_id in dirty:
+                if rule_id in self.rules:
+                    self._save_rule(self.rules[rule_id])
     
-    def _match_pattern(self, name: str, pattern: str) -> bool:
-        """Check if process name matches pattern."""
-        return fnmatch.fnmatch(name.lower(), pattern.lower())
+    @staticmethod
+    def _count_breach(rule: WatchdogRule, count: int) -> Optional[str]:
+        """Get the count condition a number of instances breaks, if any."""
+        if rule.min_count is not None and count < rule.min_count:
+            return 'min_count'
+        if rule.max_count is not None and count > rule.max_count:
+            return 'max_count'
+        return None
     
-    def _check_rule(self, rule: WatchdogRule, processes: List[ProcessInfo]) -> List[WatchdogAlert]:
-        """Check a single rule against processes."""
-        alerts = []
-        
-        # Find matching processes
-        matching = [p for p in processes if self._match_pattern(p.name, rule.pattern)]
+    def _check_counts(
+        self,
+        rule: WatchdogRule,
+        count: int,
+        process: Optional[ProcessInfo] = None
+    ) -> List[WatchdogAlert]:
+        """Check a rule's instance count limits."""
+        breach = self._count_breach(rule, count)
         
-        # Check count constraints
-        if rule.min_count is not None and len(matching) < rule.min_count:
-            alerts.append(WatchdogAlert(
+        if breach == 'min_count':
+            return [WatchdogAlert(
                 rule_id=rule.id,
                 rule_name=rule.name,
                 process=None,
                 condition='min_count',
-                message=f"Process '{rule.pattern}' count ({len(matching)}) below minimum ({rule.min_count})",
+                message=f"Process '{rule.pattern}' count ({count}) below minimum ({rule.min_count})",
                 severity='warning'
-            ))
+            )]
         
-        if rule.max_count is not None and len(matching) > rule.max_count:
-            alerts.append(WatchdogAlert(
+        if breach == 'max_count':
+            return [WatchdogAlert(
                 rule_id=rule.id,
                 rule_name=rule.name,
-                process=matching[0] if matching else None,
+                process=process,
                 condition='max_count',
-                message=f"Process '{rule.pattern}' count ({len(matching)}) exceeds maximum ({rule.max_count})",
+                message=f"Process '{rule.pattern}' count ({count}) exceeds maximum ({rule.max_count})",
                 severity='warning'
-            ))
+            )]
+        
+        return []
+    
+    def _threshold_alert(
+        self,
+        rule: WatchdogRule,
+        proc: ProcessInfo,
+        condition: str,
+        value: float
+    ) -> WatchdogAlert:
+        """Build the alert for a process over one of a rule's thresholds."""
+        threshold = getattr(rule, condition)
+        over = f" over {rule.window:g}s" if rule.window else ''
+        
+        if condition == 'cpu_threshold':
+            message = f"Process '{proc.name}' (PID {proc.pid}) CPU ({value:.1f}%{over}) exceeds threshold ({threshold}%)"
+        elif condition == 'memory_threshold':
+            message = f"Process '{proc.name}' (PID {proc.pid}) memory ({value / MB:.1f} MB{over}) exceeds threshold ({threshold / MB:.1f} MB)"
+        else:
+            window = rule.window or DEFAULT_GROWTH_WINDOW
+            message = f"Process '{proc.name}' (PID {proc.pid}) memory growing {value / MB:.1f} MB/min over {window:g}s, above {threshold / MB:.1f} MB/min"
+        
+        return WatchdogAlert(
+            rule_id=rule.id,
+            rule_name=rule.name,
+            process=proc,
+            condition=condition,
+            message=message,
+            severity='critical' if value > threshold * 1.5 else 'warning'
+        )
+    
+    def _evaluate_counts(
+        self,
+        rule: WatchdogRule,
+        count: int,
+        process: Optional[ProcessInfo] = None
+    ) -> List[WatchdogAlert]:
+        """Run a rule's count limits through the alert state machine."""
+        breaches = {alert.condition: alert for alert in self._check_counts(rule, count, process)}
+        transitions = []
+        for condition in COUNT_CONDITIONS:
+            if getattr(rule, condition) is not None:
+                alert = self._tracker.observe(rule, (rule.id, None, condition), breaches.get(condition))
+                if alert:
+                    transitions.append(alert)
+        return transitions
+    
+    @staticmethod
+    def _has_thresholds(rule: WatchdogRule) -> bool:
+        """Whether a rule has any per-process threshold."""
+        return any(getattr(rule, condition) for condition in THRESHOLD_CONDITIONS)
+    
+    def _sample_ring(self, rule: WatchdogRule, proc: ProcessInfo, now: float) -> Optional[SampleRing]:
+        """Add a sample to the process's ring for a windowed rule."""
+        if not rule.window and not rule.memory_growth_threshold:
+            return None
+        
+        rings = self._rings.setdefault(rule.id, {})
+        ring = rings.get(proc.pid)
+        if ring is None or ring.create_time != proc.create_time:
+            window = rule.window or DEFAULT_GROWTH_WINDOW
+            slots = min(MAX_RING_SLOTS, math.ceil(window / max(self.check_interval, 0.001)) + 2)
+            ring = rings[proc.pid] = SampleRing(window, slots, proc.create_time)
+        
+        ring.append(now, proc.cpu_percent, proc.memory_rss)
+        return ring
+    
+    def _threshold_readings(
+        self,
+        rule: WatchdogRule,
+        proc: ProcessInfo,
+        ring: Optional[SampleRing]
+    ) -> List[Tuple[str, Optional[float]]]:
+        """
+        Get (condition, value) for each of a rule's thresholds.
+        
+        The value is None while a windowed condition has too little
+        history to be judged.
+        """
+        averaged = ring is not None and rule.window
+        covered = ring is not None and ring.covers_window()
+        
+        readings = []
+        if rule.cpu_threshold:
+            if averaged:
+                readings.append(('cpu_threshold', ring.mean_cpu() if covered else None))
+            else:
+                readings.append(('cpu_threshold', proc.cpu_percent))
+        if rule.memory_threshold:
+            if averaged:
+                readings.append(('memory_threshold', ring.mean_rss() if covered else None))
+            else:
+                readings.append(('memory_threshold', proc.memory_rss))
+        if rule.memory_growth_threshold:
+            readings.append(('memory_growth_threshold', ring.rss_growth() * 60 if covered else None))
+        return readings
+    
+    def _evaluate_thresholds(self, rule: WatchdogRule, matching: List[ProcessInfo]) -> List[WatchdogAlert]:
+        """Run a rule's thresholds for each matching process through the state machine."""
+        transitions = []
+        seen: Set[AlertKey] = set()
+        now = time.monotonic()
         
-        # Check resource thresholds for each matching process
         for proc in matching:
-            # CPU threshold
-            if rule.cpu_threshold and proc.cpu_percent > rule.cpu_threshold:
-                alerts.append(WatchdogAlert(
-                    rule_id=rule.id,
-                    rule_name=rule.name,
-                    process=proc,
-                    condition='cpu_threshold',
-                    message=f"Process '{proc.name}' (PID {proc.pid}) CPU ({proc.cpu_percent:.1f}%) exceeds threshold ({rule.cpu_threshold}%)",
-                    severity='critical' if proc.cpu_percent > rule.cpu_threshold * 1.5 else 'warning'
-                ))
-            
-            # Memory threshold
-            if rule.memory_threshold and proc.memory_rss > rule.memory_threshold:
-                mem_mb = proc.memory_rss / (1024 * 1024)
-                thresh_mb = rule.memory_threshold / (1024 * 1024)
-                alerts.append(WatchdogAlert(
-                    rule_id=rule.id,
-                    rule_name=rule.name,
-                    process=proc,
-                    condition='memory_threshold',
-                    message=f"Process '{proc.name}' (PID {proc.pid}) memory ({mem_mb:.1f} MB) exceeds threshold ({thresh_mb:.1f} MB)",
-                    severity='critical' if proc.memory_rss > rule.memory_threshold * 1.5 else 'warning'
-                ))
+            ring = self._sample_ring(rule, proc, now)
+            for condition, value in self._threshold_readings(rule, proc, ring):
+                key = (rule.id, proc.pid, condition)
+                seen.add(key)
+                if value is None:
+                    continue
+                
+                threshold = getattr(rule, condition)
+                breach = self._threshold_alert(rule, proc, condition, value) if value > threshold else None
+                alert = self._tracker.observe(rule, key, breach, value < threshold * rule.clear_ratio)
+                if alert:
+                    transitions.append(alert)
         
-        return alerts
+        # Processes that exited or stopped matching lose their history
+        rings = self._rings.get(rule.id)
+        if rings and len(rings) > len(matching):
+            current = {proc.pid for proc in matching}
+            for pid in [pid for pid in rings if pid not in current]:
+                del rings[pid]
+        
+        transitions.extend(self._tracker.sweep(rule.id, seen, THRESHOLD_CONDITIONS))
+        return transitions
     
     def _take_action(self, alert: WatchdogAlert, rule: WatchdogRule):
-        """Take action for an alert based on rule configuration."""
+        """Take action for a firing alert based on rule configuration."""
         if rule.action == 'kill' and alert.process:
-            try:
-                self.manager.kill_process(alert.process.pid, force=False)
-            except:
-                pass
+            # Re-read the PID so an exited process (or a reused PID) is left alone
+            current = self.manager.get_process(alert.process.pid)
+            if current and current.create_time == alert.process.create_time:
+                try:
+                    self.manager.kill_process(alert.process.pid, force=False)
+                except:
+                    pass
         
-        # Update rule stats
+        # Update rule stats; saved on the next flush
         rule.last_triggered = datetime.now()
         rule.trigger_count += 1
-        self._save_rule(rule)
+        self._dirty_rules.add(rule.id)
+    
+    def _raise_alerts(self, alerts: List[WatchdogAlert]) -> List[WatchdogAlert]:
+        """Emit alert transitions, taking the rule's action on firing ones."""
+        for alert in alerts:
+            self._emit_alert(alert)
+            rule = self.rules.get(alert.rule_id)
+            if alert.state == 'firing' and rule is not None:
+                self._take_action(alert, rule)
+        return alerts
     
     def check_now(self) -> List[WatchdogAlert]:
         """
         Run a single check cycle.
         
+        Also rebuilds the PID sets that events keep current.
+        
         Returns:
-            List of alerts generated
+            List of alert transitions (firing and resolved)
         """
         processes = self.manager.list_processes()
-        all_alerts = []
+        matches = self._index.classify(processes)
+        
+        self._members = {rule_id: {p.pid for p in procs} for rule_id, procs in matches.items()}
+        self._pid_rules = {}
+        for rule_id, pids in self._members.items():
+            for pid in pids:
+                self._pid_rules.setdefault(pid, set()).add(rule_id)
+        self._stale = False
         
-        for rule in self.rules.values():
+        all_alerts = []
+        for rule in list(self.rules.values()):
             if not rule.enabled:
                 continue
             
-            alerts = self._check_rule(rule, processes)
-            
-            for alert in alerts:
-                self._emit_alert(alert)
-                self._take_action(alert, rule)
-            
-            all_alerts.extend(alerts)
+            matching = matches.get(rule.id, [])
+            alerts = self._evaluate_counts(rule, len(matching), matching[0] if matching else None)
+            alerts.extend(self._evaluate_thresholds(rule, matching))
+            all_alerts.extend(self._raise_alerts(alerts))
+        
+        self.flush()
+        return all_alerts
+    
+    def check_thresholds(self) -> List[WatchdogAlert]:
+        """
+        Re-check CPU and memory thresholds without a full scan.
+        
+        Only the PIDs currently matched by enabled threshold rules are
+        read (see check_now, which sets up the matches). Count limits
+        are re-evaluated from the tracked PID sets, so breach_count
+        also counts these cycles.
         
+        Returns:
+            List of alert transitions (firing and resolved)
+        """
+        rules = [rule for rule in list(self.rules.values()) if rule.enabled]
+        pids: Set[int] = set()
+        for rule in rules:
+            if self._has_thresholds(rule):
+                pids.update(self._members.get(rule.id, ()))
+        
+        found = self.manager.get_processes(list(pids)) if pids else {}
+        
+        all_alerts = []
+        for rule in rules:
+            members = self._members.get(rule.id, ())
+            alerts = self._evaluate_counts(rule, len(members))
+            if self._has_thresholds(rule):
+                alerts.extend(self._evaluate_thresholds(rule, [found[pid] for pid in members if pid in found]))
+            all_alerts.extend(self._raise_alerts(alerts))
+        
+        self.flush()
         return all_alerts
     
-    def _watchdog_loop(self):
+    def _move_process(
+        self,
+        pid: int,
+        rule_ids: Set[str],
+        process: Optional[ProcessInfo] = None
+    ) -> List[WatchdogAlert]:
+        """Record the rules a PID now matches (none once it has exited)."""
+        previous = self._pid_rules.pop(pid, set())
+        if rule_ids:
+            self._pid_rules[pid] = rule_ids
+        
+        alerts = []
+        for rule_id in previous ^ rule_ids:
+            members = self._members.setdefault(rule_id, set())
+            if rule_id in rule_ids:
+                members.add(pid)
+            else:
+                members.discard(pid)
+            
+            rule = self.rules.get(rule_id)
+            if rule is not None and rule.enabled:
+                alerts.extend(self._evaluate_counts(rule, len(members), process))
+        
+        return self._raise_alerts(alerts)
+    
+    def handle_event(self, event: ProcEvent) -> List[WatchdogAlert]:
+        """
+        Apply a process event to the rule matches and check count limits.
+        
+        Alerts are queued for the database until the next flush().
+        
+        Args:
+            event: Event from a ProcessEventSource
+        
+        Returns:
+            List of alert transitions (firing and resolved)
+        """
+        if event.kind == 'lost':
+            # Events were dropped; the loop rescans
+            self._stale = True
+            return []
+        
+        if event.kind == 'exit':
+            for rings in self._rings.values():
+                rings.pop(event.pid, None)
+            self.manager.cpu_sampler.forget(event.pid)
+            return self._raise_alerts(self._tracker.forget_pid(event.pid)) + self._move_process(event.pid, set())
+        
+        if event.kind == 'start' and event.process is None:
+            # A fork keeps its parent's name, so it matches the parent's rules
+            return self._move_process(event.pid, set(self._pid_rules.get(event.ppid, ())))
+        
+        # Matching needs only the name; CPU is sampled by the threshold checks
+        proc = event.process or self.manager.identify_process(event.pid)
+        if proc is None:
+            return self._move_process(event.pid, set())
+        return self._move_process(event.pid, self._index.match(proc.name), proc)
+    
+    def _event_loop(self, source: ProcessEventSource):
+        """Event-driven loop: counts on every event, thresholds every check_interval."""
+        next_check = 0.0
+        try:
+            while self._running:
+                try:
+                    if self._stale:
+                        self.check_now()
+                        next_check = time.monotonic() + self.check_interval
+                    
+                    timeout = min(EVENT_WAIT, max(0.0, next_check - time.monotonic()))
+                    for event in source.read(timeout):
+                        self.handle_event(event)
+                    self.flush()
+                    
+                    if not self._stale and time.monotonic() >= next_check:
+                        self.check_thresholds()
+                        next_check = time.monotonic() + self.check_interval
+                except Exception:
+                    time.sleep(EVENT_WAIT)
+        finally:
+            source.close()
+            self.event_mode = None
+    
+    def _watchdog_loop(self, source: Optional[ProcessEventSource] = None):
         """Main watchdog loop."""
+        if source is not None:
+            self._event_loop(source)
+            return
+        
         while self._running:
             try:
                 self.check_now()
@@ -302,13 +1053,40 @@ class ProcessWatchdog:
             
             time.sleep(self.check_interval)
     
-    def start(self):
-        """Start the watchdog background thread."""
+    @property
+    def is_running(self) -> bool:
+        """Whether the background thread is running."""
+        return self._running
+    
+    def start(
+        self,
+        interval: Optional[float] = None,
+        callback: Optional[Callable[[WatchdogAlert], None]] = None
+    ):
+        """
+        Start the watchdog background thread.
+        
+        Args:
+            interval: Override check_interval
+            callback: Alert callback to register (see on_alert)
+        """
         if self._running:
             return
         
+        if interval is not None:
+            self.check_interval = interval
+        if callback is not None:
+            self.on_alert(callback)
+        
+        # Subscribe before the first scan so no start or exit falls in between
+        source = None
+        if self.event_driven and is_linux():
+            source = ProcessEventSource(poll_interval=min(self.check_interval, DEFAULT_POLL_INTERVAL))
+            self.event_mode = source.open()
+        
+        self._stale = True
         self._running = True
-        self._thread = threading.Thread(target=self._watchdog_loop, daemon=True)
+        self._thread = threading.Thread(target=self._watchdog_loop, args=(source,), daemon=True)
         self._thread.start()
     
     def stop(self):
@@ -317,6 +1095,7 @@ class ProcessWatchdog:
         if self._thread:
             self._thread.join(timeout=self.check_interval + 1)
             self._thread = None
+        self.flush()
     
     def get_alerts(
         self,
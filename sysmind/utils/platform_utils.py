@@ -6,11 +6,15 @@ Provides unified interface for platform-dependent operations.
 """
 
 import os
+import time
 import platform
 import subprocess
 import ctypes
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Any, Tuple
 from abc import ABC, abstractmethod
 
 
@@ -45,6 +49,153 @@ def is_admin() -> bool:
         return os.geteuid() == 0
 
 
+@dataclass(frozen=True)
+class HostConstants:
+    """Host values that stay fixed for the lifetime of the process."""
+    boot_time: float  # epoch seconds
+    clock_ticks: int  # /proc time units per second (USER_HZ)
+    page_size: int  # bytes
+    total_memory: int  # bytes
+    cpu_count: int
+
+
+_host_constants: Optional[HostConstants] = None
+
+
+def _sysconf(name: str, default: int) -> int:
+    """os.sysconf() with a fallback for platforms without it."""
+    try:
+        value = os.sysconf(name)
+        return value if value > 0 else default
+    except (AttributeError, ValueError, OSError):
+        return default
+
+
+def _read_boot_time() -> float:
+    """Boot time from /proc/stat, or uptime-based estimate elsewhere."""
+    try:
+        with open('/proc/stat', 'rb') as f:
+            for line in f:
+                if line.startswith(b'btime'):
+                    return float(line.split()[1])
+    except OSError:
+        pass
+    
+    try:
+        return time.time() - time.clock_gettime(time.CLOCK_BOOTTIME)
+    except (AttributeError, OSError):
+        return 0.0
+
+
+def _read_total_memory(page_size: int) -> int:
+    """Total physical memory in bytes."""
+    try:
+        with open('/proc/meminfo', 'rb') as f:
+            for line in f:
+                if line.startswith(b'MemTotal:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    
+    return _sysconf('SC_PHYS_PAGES', 0) * page_size
+
+
+def get_host_constants() -> HostConstants:
+    """
+    Get boot time, clock ticks, page size, total memory and core count.
+    
+    Computed on first call and cached for the lifetime of the process,
+    so per-process loops never re-read /proc/stat or call sysconf.
+    """
+    global _host_constants
+    if _host_constants is None:
+        page_size = _sysconf('SC_PAGE_SIZE', 4096)
+        _host_constants = HostConstants(
+            boot_time=_read_boot_time(),
+            clock_ticks=_sysconf('SC_CLK_TCK', 100),
+            page_size=page_size,
+            total_memory=_read_total_memory(page_size),
+            cpu_count=os.cpu_count() or 1,
+        )
+    return _host_constants
+
+
+class UsernameCache:
+    """
+    Bounded UID to username cache.
+    
+    pwd lookups can go through NSS to LDAP or SSSD, so each one may be
+    a network round trip. Names are kept for ttl seconds. UIDs without
+    a passwd entry are cached as the numeric string for negative_ttl
+    seconds. The least recently used entries are dropped beyond
+    max_size.
+    """
+    
+    def __init__(self, ttl: float = 300.0, negative_ttl: float = 60.0, max_size: int = 1024):
+        """
+        Initialize username cache.
+        
+        Args:
+            ttl: Seconds a resolved name stays valid
+            negative_ttl: Seconds a failed lookup stays cached
+            max_size: Maximum number of UIDs kept
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        self._entries: 'OrderedDict[int, Tuple[str, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _lookup(self, uid: int) -> Tuple[str, float]:
+        """Resolve uid through pwd; returns (name, seconds to keep it)."""
+        try:
+            import pwd
+            return pwd.getpwuid(uid).pw_name, self.ttl
+        except (ImportError, KeyError, OverflowError):
+            return str(uid), self.negative_ttl
+    
+    def get(self, uid: int) -> str:
+        """
+        Get the username for a UID.
+        
+        Args:
+            uid: User ID
+        
+        Returns:
+            Username, or the UID as a string if it has no passwd entry
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(uid)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(uid)
+                return entry[0]
+        
+        # Resolve outside the lock; a slow NSS lookup must not block hits
+        name, keep = self._lookup(uid)
+        
+        with self._lock:
+            self._entries[uid] = (name, now + keep)
+            self._entries.move_to_end(uid)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        
+        return name
+    
+    def clear(self) -> None:
+        """Drop all cached names."""
+        with self._lock:
+            self._entries.clear()
+
+
+_username_cache = UsernameCache()
+
+
+def get_username(uid: int) -> str:
+    """Get the username for a UID from the process-wide cache."""
+    return _username_cache.get(uid)
+
+
 class PlatformAdapter(ABC):
     """Abstract base class for platform-specific operations."""
     
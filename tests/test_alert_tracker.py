@@ -0,0 +1,66 @@
+"""
+SYSMIND AlertTracker Tests
+
+Checks watchdog alert hysteresis and per-process cooldowns.
+"""
+
+import unittest
+
+from sysmind.modules.process.watchdog import AlertTracker, WatchdogAlert, WatchdogRule
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+def breach(rule, pid):
+    return WatchdogAlert(
+        rule_id=rule.id,
+        rule_name=rule.name,
+        process=None,
+        condition='cpu_threshold',
+        message=f"PID {pid} over threshold",
+        severity='warning'
+    )
+
+
+class AlertTrackerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.tracker = AlertTracker(clock=self.clock)
+        self.rule = WatchdogRule(id='hot', name='hot', pattern='worker*',
+                                 cpu_threshold=50.0, cooldown=60.0)
+    
+    def observe(self, pid, breaching=True):
+        key = (self.rule.id, pid, 'cpu_threshold')
+        return self.tracker.observe(self.rule, key, breach(self.rule, pid) if breaching else None)
+    
+    def test_cooldown_is_per_process(self):
+        self.assertIsNotNone(self.observe(101))
+        self.clock.now += 5
+        self.assertIsNotNone(self.observe(102))
+        self.assertEqual(len(self.tracker.firing()), 2)
+    
+    def test_cooldown_holds_refiring_of_same_process(self):
+        self.assertIsNotNone(self.observe(101))
+        self.assertEqual(self.observe(101, breaching=False).state, 'resolved')
+        
+        self.clock.now += 5
+        self.assertIsNone(self.observe(101))
+        self.clock.now += 60
+        self.assertIsNotNone(self.observe(101))
+    
+    def test_forget_pid_clears_cooldown(self):
+        self.assertIsNotNone(self.observe(101))
+        self.assertEqual(len(self.tracker.forget_pid(101)), 1)
+        self.assertIsNotNone(self.observe(101))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+SYSMIND RuleIndex Tests
+
+Checks the compiled watchdog rule matcher against fnmatch.
+"""
+
+import fnmatch
+import unittest
+
+from sysmind.modules.process.watchdog import RuleIndex
+
+
+PATTERNS = {
+    'exact': 'nginx',
+    'prefix': 'python*',
+    'multi_star': '*foo*bar*',
+    'multi_star_2': '*q*b*',
+    'wildcard': 'py?hon*',
+    'literal_group': 'x[(]?P<g0>*',
+}
+
+NAMES = ['nginx', 'python3', 'zfooqbarz', 'foobar', 'qqbb', 'x(?P<g0>y', 'NGINX', 'other']
+
+
+class RuleIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = RuleIndex()
+        for rule_id, pattern in PATTERNS.items():
+            self.index.add(rule_id, pattern)
+    
+    def expected(self, name):
+        return {rule_id for rule_id, pattern in PATTERNS.items()
+                if fnmatch.fnmatchcase(name.lower(), pattern.lower())}
+    
+    def test_matches_fnmatch(self):
+        for name in NAMES:
+            self.assertEqual(self.index.match(name), self.expected(name), name)
+    
+    def test_multi_star_pattern(self):
+        self.assertEqual(self.index.match('zfooqbarz'), {'multi_star', 'multi_star_2'})
+    
+    def test_remove_recompiles(self):
+        self.index.remove('multi_star')
+        self.assertEqual(self.index.match('zfooqbarz'), {'multi_star_2'})
+        self.assertEqual(len(self.index), len(PATTERNS) - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+SYSMIND Startup Budget Tests
+
+Times a real command dispatch in a fresh interpreter and checks it
+against the budget used by benchmarks/startup_time.py.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Same budget as benchmarks/startup_time.py (median, milliseconds)
+BUDGET_MS = 150.0
+RUNS = 5
+
+# Cheap command that still goes through parsing and dispatch
+COMMAND = ['config', 'show']
+
+# Modules that load on dispatch only (as in benchmarks/startup_time.py)
+LAZY_PREFIXES = ('sysmind.modules.', 'sysmind.commands.monitor_commands',
+                 'sysmind.commands.disk_commands', 'sysmind.commands.process_commands',
+                 'sysmind.commands.network_commands', 'sysmind.commands.intel_commands',
+                 'sysmind.commands.config_commands')
+
+# Imports sysmind.cli and runs the command; reports elapsed time and loaded modules
+DISPATCH_CODE = """
+import contextlib, io, json, sys, time
+start = time.perf_counter()
+from sysmind import cli
+with contextlib.redirect_stdout(io.StringIO()):
+    code = cli.main({argv!r})
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{'code': code, 'ms': elapsed,
+                  'modules': [m for m in sys.modules if m.startswith('sysmind')]}}))
+"""
+
+
+def dispatch(argv, home):
+    """Run one command in a fresh interpreter and return its report."""
+    env = dict(os.environ, HOME=home, SYSMIND_NO_DAEMON='1')
+    result = subprocess.run(
+        [sys.executable, '-c', DISPATCH_CODE.format(argv=argv)],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class StartupTimeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.home = tempfile.TemporaryDirectory()
+        # First run creates the config and data directories
+        dispatch(COMMAND, self.home.name)
+    
+    def tearDown(self):
+        self.home.cleanup()
+    
+    def test_dispatch_within_budget(self):
+        reports = [dispatch(COMMAND, self.home.name) for _ in range(RUNS)]
+        self.assertTrue(all(report['code'] == 0 for report in reports))
+        
+        samples = sorted(report['ms'] for report in reports)
+        median_ms = samples[len(samples) // 2]
+        self.assertLessEqual(
+            median_ms, BUDGET_MS,
+            f"'sysmind {' '.join(COMMAND)}' took {median_ms:.1f} ms (budget {BUDGET_MS:.0f} ms)"
+        )
+    
+    def test_dispatch_loads_only_its_command(self):
+        modules = dispatch(COMMAND, self.home.name)['modules']
+        lazy = {m for m in modules if m.startswith(LAZY_PREFIXES)}
+        self.assertEqual(lazy, {'sysmind.commands.config_commands'})
+
+
+if __name__ == '__main__':
+    unittest.main()